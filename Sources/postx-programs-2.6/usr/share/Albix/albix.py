@@ -25,85 +25,114 @@ Author: JJ Posti <techtimejourney.net>
 
 import sys
 import os
-import json
-import random
+import re
 from os.path import basename, splitext
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtCore import (
-    Qt, QUrl, QTimer, QEasingCurve, pyqtProperty, QPropertyAnimation
+    Qt, QUrl, QTimer, pyqtProperty, QSettings, QStringListModel
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QFileDialog, QSlider, QAbstractItemView, QMessageBox, QLabel,
+    QListWidget, QListView, QFileDialog, QSlider, QAbstractItemView, QMessageBox, QLabel,
     QTabWidget, QLineEdit, QStatusBar, QMenuBar
 )
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtMultimediaWidgets import QVideoWidget
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist
+from PyQt5.QtNetwork import QNetworkRequest
+
+
+# Simple light theme (no toggle), applied once to the whole application
+_QSS = """
+    QMainWindow {
+        color: #333333; 
+        background-color: #f5f5f5; 
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        font-size: 12px;
+    }
+    QPushButton {
+        color: #333333; 
+        background-color: #ffffff; 
+        border: 2px solid #cccccc; 
+        border-radius: 8px;
+        padding: 10px;
+        min-width: 80px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        color: #ffffff; 
+        background-color: #4CAF50; 
+        border: 2px solid #4CAF50;
+    }
+    QListView {
+        color: #333333; 
+        background-color: #ffffff; 
+        border: 2px solid #cccccc; 
+        border-radius: 8px;
+        selection-background-color: #4CAF50;
+        selection-color: #ffffff;
+    }
+    QListView::item {
+        padding: 10px;
+        font-size: 12px;
+    }
+    QListView::item:selected {
+        background-color: #4CAF50;
+        color: #ffffff;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #cccccc;
+        height: 8px;
+        background: #e0e0e0;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #4CAF50;
+        border: 1px solid #4CAF50;
+        width: 14px;
+        margin: -3px 0;
+        border-radius: 7px;
+    }
+    QLabel {
+        color: #333333;
+        font-size: 10px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #4CAF50;
+        border: 1px solid #4CAF50;
+        border-radius: 4px;
+    }
+    QSlider::add-page:horizontal {
+        background: #e0e0e0;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+    }
+    QMenuBar {
+        background-color: #ffffff;
+    }
+    QMenuBar::item:selected {
+        background-color: #4CAF50;
+        color: #ffffff;
+    }
+    QTabBar::tab {
+        background: #ffffff;
+        border: 1px solid #cccccc;
+        padding: 10px;
+        min-width: 100px;
+    }
+    QTabBar::tab:selected {
+        background: #4CAF50;
+        color: #ffffff;
+    }
+"""
 
 
 class AnimatedButton(QPushButton):
     """
-    A QPushButton subclass that handles animated hover effects.
-    Provides a default and hover style, as well as opacity animations.
+    A QPushButton subclass for the player's control buttons.
+    The default and hover looks come from the application stylesheet's
+    QPushButton / QPushButton:hover rules. (The former windowOpacity hover
+    animation was dropped: opacity only applies to top-level windows.)
     """
-    def __init__(self, *args, **kwargs):
-        super(AnimatedButton, self).__init__(*args, **kwargs)
-
-        self.default_style = """
-            QPushButton {
-                color: #333333; 
-                background-color: #ffffff; 
-                border: 2px solid #cccccc; 
-                border-radius: 8px;
-                padding: 10px;
-                min-width: 80px;
-                font-weight: bold;
-            }
-        """
-
-        self.hover_style = """
-            QPushButton {
-                color: #ffffff; 
-                background-color: #4CAF50; 
-                border: 2px solid #4CAF50; 
-                border-radius: 8px;
-                padding: 10px;
-                min-width: 80px;
-                font-weight: bold;
-            }
-        """
-
-        self.setStyleSheet(self.default_style)
-
-        # Initialize the opacity animation
-        self.animation = QPropertyAnimation(self, b"windowOpacity")
-        self.animation.setDuration(200)
-        self.animation.setEasingCurve(QEasingCurve.InOutQuad)
-
-    def enterEvent(self, event: QtCore.QEvent) -> None:
-        """
-        Triggered when the mouse enters the button area.
-        Changes style and starts opacity animation.
-        """
-        self.setStyleSheet(self.hover_style)
-        self.animation.stop()
-        self.animation.setStartValue(1.0)
-        self.animation.setEndValue(0.95)
-        self.animation.start()
-        super(AnimatedButton, self).enterEvent(event)
-
-    def leaveEvent(self, event: QtCore.QEvent) -> None:
-        """
-        Triggered when the mouse leaves the button area.
-        Resets style and stops opacity animation.
-        """
-        self.setStyleSheet(self.default_style)
-        self.animation.stop()
-        self.animation.setStartValue(0.95)
-        self.animation.setEndValue(1.0)
-        self.animation.start()
-        super(AnimatedButton, self).leaveEvent(event)
 
 
 class MainWindow(QMainWindow):
@@ -121,6 +150,24 @@ class MainWindow(QMainWindow):
 
     SUPPORTED_VIDEO_EXTENSIONS = {".mp4", ".avi", ".mkv", ".mov", ".wmv"}
     SUPPORTED_AUDIO_EXTENSIONS = {".mp3", ".ogg", ".flac", ".wav"}
+    # One compiled pattern classifies a path by suffix: group 1 = audio, group 2 = video
+    EXT_RE = re.compile(
+        r"\.(" + "|".join(ext[1:] for ext in sorted(SUPPORTED_AUDIO_EXTENSIONS)) + r")$"
+        r"|\.(" + "|".join(ext[1:] for ext in sorted(SUPPORTED_VIDEO_EXTENSIONS)) + r")$",
+        re.IGNORECASE
+    )
+    # MIME hints handed to the backend so it can skip content type detection
+    EXT_TO_MIME = {
+        ".mp3": "audio/mpeg",
+        ".ogg": "audio/ogg",
+        ".flac": "audio/flac",
+        ".wav": "audio/x-wav",
+        ".mp4": "video/mp4",
+        ".avi": "video/x-msvideo",
+        ".mkv": "video/x-matroska",
+        ".mov": "video/quicktime",
+        ".wmv": "video/x-ms-wmv",
+    }
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -133,23 +180,66 @@ class MainWindow(QMainWindow):
         # =========== QMediaPlayer Setup ===========
         self.player = QMediaPlayer()
         self.player.stateChanged.connect(self.update_play_button)
-        self.player.positionChanged.connect(self.update_slider)
         self.player.durationChanged.connect(self.set_duration)
         self.player.mediaStatusChanged.connect(self.handle_media_status)
         self.player.error.connect(self.handle_error)
 
+        # Local tracks live in a QMediaPlaylist so track changes, shuffle and
+        # repeat are handled by the backend instead of Python bookkeeping.
+        self._qplaylist = QMediaPlaylist(self.player)
+        self._qplaylist.setPlaybackMode(QMediaPlaylist.Sequential)
+        self._qplaylist.currentIndexChanged.connect(self._on_playlist_index_changed)
+        self.player.setPlaylist(self._qplaylist)
+
+        # Position UI is refreshed from a 250 ms timer while playing rather
+        # than on every positionChanged notification
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(250)
+        self._ui_timer.timeout.connect(self._tick_ui)
+        self._last_time_text = "00:00"
+
+        # Status messages are coalesced and flushed at ~15 Hz, so dragging
+        # the volume/seek sliders doesn't repaint the status bar per event
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(66)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Silent second player that opens the upcoming track ahead of time,
+        # so the switch at end-of-track hits a warm file/page cache.
+        self._prefetch_player = QMediaPlayer()
+        self._prefetch_player.setMuted(True)
+        self._prefetched_index = -1
+
+        # Persistent settings (pretty-printed playlists, ...)
+        self.settings = QSettings("Albix", "Albix Player")
+
+        # Parsed playlist files keyed by (path, st_mtime_ns, st_size), so
+        # reloading an unchanged file skips reading and parsing it again
+        self._playlist_cache = {}
+
         # Track current media type: 'audio' or 'video'
         self.current_media_type = 'audio'
 
         # =========== Playlist & Indices ===========
-        # Each item in playlist is a dict: {"path": str, "type": "audio" or "video"}
+        # Each item in playlist is a dict:
+        # {"path": str, "type": "audio" or "video", "ext": str, "name": str}
         self.playlist = []
+        self._path_to_index = {}  # path -> playlist index (fast duplicate check / lookup)
         self.current_song_index = -1
+        self._loaded_index = -1  # Playlist index currently loaded in the player (-1: none/radio)
         self.current_radio = None  # Currently playing radio station
 
         # Shuffle & repeat states
         self.shuffle_mode = False
         self.repeat_mode = False  # Repeat the *current* song
+        # Shuffle plays a pre-shuffled order of playlist indices (no repeats
+        # until every track has played); _shuffle_pos is the next one to play
+        self._shuffle_queue = []
+        self._shuffle_pos = 0
+        # Private random.Random stream for shuffling, created on first use
+        self._rng = None
 
         # =========== Radio Stations ===========
         self.radio_stations = {
@@ -162,8 +252,11 @@ class MainWindow(QMainWindow):
             "Big R Radio: Top 40 Hits (USA)": "https://bigrradio.cdnstream1.com/5104_128",
             "NRJ Hits (France)": "http://cdn.nrjaudio.fm/audio1/fr/30001/mp3_128.mp3",
         }
+        # (name, url) per radio list row, so a double-click resolves by row
+        self._radio_rows = list(self.radio_stations.items())
 
         # =========== UI Setup ===========
+        QApplication.instance().setStyleSheet(_QSS)
         self.setup_ui()
 
     # ---------------- DRAG & DROP SUPPORT --------------------
@@ -191,24 +284,24 @@ class MainWindow(QMainWindow):
         """
         Adds dropped files to the playlist if supported.
         """
+        existing = self._existing_paths(files)
+        new_items = []
         for file_path in files:
-            extension = splitext(file_path)[1].lower()
-            if extension in self.SUPPORTED_VIDEO_EXTENSIONS:
-                media_type = "video"
-            elif extension in self.SUPPORTED_AUDIO_EXTENSIONS:
-                media_type = "audio"
-            else:
+            entry = self._classify_path(file_path)
+            if entry is None:
                 continue  # Skip unsupported
 
-            if not os.path.exists(file_path):
+            if file_path not in existing:
                 continue
 
             # Avoid duplicates
-            if any(item["path"] == file_path for item in self.playlist):
+            if file_path in self._path_to_index:
                 continue
 
-            self.playlist.append({"path": file_path, "type": media_type})
-            self.playlist_widget.addItem(basename(file_path))
+            new_items.append(entry)
+            self._path_to_index[file_path] = len(self.playlist) + len(new_items) - 1
+
+        self._append_to_playlist(new_items)
 
         # Enable control buttons if playlist is not empty
         if self.playlist:
@@ -219,47 +312,65 @@ class MainWindow(QMainWindow):
             self.shuffle_button.setEnabled(True)
             self.repeat_button.setEnabled(True)
 
+    @classmethod
+    def _classify_path(cls, file_path: str):
+        """
+        Builds the playlist entry for `file_path`, parsing the path only once:
+        {"path", "type", "ext", "name"}. Returns None for unsupported files.
+        """
+        match = cls.EXT_RE.search(file_path)
+        if match is None:
+            return None
+        media_type = "audio" if match.group(1) else "video"
+        return {"path": file_path, "type": media_type,
+                "ext": match.group(0).lower(), "name": basename(file_path)}
+
+    @staticmethod
+    def _existing_paths(files):
+        """
+        Returns the subset of `files` that exist, listing each parent directory
+        once instead of stat'ing every file (slow on network mounts).
+        A single file is not checked at all; playback errors are reported
+        through `handle_error` instead.
+        """
+        if len(files) <= 1:
+            return set(files)
+
+        by_dir = {}
+        for file_path in files:
+            by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+
+        existing = set()
+        for directory, paths in by_dir.items():
+            try:
+                with os.scandir(directory or ".") as it:
+                    entries = {entry.name for entry in it}
+            except OSError:
+                continue
+            existing.update(p for p in paths if basename(p) in entries)
+        return existing
+
     # ---------------------------------------------------------
 
     def setup_ui(self):
         """
         Initialize and arrange the main UI components.
         """
-        # Apply a simple light theme (no toggle):
-        self.apply_light_theme()
-
         central_widget = QWidget(self)
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(15)
+        self.main_layout = main_layout
 
         # ---------- Video Widget ----------
-        self.video_widget = QVideoWidget()
-        self.video_widget.setMinimumSize(640, 360)
-        self.video_widget.hide()  # Hide by default (will show when playing video)
-        main_layout.addWidget(self.video_widget)
-
-        # Connect player to the video widget
-        self.player.setVideoOutput(self.video_widget)
+        # Created on first video playback (see _ensure_video_widget)
+        self.video_widget = None
 
         # ---------- Tabs: Local Files & Radio ----------
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.North)
         self.tab_widget.setTabShape(QTabWidget.Rounded)
-        # Minimal tab style
-        self.tab_widget.setStyleSheet("""
-            QTabBar::tab {
-                background: #ffffff;
-                border: 1px solid #cccccc;
-                padding: 10px;
-                min-width: 100px;
-            }
-            QTabBar::tab:selected {
-                background: #4CAF50;
-                color: #ffffff;
-            }
-        """)
 
         self.music_tab = QWidget()
         self.radio_tab = QWidget()
@@ -327,83 +438,18 @@ class MainWindow(QMainWindow):
         load_action.triggered.connect(self.load_playlist)
         file_menu.addAction(load_action)
 
+        pretty_action = QtWidgets.QAction("Pretty-print Saved Playlists", self)
+        pretty_action.setCheckable(True)
+        pretty_action.setChecked(self.settings.value("pretty_playlists", False, type=bool))
+        pretty_action.toggled.connect(
+            lambda checked: self.settings.setValue("pretty_playlists", checked)
+        )
+        file_menu.addAction(pretty_action)
+
         exit_action = QtWidgets.QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
-    def apply_light_theme(self):
-        """
-        Sets a simple light theme for the entire window (no toggle).
-        """
-        self.setStyleSheet("""
-            QMainWindow {
-                color: #333333; 
-                background-color: #f5f5f5; 
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                font-size: 12px;
-            }
-            QPushButton {
-                color: #333333; 
-                background-color: #ffffff; 
-                border: 2px solid #cccccc; 
-                border-radius: 8px;
-                padding: 10px;
-                min-width: 80px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                color: #ffffff; 
-                background-color: #4CAF50; 
-                border: 2px solid #4CAF50;
-            }
-            QListWidget {
-                color: #333333; 
-                background-color: #ffffff; 
-                border: 2px solid #cccccc; 
-                border-radius: 8px;
-                selection-background-color: #4CAF50;
-                selection-color: #ffffff;
-            }
-            QListWidget::item:selected {
-                background-color: #4CAF50;
-                color: #ffffff;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #cccccc;
-                height: 8px;
-                background: #e0e0e0;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #4CAF50;
-                border: 1px solid #4CAF50;
-                width: 14px;
-                margin: -3px 0;
-                border-radius: 7px;
-            }
-            QLabel {
-                color: #333333;
-                font-size: 10px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4CAF50;
-                border: 1px solid #4CAF50;
-                border-radius: 4px;
-            }
-            QSlider::add-page:horizontal {
-                background: #e0e0e0;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QMenuBar {
-                background-color: #ffffff;
-            }
-            QMenuBar::item:selected {
-                background-color: #4CAF50;
-                color: #ffffff;
-            }
-        """)
-
     def setup_music_tab(self):
         """
         Create the layout and controls for the 'Local Files' tab.
@@ -471,17 +517,15 @@ class MainWindow(QMainWindow):
 
         music_layout.addLayout(control_layout)
 
-        # ----------- Playlist (ListWidget) -----------
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.playlist_widget.itemDoubleClicked.connect(self.play_selected_song)
-        self.playlist_widget.setStyleSheet("""
-            QListWidget::item {
-                padding: 10px;
-                font-size: 12px;
-            }
-        """)
-        music_layout.addWidget(self.playlist_widget)
+        # ----------- Playlist (model/view) -----------
+        # Only display names live in the model; self.playlist holds the entries
+        self._playlist_model = QStringListModel()
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self._playlist_model)
+        self.playlist_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.playlist_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.playlist_view.doubleClicked.connect(self.play_selected_song)
+        music_layout.addWidget(self.playlist_view)
 
     def setup_radio_tab(self):
         """
@@ -494,16 +538,9 @@ class MainWindow(QMainWindow):
         self.radio_list_widget = QListWidget()
         self.radio_list_widget.setSelectionMode(QAbstractItemView.SingleSelection)
         self.radio_list_widget.itemDoubleClicked.connect(self.play_radio_station)
-        self.radio_list_widget.setStyleSheet("""
-            QListWidget::item {
-                padding: 10px;
-                font-size: 12px;
-            }
-        """)
 
         # Populate radio stations
-        for station in self.radio_stations.keys():
-            self.radio_list_widget.addItem(station)
+        self.radio_list_widget.addItems(list(self.radio_stations.keys()))
 
         radio_layout.addWidget(self.radio_list_widget)
 
@@ -548,7 +585,7 @@ class MainWindow(QMainWindow):
         """
         Hide UI elements when entering fullscreen.
         """
-        self.playlist_widget.hide()
+        self.playlist_view.hide()
         self.play_button.hide()
         self.stop_button.hide()
         self.add_button.hide()
@@ -563,7 +600,7 @@ class MainWindow(QMainWindow):
         """
         Show UI elements when exiting fullscreen.
         """
-        self.playlist_widget.show()
+        self.playlist_view.show()
         self.play_button.show()
         self.stop_button.show()
         self.add_button.show()
@@ -587,6 +624,7 @@ class MainWindow(QMainWindow):
 
         # Add to dictionary and list widget
         self.radio_stations[name] = url
+        self._radio_rows.append((name, url))
         self.radio_list_widget.addItem(name)
 
         # Clear text fields
@@ -613,17 +651,15 @@ class MainWindow(QMainWindow):
         if not files:
             return  # User canceled or no files selected
 
+        existing = self._existing_paths(files)
+        new_items = []
         for file_path in files:
             # Check if path already in the playlist
-            if any(item["path"] == file_path for item in self.playlist):
+            if file_path in self._path_to_index:
                 continue  # Skip duplicates
 
-            extension = splitext(file_path)[1].lower()
-            if extension in self.SUPPORTED_VIDEO_EXTENSIONS:
-                media_type = "video"
-            elif extension in self.SUPPORTED_AUDIO_EXTENSIONS:
-                media_type = "audio"
-            else:
+            entry = self._classify_path(file_path)
+            if entry is None:
                 QMessageBox.warning(
                     self, 
                     "Unsupported Format", 
@@ -631,15 +667,17 @@ class MainWindow(QMainWindow):
                 )
                 continue
 
-            if not os.path.exists(file_path):
+            if file_path not in existing:
                 QMessageBox.warning(
                     self, "File Not Found", 
-                    f"The file '{basename(file_path)}' does not exist."
+                    f"The file '{entry['name']}' does not exist."
                 )
                 continue
 
-            self.playlist.append({"path": file_path, "type": media_type})
-            self.playlist_widget.addItem(basename(file_path))
+            new_items.append(entry)
+            self._path_to_index[file_path] = len(self.playlist) + len(new_items) - 1
+
+        self._append_to_playlist(new_items)
 
         # Enable control buttons if playlist is not empty
         if self.playlist:
@@ -650,27 +688,70 @@ class MainWindow(QMainWindow):
             self.shuffle_button.setEnabled(True)
             self.repeat_button.setEnabled(True)
 
+    def _append_to_playlist(self, items):
+        """
+        Appends a batch of playlist entries in one go, so the view
+        lays out once instead of once per item.
+        """
+        if not items:
+            return
+        self.playlist.extend(items)
+        if self.shuffle_mode:
+            self._reshuffle()
+        self._qplaylist.addMedia([self._media_content(item) for item in items])
+        model = self._playlist_model
+        if len(items) == 1:
+            row = model.rowCount()
+            model.insertRow(row)
+            model.setData(model.index(row), items[0]["name"])
+        else:
+            model.setStringList(model.stringList() + [item["name"] for item in items])
+            self._select_row(self.current_song_index)
+
+    def _select_row(self, row: int):
+        """
+        Makes `row` the current (highlighted) row of the playlist view.
+        """
+        if row >= 0:
+            self.playlist_view.setCurrentIndex(self._playlist_model.index(row))
+
     def remove_songs(self):
         """
         Removes selected items from the playlist. Stops playback if
         a currently playing item is removed.
         """
-        selected_items = self.playlist_widget.selectedItems()
-        if not selected_items:
+        selected_rows = sorted(
+            {index.row() for index in self.playlist_view.selectionModel().selectedRows()},
+            reverse=True
+        )
+        if not selected_rows:
             return
 
-        for item in selected_items:
-            index = self.playlist_widget.row(item)
+        current_path = None
+        if 0 <= self.current_song_index < len(self.playlist):
+            current_path = self.playlist[self.current_song_index]["path"]
+
+        # Highest rows first, so the remaining row numbers stay valid
+        for index in selected_rows:
             # Safeguard for index range
             if 0 <= index < len(self.playlist):
-                self.playlist.pop(index)
-                self.playlist_widget.takeItem(index)
-                if index == self.current_song_index:
+                removed = self.playlist.pop(index)
+                self._qplaylist.removeMedia(index)
+                self._playlist_model.removeRows(index, 1)
+                if removed["path"] == current_path:
                     self.stop_song()
 
-        # Adjust current_song_index if necessary
-        if self.current_song_index >= len(self.playlist):
+        self._path_to_index = {item["path"]: i for i, item in enumerate(self.playlist)}
+        self._loaded_index = self._qplaylist.currentIndex() if self.player.playlist() else -1
+        self._reset_prefetch()
+
+        # Keep current_song_index on the same track if it is still listed
+        if current_path in self._path_to_index:
+            self.current_song_index = self._path_to_index[current_path]
+        elif self.current_song_index >= len(self.playlist):
             self.current_song_index = len(self.playlist) - 1
+        if self.shuffle_mode:
+            self._reshuffle()
 
         # Disable buttons if playlist is empty
         if not self.playlist:
@@ -684,8 +765,13 @@ class MainWindow(QMainWindow):
     def play_selected_song(self):
         """
         Handles the double-click event on the playlist to play the selected item.
+        Double-clicking the track that is already playing is a no-op.
         """
-        self.current_song_index = self.playlist_widget.currentRow()
+        row = self.playlist_view.currentIndex().row()
+        if (row == self.current_song_index and self.current_radio is None
+                and self.player.state() == QMediaPlayer.PlayingState):
+            return
+        self.current_song_index = row
         self.current_radio = None  # Ensure radio is not playing
         self.play_song()
 
@@ -704,7 +790,7 @@ class MainWindow(QMainWindow):
         elif state == QMediaPlayer.StoppedState:
             if self.current_song_index == -1 and self.playlist:
                 self.current_song_index = 0
-                self.playlist_widget.setCurrentRow(self.current_song_index)
+                self._select_row(self.current_song_index)
             elif self.current_radio is not None:
                 self.play_radio_station_by_name(self.current_radio)
             self.play_song()
@@ -725,40 +811,61 @@ class MainWindow(QMainWindow):
         if not os.path.exists(file_path):
             QMessageBox.warning(
                 self, "File Not Found", 
-                f"The file '{basename(file_path)}' was not found."
+                f"The file '{media_info['name']}' was not found."
             )
             return
 
         # Show video widget if video; hide if audio
         if media_type == "video":
-            self.video_widget.show()
+            self._ensure_video_widget().show()
         else:
-            self.video_widget.hide()
+            self._hide_video_widget()
 
-        url = QUrl.fromLocalFile(file_path)
-        content = QMediaContent(url)
+        self._reset_prefetch()
 
-        current_media = ""
-        if self.player.media():
-            current_media = self.player.media().canonicalUrl().toLocalFile()
+        # Streaming radio detaches the playlist; re-attach it for local files
+        if self.player.playlist() is None:
+            self.player.setPlaylist(self._qplaylist)
 
-        # Only set media if it's different from what's currently loaded
-        if current_media != file_path:
-            self.player.setMedia(content)
+        # Only switch tracks if it's different from what's currently loaded
+        if self._loaded_index != self.current_song_index:
+            self._qplaylist.setCurrentIndex(self.current_song_index)
+            self._loaded_index = self.current_song_index
 
         self.player.play()
         self.playback_slider.setEnabled(True)
         self.stop_button.setEnabled(True)
-        self.status_bar.showMessage(f"Playing: {basename(file_path)}")
+        self._set_status(f"Playing: {media_info['name']}")
+
+    def _ensure_video_widget(self):
+        """
+        Creates the video widget and connects it to the player on first use,
+        so audio-only sessions never allocate a video surface.
+        """
+        if self.video_widget is None:
+            from PyQt5.QtMultimediaWidgets import QVideoWidget  # Deferred: video only
+            self.video_widget = QVideoWidget()
+            self.video_widget.setMinimumSize(640, 360)
+            self.main_layout.insertWidget(0, self.video_widget)
+            self.player.setVideoOutput(self.video_widget)
+        return self.video_widget
+
+    def _hide_video_widget(self):
+        """
+        Hides the video widget if it has been created.
+        """
+        if self.video_widget is not None:
+            self.video_widget.hide()
 
     def play_radio_station(self, item):
         """
         Called when a radio station is double-clicked in the list widget.
         """
-        station_name = item.text()
+        row = self.radio_list_widget.row(item)
+        station_name, stream_url = self._radio_rows[row]
         self.current_radio = station_name
         self.current_song_index = -1  # Stop any local track
-        self.play_radio_station_by_name(station_name)
+        self.stream_radio(station_name, stream_url)
 
     def play_radio_station_by_name(self, station_name: str):
         """
@@ -771,18 +878,24 @@ class MainWindow(QMainWindow):
             )
             return
 
-        stream_url = self.radio_stations[station_name]
+        self.stream_radio(station_name, self.radio_stations[station_name])
+
+    def stream_radio(self, station_name: str, stream_url: str):
+        """
+        Start streaming the given radio URL.
+        """
         url = QUrl(stream_url)
         content = QMediaContent(url)
 
         # Hide the video widget for radio
-        self.video_widget.hide()
+        self._hide_video_widget()
 
         self.player.setMedia(content)
+        self._loaded_index = -1
         self.player.play()
         self.playback_slider.setEnabled(True)
         self.stop_button.setEnabled(True)
-        self.status_bar.showMessage(f"Streaming Radio: {station_name}")
+        self._set_status(f"Streaming Radio: {station_name}")
 
     def stop_song(self):
         """
@@ -793,33 +906,150 @@ class MainWindow(QMainWindow):
         self.playback_slider.setEnabled(False)
         self.stop_button.setEnabled(False)
         self.play_button.setText("Play")
-        self.current_time_label.setText("00:00")
-        self.status_bar.showMessage("Playback stopped.")
+        self._set_time_label("00:00")
+        self._set_status("Playback stopped.")
         self.current_radio = None
-        self.video_widget.hide()
+        self._hide_video_widget()
 
     # ---------- Next/Previous/Shuffle/Repeat -----------
     def next_song(self):
         """
         Advances to the next song in the playlist, or stops if at the end.
-        If shuffle is on, choose a random track. If radio is playing, stop radio first.
+        If shuffle is on, take the next track of the shuffled order.
+        If radio is playing, stop radio first.
         """
         if not self.playlist:
             return
 
         self.current_radio = None
         if self.shuffle_mode:
-            self.current_song_index = random.randint(0, len(self.playlist) - 1)
+            next_index = self._next_shuffled()
+        elif self.repeat_mode:
+            # CurrentItemInLoop never leaves the track; step explicitly
+            next_index = self._step_index(1)
         else:
-            if (self.current_song_index + 1) < len(self.playlist):
-                self.current_song_index += 1
-            else:
-                self.status_bar.showMessage("End of playlist.")
-                self.stop_song()
+            next_index = self._qplaylist.nextIndex()
+        if next_index < 0:
+            self._set_status("End of playlist.")
+            self.stop_song()
+            return
+        self.current_song_index = next_index
+        self.play_song()
+
+    def _step_index(self, step: int) -> int:
+        """
+        Index `step` tracks away from the current one,
+        or -1 when that runs off the playlist.
+        """
+        index = self.current_song_index + step
+        return index if 0 <= index < len(self.playlist) else -1
+
+    def _reshuffle(self):
+        """
+        Builds a new shuffled play order (Durstenfeld's Fisher-Yates). The
+        current track goes first, so it isn't played again in this round.
+        """
+        if self._rng is None:
+            from random import Random  # Deferred: only needed in shuffle mode
+            self._rng = Random()
+        randrange = self._rng.randrange
+        order = list(range(len(self.playlist)))
+        for i in range(len(order) - 1, 0, -1):
+            j = randrange(i + 1)
+            order[i], order[j] = order[j], order[i]
+        self._shuffle_pos = 0
+        current = self.current_song_index
+        if 0 <= current < len(order):
+            k = order.index(current)
+            order[0], order[k] = order[k], order[0]
+            self._shuffle_pos = 1 % len(order)
+        self._shuffle_queue = order
+
+    def _next_shuffled(self) -> int:
+        """
+        Returns the next index of the shuffled order, wrapping around.
+        """
+        if len(self._shuffle_queue) != len(self.playlist):
+            self._reshuffle()
+        index = self._shuffle_queue[self._shuffle_pos]
+        self._shuffle_pos = (self._shuffle_pos + 1) % len(self._shuffle_queue)
+        return index
+
+    def _prev_shuffled(self) -> int:
+        """
+        Steps back to the track played before the current one in the shuffled order.
+        """
+        if len(self._shuffle_queue) != len(self.playlist):
+            self._reshuffle()
+        self._shuffle_pos = (self._shuffle_pos - 2) % len(self._shuffle_queue)
+        return self._next_shuffled()
+
+    def _on_playlist_index_changed(self, index: int):
+        """
+        Keeps the list selection, video widget and status bar in step with the
+        track the playlist moved to (including automatic advances).
+        """
+        self._loaded_index = index
+        if not (0 <= index < len(self.playlist)):
+            return
+        self.current_song_index = index
+        self._select_row(index)
+        media_info = self.playlist[index]
+        self.current_media_type = media_info["type"]
+        if media_info["type"] == "video":
+            self._ensure_video_widget().show()
+        else:
+            self._hide_video_widget()
+        self._set_status(f"Playing: {media_info['name']}")
+
+    def _update_playback_mode(self):
+        """
+        Maps the shuffle/repeat toggles onto the QMediaPlaylist playback mode.
+        Repeat (current track) takes precedence over shuffle. In shuffle mode
+        the playlist stops after each track and handle_media_status picks the
+        next one from the shuffled order.
+        """
+        if self.repeat_mode:
+            mode = QMediaPlaylist.CurrentItemInLoop
+        elif self.shuffle_mode:
+            mode = QMediaPlaylist.CurrentItemOnce
+        else:
+            mode = QMediaPlaylist.Sequential
+        self._qplaylist.setPlaybackMode(mode)
+
+    def _prefetch_next(self):
+        """
+        Opens the upcoming playlist track on the muted prefetch player.
+        """
+        if self.shuffle_mode:
+            if len(self._shuffle_queue) != len(self.playlist):
                 return
+            next_index = self._shuffle_queue[self._shuffle_pos]
+        else:
+            next_index = self._qplaylist.nextIndex()
+        if next_index < 0 or next_index == self._prefetched_index:
+            return
+        self._prefetched_index = next_index
+        self._prefetch_player.setMedia(self._media_content(self.playlist[next_index]))
 
-        self.playlist_widget.setCurrentRow(self.current_song_index)
-        self.play_song()
+    def _media_content(self, item: dict) -> QMediaContent:
+        """
+        Builds the QMediaContent for a playlist entry, tagged with the MIME type
+        known from its extension.
+        """
+        request = QNetworkRequest(QUrl.fromLocalFile(item["path"]))
+        mime = self.EXT_TO_MIME.get(item["ext"])
+        if mime:
+            request.setHeader(QNetworkRequest.ContentTypeHeader, mime)
+        return QMediaContent(request)
+
+    def _reset_prefetch(self):
+        """
+        Forgets the prefetched track (e.g. after the playlist changed).
+        """
+        if self._prefetched_index != -1:
+            self._prefetched_index = -1
+            self._prefetch_player.setMedia(QMediaContent())
 
     def prev_song(self):
         """
@@ -831,15 +1061,15 @@ class MainWindow(QMainWindow):
 
         self.current_radio = None
         if self.shuffle_mode:
-            self.current_song_index = random.randint(0, len(self.playlist) - 1)
+            prev_index = self._prev_shuffled()
+        elif self.repeat_mode:
+            prev_index = self._step_index(-1)
         else:
-            if (self.current_song_index - 1) >= 0:
-                self.current_song_index -= 1
-            else:
-                self.status_bar.showMessage("Start of playlist.")
-                self.current_song_index = 0
-
-        self.playlist_widget.setCurrentRow(self.current_song_index)
+            prev_index = self._qplaylist.previousIndex()
+        if prev_index < 0:
+            self._set_status("Start of playlist.")
+            prev_index = 0
+        self.current_song_index = prev_index
         self.play_song()
 
     def toggle_shuffle(self):
@@ -847,24 +1077,29 @@ class MainWindow(QMainWindow):
         Toggles shuffle mode on/off.
         """
         self.shuffle_mode = not self.shuffle_mode
+        if self.shuffle_mode:
+            self._reshuffle()
+        self._update_playback_mode()
+        self._reset_prefetch()
         if self.shuffle_mode:
             self.shuffle_button.setText("Shuffle ON")
-            self.status_bar.showMessage("Shuffle Mode: ON")
+            self._set_status("Shuffle Mode: ON")
         else:
             self.shuffle_button.setText("Shuffle OFF")
-            self.status_bar.showMessage("Shuffle Mode: OFF")
+            self._set_status("Shuffle Mode: OFF")
 
     def toggle_repeat(self):
         """
         Toggles repeat mode on/off (repeat the current track).
         """
         self.repeat_mode = not self.repeat_mode
+        self._update_playback_mode()
         if self.repeat_mode:
             self.repeat_button.setText("Repeat ON")
-            self.status_bar.showMessage("Repeat Mode: ON (Current Track)")
+            self._set_status("Repeat Mode: ON (Current Track)")
         else:
             self.repeat_button.setText("Repeat OFF")
-            self.status_bar.showMessage("Repeat Mode: OFF")
+            self._set_status("Repeat Mode: OFF")
 
     # ---------- Volume / Mute -----------
     def change_volume(self, value: int):
@@ -872,7 +1107,7 @@ class MainWindow(QMainWindow):
         Updates the media player's volume and the status bar.
         """
         self.player.setVolume(value)
-        self.status_bar.showMessage(f"Volume: {value}%")
+        self._set_status(f"Volume: {value}%")
 
     def toggle_mute(self):
         """
@@ -880,23 +1115,57 @@ class MainWindow(QMainWindow):
         """
         if self.mute_button.isChecked():
             self.player.setMuted(True)
-            self.status_bar.showMessage("Muted")
+            self._set_status("Muted")
         else:
             self.player.setMuted(False)
             volume = self.volume_slider.value()
-            self.status_bar.showMessage(f"Volume: {volume}%")
+            self._set_status(f"Volume: {volume}%")
 
     # ---------- Slider / Time Update -----------
     def update_play_button(self, state: QMediaPlayer.State):
         """
-        Updates the Play/Pause button text based on the media player's state.
+        Updates the Play/Pause button text based on the media player's state,
+        and runs the position timer only while playing.
         """
         if state == QMediaPlayer.PlayingState:
             self.play_button.setText("Pause")
+            self._ui_timer.start()
         elif state == QMediaPlayer.PausedState:
             self.play_button.setText("Play")
+            self._ui_timer.stop()
         elif state == QMediaPlayer.StoppedState:
             self.play_button.setText("Play")
+            self._ui_timer.stop()
+
+    def _set_status(self, text: str):
+        """
+        Queues a status bar message; only the latest one is shown.
+        """
+        self._pending_status = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """
+        Timer callback: shows the pending status message, if any.
+        """
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
+
+    def _tick_ui(self):
+        """
+        Timer callback: pulls the current position once and updates the UI.
+        """
+        self.update_slider(self.player.position())
+
+    def _set_time_label(self, text: str):
+        """
+        Updates the current time label, skipping the write when unchanged.
+        """
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.current_time_label.setText(text)
 
     def update_slider(self, position: int):
         """
@@ -906,7 +1175,13 @@ class MainWindow(QMainWindow):
         self.playback_slider.setValue(position)
         self.playback_slider.blockSignals(False)
         current_time = self.millis_to_time(position)
-        self.current_time_label.setText(current_time)
+        self._set_time_label(current_time)
+
+        # Past 80% of a local track: open the next one in the background
+        duration = self.player.duration()
+        if (self.current_radio is None and not self.repeat_mode
+                and duration > 0 and position > duration * 0.8):
+            self._prefetch_next()
 
     def set_duration(self, duration: int):
         """
@@ -922,25 +1197,24 @@ class MainWindow(QMainWindow):
         """
         self.player.setPosition(position)
         current_time = self.millis_to_time(position)
-        self.current_time_label.setText(current_time)
-        self.status_bar.showMessage(f"Seeked to: {current_time}")
+        self._set_time_label(current_time)
+        self._set_status(f"Seeked to: {current_time}")
 
     # ---------- Media Status / Error -----------
     def handle_media_status(self, status: QMediaPlayer.MediaStatus):
         """
         Responds to changes in the media player's status.
-        If we reach the end of a local file, we move to the next item in the playlist,
-        or repeat if `repeat_mode` is active.
+        Track advance and repeat are handled by the QMediaPlaylist; here we only
+        continue the shuffled order, or reset the UI once the playlist runs out.
         """
         if status == QMediaPlayer.EndOfMedia:
             if self.current_radio is not None:
                 pass  # Radio: do nothing special
-            else:
-                if self.repeat_mode:
-                    self.player.setPosition(0)
-                    self.player.play()
-                else:
-                    self.next_song()
+            elif self.shuffle_mode and not self.repeat_mode:
+                self.next_song()
+            elif self._qplaylist.currentIndex() == -1:
+                self.stop_song()
+                self._set_status("End of playlist.")
 
     def handle_error(self):
         """
@@ -965,10 +1239,20 @@ class MainWindow(QMainWindow):
 
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Playlist", "", "JSON Files (*.json)")
         if file_name:
-            # Write to JSON
+            # Compact by default; indented only if asked for in the File menu
+            pretty = self.settings.value("pretty_playlists", False, type=bool)
             try:
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    json.dump(self.playlist, f, indent=4)
+                try:
+                    import orjson
+                    option = orjson.OPT_APPEND_NEWLINE
+                    if pretty:
+                        option |= orjson.OPT_INDENT_2
+                    data = orjson.dumps(self.playlist, option=option)
+                except ImportError:
+                    import json  # Deferred: only needed when the menu action is used
+                    data = json.dumps(self.playlist, indent=4 if pretty else None).encode('utf-8')
+                with open(file_name, 'wb') as f:
+                    f.write(data)
                 QMessageBox.information(self, "Playlist Saved", f"Playlist saved to {file_name}")
             except Exception as e:
                 QMessageBox.critical(self, "Error Saving Playlist", str(e))
@@ -980,30 +1264,80 @@ class MainWindow(QMainWindow):
         file_name, _ = QFileDialog.getOpenFileName(self, "Load Playlist", "", "JSON Files (*.json)")
         if file_name:
             try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Validate data format is a list of dict with 'path' and 'type'
-                    if isinstance(data, list) and all('path' in d and 'type' in d for d in data):
-                        self.playlist = data
-                        self.playlist_widget.clear()
-                        for item in self.playlist:
-                            self.playlist_widget.addItem(basename(item['path']))
-
-                        # Enable control buttons if playlist is not empty
-                        if self.playlist:
-                            self.play_button.setEnabled(True)
-                            self.remove_button.setEnabled(True)
-                            self.prev_button.setEnabled(True)
-                            self.next_button.setEnabled(True)
-                            self.shuffle_button.setEnabled(True)
-                            self.repeat_button.setEnabled(True)
-
-                        QMessageBox.information(self, "Playlist Loaded", f"Playlist loaded from {file_name}")
-                    else:
-                        QMessageBox.warning(self, "Invalid File", "The selected JSON does not contain a valid playlist.")
+                data = self._read_playlist_file(file_name)
+                if data is not None:
+                    self.playlist = data
+                    self._reset_prefetch()
+                    self._path_to_index = {item['path']: i for i, item in enumerate(data)}
+                    self._qplaylist.clear()
+                    self._loaded_index = -1
+                    if self.shuffle_mode:
+                        self._reshuffle()
+                    # One model reset and a single repaint for the whole file
+                    self.playlist_view.setUpdatesEnabled(False)
+                    try:
+                        self._qplaylist.addMedia([self._media_content(item) for item in data])
+                        self._playlist_model.setStringList([item['name'] for item in data])
+                    finally:
+                        self.playlist_view.setUpdatesEnabled(True)
+
+                    # Enable control buttons if playlist is not empty
+                    if self.playlist:
+                        self.play_button.setEnabled(True)
+                        self.remove_button.setEnabled(True)
+                        self.prev_button.setEnabled(True)
+                        self.next_button.setEnabled(True)
+                        self.shuffle_button.setEnabled(True)
+                        self.repeat_button.setEnabled(True)
+
+                    QMessageBox.information(self, "Playlist Loaded", f"Playlist loaded from {file_name}")
+                else:
+                    QMessageBox.warning(self, "Invalid File", "The selected JSON does not contain a valid playlist.")
             except Exception as e:
                 QMessageBox.critical(self, "Error Loading Playlist", str(e))
 
+    def _read_playlist_file(self, file_name: str):
+        """
+        Parses a playlist file (orjson, then ijson, then json), caching the
+        result by mtime and size. Returns a fresh list of entry dicts, or
+        None if the file does not hold a valid playlist.
+        """
+        st = os.stat(file_name)
+        key = (file_name, st.st_mtime_ns, st.st_size)
+        cached = self._playlist_cache.get(key)
+        if cached is None:
+            with open(file_name, 'rb') as f:
+                try:
+                    import orjson
+                    data = orjson.loads(f.read())
+                except ImportError:
+                    try:
+                        # Parse the top-level array item by item when ijson is available
+                        import ijson
+                        # ijson.items(f, 'item') yields nothing for a top-level
+                        # object or scalar; only a JSON array is a playlist
+                        first = f.read(1)
+                        while first.isspace():
+                            first = f.read(1)
+                        f.seek(0)
+                        data = list(ijson.items(f, 'item')) if first == b'[' else None
+                    except ImportError:
+                        import json  # Deferred: only needed when the menu action is used
+                        data = json.load(f)
+            # Validate data format is a list of dict with 'path' and 'type'
+            if not (isinstance(data, list) and all('path' in d and 'type' in d for d in data)):
+                return None
+            # Older playlist files only store 'path' and 'type'; fill in each
+            # derived field on its own so a partial entry can't raise later
+            for item in data:
+                if 'ext' not in item:
+                    item['ext'] = splitext(item['path'])[1].lower()
+                if 'name' not in item:
+                    item['name'] = basename(item['path'])
+            cached = self._playlist_cache[key] = data
+        # The playlist is edited in place later on, so hand out copies
+        return [dict(item) for item in cached]
+
     # ---------- Helper -----------
     @staticmethod
     def millis_to_time(millis: int) -> str:
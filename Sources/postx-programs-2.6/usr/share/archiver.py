@@ -1,7 +1,15 @@
 import sys
 import os
+import io
+import copy
+import time
+import shutil
+import subprocess
+import zlib
 import zipfile
 import tarfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5.QtWidgets import (
     QApplication,
@@ -12,13 +20,14 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QMessageBox,
     QDialog,
-    QTextEdit,
+    QListView,
+    QComboBox,
     QTreeView,
     QFileSystemModel,
     QHBoxLayout
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import QDir
+from PyQt5.QtCore import QDir, QObject, QSettings, QThread, QTimer, QStringListModel, pyqtSignal
 
 ##########################
 # CONFIG AND HELPER LOGIC
@@ -31,6 +40,51 @@ SUPPORTED_EXTENSIONS = [
     ".tar.bz2", ".tbz2",
     ".tar.xz", ".txz",
 ]
+# Same list as one tuple, so a single str.endswith() call checks them all
+SUPPORTED_SUFFIXES = tuple(SUPPORTED_EXTENSIONS)
+
+# Tar suffixes and their compression, longest suffix first; the tarfile
+# mode is "w"/"r" plus ":" and the compression, if any
+TAR_COMPRESSIONS = (
+    (".tar.gz", "gz"), (".tgz", "gz"),
+    (".tar.bz2", "bz2"), (".tbz2", "bz2"),
+    (".tar.xz", "xz"), (".txz", "xz"),
+)
+
+# Read/write block size used when streaming file data into archives
+COPY_BUFSIZE = 1024 * 1024
+
+# Files up to this size are deflated in worker threads (zlib releases the
+# GIL; the compressed bytes are held in memory until written); larger ones
+# are streamed by the calling thread
+PARALLEL_MAX_FILE_SIZE = 64 * 1024 * 1024
+
+# Deflated members waiting to be written, per worker thread. Bounds peak
+# memory to about workers * this * PARALLEL_MAX_FILE_SIZE (and in practice
+# much less, since that is the uncompressed limit).
+PARALLEL_IN_FLIGHT_PER_WORKER = 2
+
+# Choices of the "ZIP compression" box: label -> DEFLATE level
+ZIP_LEVELS = (("Fast", 1), ("Normal", 6), ("Max", 9))
+
+# Already-compressed formats; these are stored in ZIPs without DEFLATE
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    ".mp3", ".ogg", ".opus", ".flac", ".m4a", ".aac",
+    ".mp4", ".mkv", ".webm", ".avi",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".zip", ".7z", ".rar", ".gz", ".tgz", ".bz2", ".tbz2", ".xz", ".txz", ".zst",
+})
+
+# How many archive listings "View Archive Contents" keeps around
+NAMES_CACHE_SIZE = 16
+
+# Multi-threaded command line compressors for tar modes, best first.
+# An uncompressed tar stream is piped into the first one that is installed.
+EXTERNAL_COMPRESSORS = {
+    "w:gz": [["pigz", "-c"], ["gzip", "-c"]],
+    "w:bz2": [["pbzip2", "-c"]],
+    "w:xz": [["xz", "-T0", "-c"]],
+}
 
 # Maps user-selected filters to a "primary" extension
 FILTER_TO_EXTENSION = {
@@ -54,34 +108,22 @@ def determine_tar_mode_compress(filename: str) -> str:
       *.txz      -> "w:xz"
     Default -> "w"
     """
-    fn = filename.lower()
-    if fn.endswith(".tar"):
-        return "w"
-    elif fn.endswith((".tar.gz", ".tgz")):
-        return "w:gz"
-    elif fn.endswith((".tar.bz2", ".tbz2")):
-        return "w:bz2"
-    elif fn.endswith((".tar.xz", ".txz")):
-        return "w:xz"
-    else:
-        return "w"
+    return _tar_mode("w", filename)
 
 
 def determine_tar_mode_decompress(filename: str) -> str:
     """
     Pick tarfile read mode based on extension.
     """
+    return _tar_mode("r", filename)
+
+
+def _tar_mode(prefix: str, filename: str) -> str:
     fn = filename.lower()
-    if fn.endswith(".tar"):
-        return "r"
-    elif fn.endswith((".tar.gz", ".tgz")):
-        return "r:gz"
-    elif fn.endswith((".tar.bz2", ".tbz2")):
-        return "r:bz2"
-    elif fn.endswith((".tar.xz", ".txz")):
-        return "r:xz"
-    else:
-        return "r"
+    for suffix, compression in TAR_COMPRESSIONS:
+        if fn.endswith(suffix):
+            return f"{prefix}:{compression}"
+    return prefix
 
 
 def maybe_add_extension(out_path: str, selected_filter: str) -> str:
@@ -89,9 +131,8 @@ def maybe_add_extension(out_path: str, selected_filter: str) -> str:
     If the user didn't type a recognized extension,
     append the extension from the chosen filter.
     """
-    lower = out_path.lower()
     # If the user already typed one of our known extensions, do nothing
-    if any(lower.endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+    if out_path.lower().endswith(SUPPORTED_SUFFIXES):
         return out_path
 
     # Otherwise, see which filter was selected
@@ -103,6 +144,266 @@ def maybe_add_extension(out_path: str, selected_filter: str) -> str:
     return out_path
 
 
+def arcname_offsets(selected_items):
+    """
+    For each selected path, the number of leading characters to cut off it
+    (and off every path found below it) to get its name inside the archive,
+    so arcnames come from plain slicing instead of os.path.relpath() per
+    file. Names are relative to the common parent directory of the
+    selection, or to each item's own parent if there is none (different
+    drives on Windows). Paths must be absolute and normalized.
+    """
+    try:
+        base = os.path.commonpath(selected_items)
+    except ValueError:
+        base = None
+    else:
+        if base in selected_items:
+            # A single item, or an item containing the others: keep its name
+            base = os.path.dirname(base)
+
+    offsets = []
+    for item in selected_items:
+        parent = base if base is not None else os.path.dirname(item)
+        offsets.append(len(parent) if parent.endswith(os.sep) else len(parent) + 1)
+    return offsets
+
+
+def iter_files(directory: str):
+    """
+    Recursively yield (path, stat_result) for the files below `directory`,
+    like os.walk (symlinked directories are not followed) but reusing the
+    DirEntry stat so each file is stat'ed only once.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    yield from iter_files(entry.path)
+            else:
+                yield entry.path, entry.stat()
+
+
+def zipinfo_from_stat(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """
+    Equivalent of ZipInfo.from_file() for a regular file, built from a stat
+    result that was already taken.
+    """
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    if os.path.splitext(arcname)[1].lower() in INCOMPRESSIBLE_EXTENSIONS:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    return zinfo
+
+
+def zip_add_file(zf: zipfile.ZipFile, full_path: str, arcname: str,
+                 st: os.stat_result) -> None:
+    """
+    Stream one file into an open ZipFile in COPY_BUFSIZE blocks, so CRC32 and
+    DEFLATE run inside zlib on large buffers.
+    """
+    zinfo = zipinfo_from_stat(arcname, st)
+    # ZipFile.open() takes the level from the ZipInfo, not the archive, for
+    # a hand-built ZipInfo; carry the archive's compresslevel over
+    if hasattr(zipfile.ZipInfo, "compress_level"):  # Python 3.13+
+        zinfo.compress_level = zf.compresslevel
+    else:
+        zinfo._compresslevel = zf.compresslevel
+    with open(full_path, 'rb', buffering=0) as src, \
+            zf.open(zinfo, 'w', force_zip64=True) as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+
+def _deflate_file(full_path: str, level: int = zlib.Z_DEFAULT_COMPRESSION):
+    """
+    Worker: raw-DEFLATE one file. Returns (crc32, file_size, compressed bytes).
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    crc = 0
+    size = 0
+    chunks = []
+    with open(full_path, 'rb', buffering=0) as src:
+        while True:
+            block = src.read(COPY_BUFSIZE)
+            if not block:
+                break
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            chunks.append(compressor.compress(block))
+    chunks.append(compressor.flush())
+    return crc, size, b"".join(chunks)
+
+
+def zip_add_deflated(zf: zipfile.ZipFile, arcname: str, st: os.stat_result,
+                     crc: int, file_size: int, data: bytes) -> None:
+    """
+    Append an already-deflated member to an open ZipFile (as produced by
+    _deflate_file), writing the local header and payload directly. The
+    ZipFile's state is checked once up front by zip_add_files, not here.
+    """
+    zinfo = zipinfo_from_stat(arcname, st)
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(data)
+    zip64 = file_size > zipfile.ZIP64_LIMIT or len(data) > zipfile.ZIP64_LIMIT
+    with zf._lock:
+        zf._didModify = True
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader(zip64))
+        zf.fp.write(data)
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
+
+def zip_add_files(zf: zipfile.ZipFile, entries, progress=None) -> None:
+    """
+    Add (full_path, arcname, stat_result) entries to an open ZipFile. Several
+    small/medium files are deflated in parallel worker threads; the rest,
+    including everything stored uncompressed, is streamed. `progress`, if given, is called with a 0-100 percentage.
+    """
+    # Validate once for the whole batch instead of per member
+    if zf.mode not in ("w", "x", "a"):
+        raise ValueError("zip_add_files() requires mode 'w', 'x', or 'a'")
+    if not zf.fp:
+        raise ValueError("Attempt to write ZIP archive that was already closed")
+    if len(zf.filelist) + len(entries) > zipfile.ZIP_FILECOUNT_LIMIT and not zf._allowZip64:
+        raise zipfile.LargeZipFile("Files count would require ZIP64 extensions")
+
+    total = len(entries) or 1
+    written = 0
+
+    def advance():
+        nonlocal written
+        written += 1
+        if progress is not None:
+            progress(written * 100 // total)
+
+    parallel = []
+    for full_path, arcname, st in entries:
+        if (st.st_size <= PARALLEL_MAX_FILE_SIZE and
+                os.path.splitext(arcname)[1].lower() not in INCOMPRESSIBLE_EXTENSIONS):
+            parallel.append((full_path, arcname, st))
+        else:
+            zip_add_file(zf, full_path, arcname, st)
+            advance()
+
+    if len(parallel) < 2:
+        for full_path, arcname, st in parallel:
+            zip_add_file(zf, full_path, arcname, st)
+            advance()
+        return
+
+    # Threads rather than processes: this runs inside a QThread, where
+    # forking is unsafe, and zlib does its work without the GIL
+    workers = os.cpu_count() or 1
+    window = workers * PARALLEL_IN_FLIGHT_PER_WORKER
+    level = zf.compresslevel if zf.compresslevel is not None else zlib.Z_DEFAULT_COMPRESSION
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Only `window` members are deflated ahead of the writer, so peak
+        # memory doesn't grow with the size of the archive
+        pending = deque()
+        for full_path, arcname, st in parallel:
+            pending.append((arcname, st, pool.submit(_deflate_file, full_path, level)))
+            if len(pending) >= window:
+                arcname, st, future = pending.popleft()
+                zip_add_deflated(zf, arcname, st, *future.result())
+                advance()
+        while pending:
+            arcname, st, future = pending.popleft()
+            zip_add_deflated(zf, arcname, st, *future.result())
+            advance()
+
+
+def find_external_compressor(mode: str):
+    """
+    Returns the command line of an installed external compressor for a
+    tarfile write mode, or None when tarfile has to compress by itself.
+    """
+    for cmd in EXTERNAL_COMPRESSORS.get(mode, []):
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+class SendfileTarFile(tarfile.TarFile):
+    """
+    TarFile whose regular-file data is copied with os.sendfile(), i.e.
+    kernel to kernel, when writing an uncompressed archive to a real file.
+    Anything else (compressed or streamed archives, sendfile unsupported
+    by the filesystem) takes the normal read()/write() path.
+    """
+
+    def addfile(self, tarinfo, fileobj=None):
+        if (fileobj is None or not tarinfo.isreg() or not hasattr(os, "sendfile")
+                or not isinstance(self.fileobj, io.BufferedWriter)):
+            return super().addfile(tarinfo, fileobj)
+
+        self._check("awx")
+        tarinfo = copy.copy(tarinfo)
+        buf = tarinfo.tobuf(self.format, self.encoding, self.errors)
+        self.fileobj.write(buf)
+        self.offset += len(buf)
+
+        self.fileobj.flush()
+        out_fd = self.fileobj.fileno()
+        in_fd = fileobj.fileno()
+        sent_total = 0
+        try:
+            while sent_total < tarinfo.size:
+                sent = os.sendfile(out_fd, in_fd, sent_total, tarinfo.size - sent_total)
+                if sent == 0:
+                    raise tarfile.ReadError("unexpected end of data")
+                sent_total += sent
+        except OSError:
+            if sent_total:
+                raise
+            # e.g. EINVAL on filesystems without sendfile support
+            fileobj.seek(0)
+            tarfile.copyfileobj(fileobj, self.fileobj, tarinfo.size, bufsize=COPY_BUFSIZE)
+        else:
+            # Resync the buffered writer with the fd position sendfile moved
+            self.fileobj.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+
+        blocks, remainder = divmod(tarinfo.size, tarfile.BLOCKSIZE)
+        if remainder > 0:
+            self.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            blocks += 1
+        self.offset += blocks * tarfile.BLOCKSIZE
+        self.members.append(tarinfo)
+
+
+##########################
+# BACKGROUND WORKER
+##########################
+
+class ArchiveWorker(QObject):
+    """
+    Runs one archive operation off the GUI thread.
+    `func(*args, progress=callback)` is called from run(); its return value
+    is delivered through `done`, an exception message through `error`.
+    """
+    progress = pyqtSignal(int)
+    done = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.func(*self.args, progress=self.progress.emit)
+        except Exception as e:
+            self.error.emit(str(e))
+        else:
+            self.done.emit(result)
+
+
 ##########################
 # CUSTOM SELECTION DIALOG
 ##########################
@@ -117,10 +418,18 @@ class CustomSelectionDialog(QDialog):
         # Use a QTreeView with a QFileSystemModel to display the file system.
         self.tree = QTreeView(self)
         self.tree.setSelectionMode(QTreeView.ExtendedSelection)
+        # All rows are one line high; lets the view skip measuring each row
+        # when a directory with thousands of entries is expanded
+        self.tree.setUniformRowHeights(True)
         self.model = QFileSystemModel(self)
-        self.model.setRootPath(QDir.homePath())
+        # No inotify watches or per-folder icon lookups; the listing only
+        # has to be correct at the moment the user picks something
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, True)
+        self.model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
+        self.model.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot)
         self.tree.setModel(self.model)
-        self.tree.setRootIndex(self.model.index(QDir.homePath()))
+        # Start populating the home directory once the dialog has painted
+        QTimer.singleShot(0, self._mount_home)
         # Optionally hide extra columns (size, type, date modified)
         self.tree.setColumnWidth(0, 250)
         self.tree.hideColumn(1)
@@ -139,17 +448,28 @@ class CustomSelectionDialog(QDialog):
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
 
+    def _mount_home(self):
+        home = QDir.homePath()
+        self.model.setRootPath(home)
+        self.tree.setRootIndex(self.model.index(home))
+
     def selected_paths(self):
         """
-        Returns a list of selected file and folder paths.
+        Returns a list of selected file and folder paths. Items inside a
+        selected folder are dropped, as the folder already includes them.
         """
-        indexes = self.tree.selectionModel().selectedIndexes()
-        paths = set()
-        for index in indexes:
-            # Only consider the first column to avoid duplicates
-            if index.column() == 0:
-                paths.add(self.model.filePath(index))
-        return list(paths)
+        # Only the first column, instead of every (hidden) column of each row
+        indexes = self.tree.selectionModel().selectedRows(0)
+        paths = {self.model.filePath(index) for index in indexes}
+
+        kept = []
+        # Sorted by components ('/'-separated, as Qt reports them), a folder
+        # comes right before everything inside it
+        for path in sorted(paths, key=lambda p: p.split("/")):
+            if kept and path.startswith(kept[-1].rstrip("/") + "/"):
+                continue
+            kept.append(path)
+        return kept
 
 
 ##########################
@@ -179,17 +499,75 @@ class ArchiveHandler(QWidget):
         self.decompress_button = QPushButton("Decompress Archive")
         self.decompress_button.clicked.connect(self.decompress_archive)
 
+        # DEFLATE level used for ZIP archives, remembered between runs
+        self.settings = QSettings("Archiver", "Archiver")
+        self.zip_level_combo = QComboBox()
+        for label, level in ZIP_LEVELS:
+            self.zip_level_combo.addItem(label, level)
+        saved_level = self.settings.value("zip_level", ZIP_LEVELS[0][1], type=int)
+        self.zip_level_combo.setCurrentIndex(max(self.zip_level_combo.findData(saved_level), 0))
+        self.zip_level_combo.currentIndexChanged.connect(
+            lambda _: self.settings.setValue("zip_level", self.zip_level_combo.currentData())
+        )
+        level_layout = QHBoxLayout()
+        level_layout.addWidget(QLabel("ZIP compression:"))
+        level_layout.addWidget(self.zip_level_combo)
+
         # Status Label
         self.status_label = QLabel("Select an action.")
         self.status_label.setFont(QFont("Arial", 10))
 
         layout.addWidget(self.compress_folder_button)
+        layout.addLayout(level_layout)
         layout.addWidget(self.view_archive_button)
         layout.addWidget(self.decompress_button)
         layout.addWidget(self.status_label)
 
         self.setLayout(layout)
 
+        # Currently running background operation, if any
+        self.worker_thread = None
+        self.worker = None
+
+        # Member names of recently inspected archives, keyed by
+        # (path, st_mtime_ns, st_size), least recently used first
+        self._names_cache = OrderedDict()
+
+    def _run_in_thread(self, busy_text, on_done, func, *args):
+        """
+        Run `func(*args)` on a QThread through an ArchiveWorker. Buttons are
+        disabled meanwhile; the status label is only touched from the
+        worker's signals, which are delivered on the GUI thread.
+        """
+        self._set_buttons_enabled(False)
+        self.status_label.setText(busy_text)
+
+        self.worker_thread = QThread(self)
+        self.worker = ArchiveWorker(func, *args)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(
+            lambda percent: self.status_label.setText(f"{busy_text} {percent}%")
+        )
+        self.worker.done.connect(on_done)
+        self.worker.error.connect(self.status_label.setText)
+        self.worker.done.connect(self.worker_thread.quit)
+        self.worker.error.connect(self.worker_thread.quit)
+        self.worker_thread.finished.connect(self._on_thread_finished)
+        self.worker_thread.start()
+
+    def _on_thread_finished(self):
+        self.worker.deleteLater()
+        self.worker_thread.deleteLater()
+        self.worker = None
+        self.worker_thread = None
+        self._set_buttons_enabled(True)
+
+    def _set_buttons_enabled(self, enabled: bool):
+        self.compress_folder_button.setEnabled(enabled)
+        self.view_archive_button.setEnabled(enabled)
+        self.decompress_button.setEnabled(enabled)
+
     ########################
     # 1) COMPRESS SELECTED ITEMS
     ########################
@@ -226,9 +604,12 @@ class ArchiveHandler(QWidget):
             return
 
         if out_path.lower().endswith(".zip"):
-            self._compress_zip_items(selected_items, out_path)
+            self._run_in_thread("Compressing...", self.status_label.setText,
+                                self._compress_zip_items, selected_items, out_path,
+                                self.zip_level_combo.currentData())
         else:
-            self._compress_tar_items(selected_items, out_path)
+            self._run_in_thread("Compressing...", self.status_label.setText,
+                                self._compress_tar_items, selected_items, out_path)
 
     def _open_custom_selection_dialog(self):
         """
@@ -239,49 +620,62 @@ class ArchiveHandler(QWidget):
             return dialog.selected_paths()
         return []
 
-    def _compress_zip_items(self, selected_items, out_path):
+    def _compress_zip_items(self, selected_items, out_path,
+                            level=zlib.Z_DEFAULT_COMPRESSION, progress=None):
         """
-        Compress the selected files/folders into a ZIP archive.
+        Compress the selected files/folders into a ZIP archive at DEFLATE `level`.
+        Returns a status message; raises RuntimeError on failure.
         """
+        selected_items = [os.path.abspath(item) for item in selected_items]
         try:
-            # Compute a common base for relative paths.
-            common_base = os.path.commonpath(selected_items)
-        except ValueError:
-            # Fallback: if items are on different drives (Windows), use empty base.
-            common_base = ""
-        try:
-            with zipfile.ZipFile(out_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for item in selected_items:
-                    if os.path.isfile(item):
-                        arcname = os.path.relpath(item, common_base) if common_base else os.path.basename(item)
-                        zf.write(item, arcname=arcname)
-                    elif os.path.isdir(item):
-                        for root, dirs, files in os.walk(item):
-                            for file_name in files:
-                                full_path = os.path.join(root, file_name)
-                                arcname = os.path.relpath(full_path, common_base) if common_base else os.path.basename(full_path)
-                                zf.write(full_path, arcname=arcname)
-            self.status_label.setText(f"Compressed selected items into '{out_path}'")
+            # Enumerate everything first, so the files can be compressed in parallel
+            entries = []
+            for item, cut in zip(selected_items, arcname_offsets(selected_items)):
+                if os.path.isfile(item):
+                    entries.append((item, item[cut:], os.stat(item)))
+                elif os.path.isdir(item):
+                    for full_path, st in iter_files(item):
+                        entries.append((full_path, full_path[cut:], st))
+            with zipfile.ZipFile(out_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+                zip_add_files(zf, entries, progress)
         except Exception as e:
-            self.status_label.setText(f"Error compressing selected items to ZIP: {e}")
+            raise RuntimeError(f"Error compressing selected items to ZIP: {e}")
+        return f"Compressed selected items into '{out_path}'"
 
-    def _compress_tar_items(self, selected_items, out_path):
+    def _compress_tar_items(self, selected_items, out_path, progress=None):
         """
         Compress the selected files/folders into a TAR-based archive.
+        Returns a status message; raises RuntimeError on failure.
         """
         mode = determine_tar_mode_compress(out_path)
+        selected_items = [os.path.abspath(item) for item in selected_items]
+        arcnames = [item[cut:] for item, cut in zip(selected_items, arcname_offsets(selected_items))]
         try:
-            common_base = os.path.commonpath(selected_items)
-        except ValueError:
-            common_base = ""
-        try:
-            with tarfile.open(out_path, mode=mode) as tar:
-                for item in selected_items:
-                    arcname = os.path.relpath(item, common_base) if common_base else os.path.basename(item)
-                    tar.add(item, arcname=arcname)
-            self.status_label.setText(f"Compressed selected items into '{out_path}'")
+            compressor = find_external_compressor(mode)
+            if compressor is None:
+                with SendfileTarFile.open(out_path, mode=mode) as tar:
+                    for i, (item, arcname) in enumerate(zip(selected_items, arcnames), 1):
+                        tar.add(item, arcname=arcname)
+                        if progress is not None:
+                            progress(i * 100 // len(selected_items))
+            else:
+                # Stream a plain tar into e.g. pigz / xz -T0, which use all cores
+                with open(out_path, 'wb') as out_file:
+                    proc = subprocess.Popen(compressor, stdin=subprocess.PIPE, stdout=out_file)
+                    try:
+                        with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                            for i, (item, arcname) in enumerate(zip(selected_items, arcnames), 1):
+                                tar.add(item, arcname=arcname)
+                                if progress is not None:
+                                    progress(i * 100 // len(selected_items))
+                    finally:
+                        proc.stdin.close()
+                        returncode = proc.wait()
+                if returncode != 0:
+                    raise RuntimeError(f"{compressor[0]} exited with status {returncode}")
         except Exception as e:
-            self.status_label.setText(f"Error compressing selected items to TAR: {e}")
+            raise RuntimeError(f"Error compressing selected items to TAR: {e}")
+        return f"Compressed selected items into '{out_path}'"
 
     ########################
     # 2) VIEW ARCHIVE CONTENTS
@@ -295,47 +689,64 @@ class ArchiveHandler(QWidget):
         if not archive_path:
             return
 
-        try:
-            contents_list = self._inspect_archive(archive_path)
+        def show(contents_list):
+            self.status_label.setText("")
             self._show_contents_dialog(archive_path, contents_list)
-        except Exception as e:
-            self.status_label.setText(f"Error viewing archive: {e}")
 
-    def _inspect_archive(self, archive_path):
+        self._run_in_thread("Reading archive...", show,
+                            self._inspect_archive, archive_path)
+
+    def _inspect_archive(self, archive_path, progress=None):
         """
-        Returns a list of filenames inside the archive.
+        Returns a list of filenames inside the archive. Listings are cached
+        until the archive's mtime or size changes.
         """
         archive_lower = archive_path.lower()
-        if archive_lower.endswith(".zip"):
-            with zipfile.ZipFile(archive_path, 'r') as zf:
-                return zf.namelist()
-        else:
-            mode = determine_tar_mode_decompress(archive_path)
-            with tarfile.open(archive_path, mode=mode) as tar:
-                return tar.getnames()
+        try:
+            st = os.stat(archive_path)
+            key = (archive_path, st.st_mtime_ns, st.st_size)
+            names = self._names_cache.get(key)
+            if names is not None:
+                self._names_cache.move_to_end(key)
+                return names
+
+            if archive_lower.endswith(".zip"):
+                with zipfile.ZipFile(archive_path, 'r') as zf:
+                    names = zf.namelist()
+            else:
+                mode = determine_tar_mode_decompress(archive_path)
+                with tarfile.open(archive_path, mode=mode) as tar:
+                    names = tar.getnames()
+        except Exception as e:
+            raise RuntimeError(f"Error viewing archive: {e}")
+
+        self._names_cache[key] = names
+        if len(self._names_cache) > NAMES_CACHE_SIZE:
+            self._names_cache.popitem(last=False)
+        return names
 
     def _show_contents_dialog(self, archive_path, contents_list):
         """
         Shows a dialog with the names of all files/folders inside the archive.
+        The names go into a list view, which only lays out the visible rows.
         """
-        text = f"Archive: {archive_path}\n\n"
-        if not contents_list:
-            text += "[No files found in this archive]"
-        else:
-            for item in contents_list:
-                text += item + "\n"
-
         dlg = QDialog(self)
         dlg.setWindowTitle("Archive Contents")
         dlg.resize(500, 400)
 
         layout = QVBoxLayout()
 
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        text_edit.setPlainText(text)
+        header = QLabel(f"Archive: {archive_path}")
+        header.setWordWrap(True)
+        layout.addWidget(header)
 
-        layout.addWidget(text_edit)
+        model = QStringListModel(contents_list or ["[No files found in this archive]"], dlg)
+        list_view = QListView()
+        list_view.setUniformItemSizes(True)
+        list_view.setEditTriggers(QListView.NoEditTriggers)
+        list_view.setModel(model)
+
+        layout.addWidget(list_view)
         dlg.setLayout(layout)
 
         dlg.exec_()
@@ -358,10 +769,8 @@ class ArchiveHandler(QWidget):
         if not extract_dir:
             return
 
-        try:
-            self._decompress(archive_path, extract_dir)
-        except Exception as e:
-            self.status_label.setText(f"Error decompressing file: {e}")
+        self._run_in_thread("Decompressing...", self.status_label.setText,
+                            self._decompress, archive_path, extract_dir)
 
     def _open_file_dialog_for_archive(self):
         """
@@ -378,34 +787,49 @@ class ArchiveHandler(QWidget):
         )
         return archive_path
 
-    def _decompress(self, archive_path, extract_dir):
+    def _decompress(self, archive_path, extract_dir, progress=None):
         """
         Decompress the chosen archive into extract_dir.
+        Returns a status message; raises RuntimeError on failure.
         """
         archive_lower = archive_path.lower()
         if archive_lower.endswith(".zip"):
-            self._decompress_zip(archive_path, extract_dir)
+            self._decompress_zip(archive_path, extract_dir, progress)
         else:
-            self._decompress_tar(archive_path, extract_dir)
+            self._decompress_tar(archive_path, extract_dir, progress)
+        return f"Decompressed '{archive_path}' into '{extract_dir}'"
 
-    def _decompress_zip(self, archive_path, extract_dir):
+    def _decompress_zip(self, archive_path, extract_dir, progress=None):
         try:
             with zipfile.ZipFile(archive_path, 'r') as zf:
-                zf.extractall(extract_dir)
-            self.status_label.setText(
-                f"Decompressed '{archive_path}' into '{extract_dir}'"
-            )
+                members = zf.infolist()
+                total = len(members) or 1
+                for i, member in enumerate(members, 1):
+                    zf.extract(member, extract_dir)
+                    if progress is not None:
+                        progress(i * 100 // total)
         except Exception as e:
             raise RuntimeError(f"Error decompressing ZIP: {e}")
 
-    def _decompress_tar(self, archive_path, extract_dir):
-        mode = determine_tar_mode_decompress(archive_path)
+    def _decompress_tar(self, archive_path, extract_dir, progress=None):
+        # Streaming mode ("r|gz" etc.) reads the archive front to back in
+        # COPY_BUFSIZE blocks instead of seeking around for each member
+        stream_mode = determine_tar_mode_decompress(archive_path).replace(":", "|")
+        if stream_mode == "r":
+            # Unknown suffix: let tarfile detect the compression
+            stream_mode = "r|*"
+        # Reject absolute paths, links out of extract_dir etc. where supported
+        kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
         try:
-            with tarfile.open(archive_path, mode=mode) as tar:
-                tar.extractall(path=extract_dir)
-            self.status_label.setText(
-                f"Decompressed '{archive_path}' into '{extract_dir}'"
-            )
+            total = os.path.getsize(archive_path) or 1
+            with open(archive_path, 'rb') as f, \
+                    tarfile.open(fileobj=f, mode=stream_mode, bufsize=COPY_BUFSIZE) as tar:
+                def members():
+                    for member in tar:
+                        yield member
+                        if progress is not None:
+                            progress(min(f.tell() * 100 // total, 100))
+                tar.extractall(path=extract_dir, members=members(), **kwargs)
         except Exception as e:
             raise RuntimeError(f"Error decompressing TAR: {e}")
 
@@ -417,7 +841,7 @@ class ArchiveHandler(QWidget):
         Ensure the output archive has one of our recognized extensions.
         If not, warn the user.
         """
-        if not any(out_path.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+        if not out_path.lower().endswith(SUPPORTED_SUFFIXES):
             QMessageBox.warning(
                 self,
                 "Unsupported Extension",
@@ -452,7 +876,7 @@ def main():
     QLabel {
         color: #FFFFFF;
     }
-    QTextEdit {
+    QListView {
         background-color: #3F3F3F;
         color: #FFFFFF;
         border: 1px solid #666666;
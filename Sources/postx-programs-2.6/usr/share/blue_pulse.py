@@ -1,14 +1,20 @@
+import os
 import sys
 import time
 import threading
 import subprocess
 import re
+import json
 import logging
 from PyQt5 import QtCore, QtGui, QtWidgets
 import dbus
 import dbus.service
 from dbus.mainloop.glib import DBusGMainLoop
 from gi.repository import GLib
+try:
+    import pulsectl  # Optional: talk to libpulse in-process instead of running pactl
+except ImportError:
+    pulsectl = None
 sys.dont_write_bytecode = True
 
 # ------------------------ Logging Configuration ------------------------
@@ -26,170 +32,490 @@ sys.dont_write_bytecode = True
 # Disable all logging messages
 logging.disable(logging.CRITICAL)
 
+# ------------------------ pactl Cache ------------------------
+
+# Seconds a cached pactl listing stays valid if no event invalidates it first
+PACTL_CACHE_TTL = 5.0
+
+# `pactl subscribe` facility -> cached commands whose output it affects
+PACTL_EVENT_KEYS = {
+    'sink': [('list', 'sinks')],
+    'source': [('list', 'sources')],
+    'card': [('list', 'cards')],
+    'server': [('get-default-sink',), ('get-default-source',)],
+}
+
+# Cache key and lifetime of audio_snapshot() results
+SNAPSHOT_KEY = ('snapshot',)
+SNAPSHOT_TTL = 0.5
+
+PACTL_EVENT_RE = re.compile(r"Event '(\w+)' on (sink|source|card|server) #")
+
+# BlueZ sink/source names are '<prefix>aa_bb_cc_dd_ee_ff...'
+BLUEZ_DEVICE_PREFIXES = ('bluez_sink.', 'bluez_source.')
+BLUEZ_ADDR_LEN = 17
+
+class PactlCache:
+    """Parsed pactl results keyed by command tuple, each with its fetch time."""
+
+    def __init__(self, ttl=PACTL_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl=None):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < (self.ttl if ttl is None else ttl):
+            return entry[1]
+        return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            # The audio snapshot is built from the other entries
+            if keys:
+                self._entries.pop(SNAPSHOT_KEY, None)
+
+_pactl_cache = PactlCache()
+
+class PactlQueue:
+    """
+    Runs fire-and-forget pactl setters on one long-lived background thread,
+    in submission order. A pending command for the same (subcommand, device)
+    is replaced by the newer one, so a burst of volume changes costs a
+    single pactl call instead of one per step.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, command, stale_keys=()):
+        """Queue a pactl command; stale_keys are cache entries it invalidates."""
+        with self._cond:
+            # Replacing a value keeps the key's place in the queue
+            self._pending[tuple(command[:2])] = (command, stale_keys)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        _pactl_cache.invalidate(*stale_keys)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                key = next(iter(self._pending))
+                command, stale_keys = self._pending.pop(key)
+            spawn_pactl(command)
+            # Also drop anything cached while the command was still queued
+            _pactl_cache.invalidate(*stale_keys)
+
+_pactl_queue = PactlQueue()
+
+def cached_pactl(command, parse, text=True):
+    """Return parse(output of pactl command), reusing a cached result while fresh."""
+    key = tuple(command)
+    result = _pactl_cache.get(key)
+    if result is None:
+        result = parse(run_pactl_command(command, text=text))
+        _pactl_cache.put(key, result)
+    return result
+
+# Cleared the first time `pactl -f json` fails (pactl older than 16)
+_pactl_json = True
+
+def json_device_dict(device):
+    """Same keys as the pactl text list parsers produce."""
+    channels = list(device['volume'].values())
+    return {
+        'index': str(device['index']),
+        'name': device['name'],
+        'description': device['description'],
+        'mute': bool(device['mute']),
+        'volume': int(channels[0]['value_percent'].rstrip('%')) if channels else 0,
+    }
+
+def cached_pactl_list(kind, parse_text):
+    """
+    Devices from `pactl list <kind>`, cached like cached_pactl(). The JSON
+    output is used when pactl supports it; otherwise parse_text handles the
+    verbose text listing.
+    """
+    global _pactl_json
+    key = ('list', kind)
+    devices = _pactl_cache.get(key)
+    if devices is not None:
+        return devices
+    if _pactl_json:
+        command = ['-f', 'json', 'list', kind]
+        try:
+            logging.debug(f"Running pactl command: {' '.join(['pactl'] + command)}")
+            result = subprocess.run(['pactl'] + command, capture_output=True, env=PACTL_ENV)
+        except OSError as e:
+            logging.error(f"Could not run pactl {' '.join(command)}: {e}")
+            result = None
+        if result is not None and result.returncode != 0:
+            if b'option' in result.stderr.lower():
+                # pactl before 16 rejects -f ("invalid option -- 'f'")
+                logging.info("pactl has no JSON output, parsing text listings instead.")
+                _pactl_json = False
+            else:
+                stderr = result.stderr.decode('utf-8', 'replace')
+                logging.error(f"Error running pactl {' '.join(command)}: {stderr.strip()}")
+        elif result is not None and result.stdout.strip():
+            try:
+                devices = [json_device_dict(d) for d in json.loads(result.stdout)]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logging.info(f"No usable JSON from pactl ({e}), parsing text listings instead.")
+                _pactl_json = False
+        # Anything else (no or empty output, e.g. while the server restarts)
+        # is a one-off: the text parser handles this call, JSON is tried again
+    if devices is None:
+        devices = parse_text(run_pactl_command(['list', kind], text=False))
+    _pactl_cache.put(key, devices)
+    return devices
+
+# ------------------------ libpulse (pulsectl) ------------------------
+
+# Returned by pulse_call() when pulsectl can't be used; callers then use pactl
+PULSE_UNAVAILABLE = object()
+
+_pulse = None
+_pulse_lock = threading.Lock()
+
+def pulse_call(func, *args):
+    """
+    Run func(pulse, *args) on the shared pulsectl connection, serialized
+    by a lock (pulsectl is not thread-safe). Only failing to connect turns
+    pulsectl off for the session; a lost connection is re-opened on the
+    next call, and an unknown device name returns None.
+    """
+    global _pulse, pulsectl
+    if pulsectl is None:
+        return PULSE_UNAVAILABLE
+    with _pulse_lock:
+        if _pulse is None:
+            try:
+                _pulse = pulsectl.Pulse('blue_pulse')
+            except pulsectl.PulseError as e:
+                logging.error(f"Could not connect with pulsectl, using pactl from now on: {e}")
+                pulsectl = None
+                return PULSE_UNAVAILABLE
+        try:
+            return func(_pulse, *args)
+        except pulsectl.PulseIndexError as e:
+            # Unknown or just-removed sink/source; pactl wouldn't find it either
+            logging.warning(f"pulsectl: no such device: {e}")
+            return None
+        except pulsectl.PulseDisconnected as e:
+            logging.error(f"pulsectl connection lost, reconnecting on next call: {e}")
+            _pulse.close()
+            _pulse = None
+            return PULSE_UNAVAILABLE
+        except pulsectl.PulseError as e:
+            logging.error(f"pulsectl call failed, using pactl for it: {e}")
+            return PULSE_UNAVAILABLE
+
+def pulse_device_dict(device):
+    """Same keys as the pactl list parsers produce."""
+    return {
+        'index': str(device.index),
+        'name': device.name,
+        'description': device.description,
+        'mute': bool(device.mute),
+        'volume': round(device.volume.values[0] * 100) if device.volume.values else 0,
+    }
+
+def _pulse_set_default(pulse, kind, name):
+    pulse.default_set(getattr(pulse, f'get_{kind}_by_name')(name))
+
+def _pulse_set_volume(pulse, kind, name, volume):
+    pulse.volume_set_all_chans(getattr(pulse, f'get_{kind}_by_name')(name), volume / 100)
+
+def _pulse_set_mute(pulse, kind, name, mute):
+    pulse.mute(getattr(pulse, f'get_{kind}_by_name')(name), mute)
+
 # ------------------------ Helper Functions ------------------------
 
-def run_pactl_command(command):
-    """Run a pactl command and return the output."""
+# First-channel volume in get-*-volume output (matched on raw bytes)
+VOLUME_RE = re.compile(rb'front-left:.*?(\d+)%')
+# `Mute: yes` in get-*-mute output (matched on raw bytes)
+_MUTE_YES = re.compile(rb'Mute:\s*yes', re.I)
+# Percentage on a `Volume:` line of pactl list output (matched on raw bytes)
+PERCENT_RE = re.compile(rb'(\d+)%')
+# Keys parse_devices() collects per device: index, name,
+# description, mute, volume
+LISTING_FIELDS = 5
+
+# pactl translates its output; the parsers above expect the C locale
+PACTL_ENV = {**os.environ, 'LC_ALL': 'C', 'LANG': 'C'}
+
+# (kind, name) -> last volume read from or written to pactl, used when a
+# reply can't be parsed so a bad read never turns into a 0% write
+_last_volume = {}
+
+def run_pactl_command(command, text=True):
+    """Run a pactl command and return the output (bytes if text is False)."""
     try:
         logging.debug(f"Running pactl command: {' '.join(['pactl'] + command)}")
-        result = subprocess.run(['pactl'] + command, capture_output=True, text=True, check=True)
+        result = subprocess.run(['pactl'] + command, capture_output=True, text=text, check=True, env=PACTL_ENV)
         logging.debug(f"pactl output: {result.stdout.strip()}")
         return result.stdout
     except subprocess.CalledProcessError as e:
-        logging.error(f"Error running pactl {' '.join(command)}: {e.stderr.strip()}")
-        return ""
+        stderr = e.stderr if text else e.stderr.decode('utf-8', 'replace')
+        logging.error(f"Error running pactl {' '.join(command)}: {stderr.strip()}")
+        return "" if text else b""
+    except OSError as e:
+        logging.error(f"Could not run pactl {' '.join(command)}: {e}")
+        return "" if text else b""
+
+def spawn_pactl(command):
+    """
+    Run a pactl command whose output isn't needed (setters) and wait for it.
+    Uses posix_spawn without pipes where available; returns True on success.
+    """
+    logging.debug(f"Spawning pactl command: {' '.join(['pactl'] + command)}")
+    try:
+        if hasattr(os, 'posix_spawnp'):
+            pid = os.posix_spawnp('pactl', ['pactl'] + command, PACTL_ENV, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            ])
+            exit_code = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        else:
+            exit_code = subprocess.call(['pactl'] + command, stdout=subprocess.DEVNULL, env=PACTL_ENV)
+    except OSError as e:
+        logging.error(f"Could not run pactl {' '.join(command)}: {e}")
+        return False
+    if exit_code != 0:
+        logging.error(f"Error running pactl {' '.join(command)}: exit status {exit_code}")
+        return False
+    return True
+
+# Per-kind pactl commands and listing details for the device helpers below
+_KIND = {
+    'sink': {
+        'list': 'sinks',
+        'header': b'Sink #',
+        'get_def': 'get-default-sink',
+        'set_def': 'set-default-sink',
+        'get_vol': 'get-sink-volume',
+        'set_vol': 'set-sink-volume',
+        'get_mute': 'get-sink-mute',
+        'set_mute': 'set-sink-mute',
+    },
+    'source': {
+        'list': 'sources',
+        'header': b'Source #',
+        'get_def': 'get-default-source',
+        'set_def': 'set-default-source',
+        'get_vol': 'get-source-volume',
+        'set_vol': 'set-source-volume',
+        'get_mute': 'get-source-mute',
+        'set_mute': 'set-source-mute',
+    },
+}
+
+def get_default_device(kind):
+    """Get the default sink or source name."""
+    commands = _KIND[kind]
+    default = pulse_call(lambda pulse: getattr(pulse.server_info(), f'default_{kind}_name'))
+    if default is PULSE_UNAVAILABLE:
+        default = cached_pactl([commands['get_def']], str.strip)
+    logging.debug(f"Default {kind}: {default}")
+    if default.lower() == 'pipewire':
+        # Fallback to the first available device
+        devices = list_devices(kind)
+        if devices:
+            default = devices[0]['name']
+            logging.info(f"Default {kind} set to first available {kind}: {default}")
+    return default
+
+def list_devices(kind):
+    """List all sinks or sources with their details."""
+    devices = pulse_call(lambda pulse: [pulse_device_dict(d) for d in getattr(pulse, f'{kind}_list')()])
+    if devices is PULSE_UNAVAILABLE:
+        devices = cached_pactl_list(_KIND[kind]['list'], lambda output: parse_devices(kind, output))
+    return devices
+
+def parse_devices(kind, output):
+    """Parse `pactl list sinks|sources` output (bytes; only the kept values are decoded)."""
+    header = _KIND[kind]['header']
+    devices = []
+    device = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith(header):
+            if device:
+                devices.append(device)
+                device = {}
+            device['index'] = line[len(header):].strip().decode()
+            continue
+        if len(device) == LISTING_FIELDS:
+            continue  # Rest of this block (properties, ports, formats) is not needed
+        key, sep, value = line.partition(b':')
+        if not sep:
+            continue
+        if key == b'Name':
+            device['name'] = value.strip().decode('utf-8', 'replace')
+        elif key == b'Description':
+            device['description'] = value.strip().decode('utf-8', 'replace')
+        elif key == b'Mute':
+            device['mute'] = value.strip() == b'yes'
+        elif key == b'Volume':
+            # First channel (front-left), as get-*-volume reports it
+            match = PERCENT_RE.search(value)
+            if match:
+                device['volume'] = int(match.group(1))
+    if device:
+        devices.append(device)
+    for device in devices:
+        if 'volume' in device:
+            _last_volume[(kind, device.get('name'))] = device['volume']
+        elif (kind, device.get('name')) in _last_volume:
+            device['volume'] = _last_volume[(kind, device.get('name'))]
+    logging.debug(f"Available {_KIND[kind]['list']}: {devices}")
+    return devices
+
+def set_default_device_cmd(kind, name):
+    """Set the default sink or source."""
+    logging.info(f"Setting default {kind} to: {name}")
+    if pulse_call(_pulse_set_default, kind, name) is PULSE_UNAVAILABLE:
+        spawn_pactl([_KIND[kind]['set_def'], name])
+    _pactl_cache.invalidate((_KIND[kind]['get_def'],))
+
+def set_device_volume_cmd(kind, name, volume):
+    """Set the volume for a sink or source (0-100)."""
+    logging.info(f"Setting volume for {kind} {name} to {volume}%")
+    _last_volume[(kind, name)] = volume
+    if pulse_call(_pulse_set_volume, kind, name, volume) is not PULSE_UNAVAILABLE:
+        return
+    _pactl_queue.submit([_KIND[kind]['set_vol'], name, f"{volume}%"], [('list', _KIND[kind]['list'])])
+
+def listed_device(kind, name):
+    """Return the list_devices() entry for name, or None."""
+    for device in list_devices(kind):
+        if device.get('name') == name:
+            return device
+    return None
+
+def get_device_volume_cmd(kind, name):
+    """Get the current volume of a sink or source."""
+    # The (cached) listing already carries the volume; only ask pactl
+    # directly for devices it doesn't show
+    device = listed_device(kind, name)
+    if device is not None and 'volume' in device:
+        return device['volume']
+    output = run_pactl_command([_KIND[kind]['get_vol'], name], text=False)
+    match = VOLUME_RE.search(output)
+    if match:
+        volume = int(match.group(1))
+        logging.debug(f"Volume for {kind} {name}: {volume}%")
+        _last_volume[(kind, name)] = volume
+        return volume
+    logging.warning(f"Could not determine volume for {kind} {name}, keeping the last known value")
+    return _last_volume.get((kind, name), 0)
+
+def get_device_mute_cmd(kind, name):
+    """Get the mute status of a sink or source."""
+    device = listed_device(kind, name)
+    if device is not None and 'mute' in device:
+        return device['mute']
+    output = run_pactl_command([_KIND[kind]['get_mute'], name], text=False)
+    is_muted = _MUTE_YES.search(output) is not None
+    logging.debug(f"Mute status for {kind} {name}: {is_muted}")
+    return is_muted
 
+def set_device_mute_cmd(kind, name, mute):
+    """Set the mute status of a sink or source."""
+    logging.info(f"Setting mute for {kind} {name} to {'mute' if mute else 'unmute'}")
+    if pulse_call(_pulse_set_mute, kind, name, mute) is not PULSE_UNAVAILABLE:
+        return
+    _pactl_queue.submit([_KIND[kind]['set_mute'], name, '1' if mute else '0'], [('list', _KIND[kind]['list'])])
+
+# Named wrappers for the default device and the listings; volume and mute
+# go through the set_device_*_cmd/get_device_*_cmd functions with a kind
 def get_default_sink():
-    """Get the default sink name."""
-    output = run_pactl_command(['get-default-sink'])
-    default_sink = output.strip()
-    logging.debug(f"Default sink: {default_sink}")
-    if default_sink.lower() == 'pipewire':
-        # Fallback to the first available sink
-        sinks = list_sinks()
-        if sinks:
-            default_sink = sinks[0]['name']
-            logging.info(f"Default sink set to first available sink: {default_sink}")
-    return default_sink
+    return get_default_device('sink')
 
 def get_default_source():
-    """Get the default source name."""
-    output = run_pactl_command(['get-default-source'])
-    default_source = output.strip()
-    logging.debug(f"Default source: {default_source}")
-    if default_source.lower() == 'pipewire':
-        # Fallback to the first available source
-        sources = list_sources()
-        if sources:
-            default_source = sources[0]['name']
-            logging.info(f"Default source set to first available source: {default_source}")
-    return default_source
+    return get_default_device('source')
 
 def list_sinks():
-    """List all sinks with their details."""
-    output = run_pactl_command(['list', 'sinks'])
-    sinks = []
-    sink = {}
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith('Sink #'):
-            if sink:
-                sinks.append(sink)
-                sink = {}
-            sink['index'] = line.split('#')[1].strip()
-        elif line.startswith('Name:'):
-            sink['name'] = line.split(':', 1)[1].strip()
-        elif line.startswith('Description:'):
-            sink['description'] = line.split(':', 1)[1].strip()
-    if sink:
-        sinks.append(sink)
-    logging.debug(f"Available Sinks: {sinks}")
-    return sinks
+    return list_devices('sink')
 
 def list_sources():
-    """List all sources with their details."""
-    output = run_pactl_command(['list', 'sources'])
-    sources = []
-    source = {}
+    return list_devices('source')
+
+def set_default_sink_cmd(name):
+    set_default_device_cmd('sink', name)
+
+def set_default_source_cmd(name):
+    set_default_device_cmd('source', name)
+
+class AudioSnapshot:
+    """Sinks, sources and the defaults, read together."""
+
+    def __init__(self, sinks, sources, default_sink, default_source):
+        self.sinks = sinks
+        self.sources = sources
+        self.default_sink = default_sink
+        self.default_source = default_source
+
+def audio_snapshot():
+    """
+    Everything a device refresh needs, gathered once and reused for
+    SNAPSHOT_TTL seconds (or until a pactl event invalidates it), so the
+    refresh paths that run back to back share one set of queries.
+    """
+    snapshot = _pactl_cache.get(SNAPSHOT_KEY, ttl=SNAPSHOT_TTL)
+    if snapshot is None:
+        snapshot = AudioSnapshot(list_sinks(), list_sources(), get_default_sink(), get_default_source())
+        _pactl_cache.put(SNAPSHOT_KEY, snapshot)
+    return snapshot
+
+def parse_card_names(output):
+    """Card names from `pactl list cards` output (bytes)."""
+    names = []
+    # Only each card's Name: line matters; its profiles/ports are skipped
+    in_card_header = False
     for line in output.splitlines():
         line = line.strip()
-        if line.startswith('Source #'):
-            if source:
-                sources.append(source)
-                source = {}
-            source['index'] = line.split('#')[1].strip()
-        elif line.startswith('Name:'):
-            source['name'] = line.split(':', 1)[1].strip()
-        elif line.startswith('Description:'):
-            source['description'] = line.split(':', 1)[1].strip()
-    if source:
-        sources.append(source)
-    logging.debug(f"Available Sources: {sources}")
-    return sources
-
-def set_default_sink_cmd(sink_name):
-    """Set the default sink."""
-    logging.info(f"Setting default sink to: {sink_name}")
-    run_pactl_command(['set-default-sink', sink_name])
-
-def set_default_source_cmd(source_name):
-    """Set the default source."""
-    logging.info(f"Setting default source to: {source_name}")
-    run_pactl_command(['set-default-source', source_name])
-
-def set_sink_volume_cmd(sink_name, volume):
-    """Set the volume for a sink (0-100)."""
-    logging.info(f"Setting volume for sink {sink_name} to {volume}%")
-    run_pactl_command(['set-sink-volume', sink_name, f"{volume}%"])
-
-def set_source_volume_cmd(source_name, volume):
-    """Set the volume for a source (0-100)."""
-    logging.info(f"Setting volume for source {source_name} to {volume}%")
-    run_pactl_command(['set-source-volume', source_name, f"{volume}%"])
-
-def get_sink_volume_cmd(sink_name):
-    """Get the current volume of a sink."""
-    output = run_pactl_command(['get-sink-volume', sink_name])
-    match = re.search(r'front-left:.*?(\d+)%', output)
-    if match:
-        volume = int(match.group(1))
-        logging.debug(f"Volume for sink {sink_name}: {volume}%")
-        return volume
-    logging.warning(f"Could not determine volume for sink {sink_name}")
-    return 0
-
-def get_source_volume_cmd(source_name):
-    """Get the current volume of a source."""
-    output = run_pactl_command(['get-source-volume', source_name])
-    match = re.search(r'front-left:.*?(\d+)%', output)
-    if match:
-        volume = int(match.group(1))
-        logging.debug(f"Volume for source {source_name}: {volume}%")
-        return volume
-    logging.warning(f"Could not determine volume for source {source_name}")
-    return 0
-
-def get_sink_mute_cmd(sink_name):
-    """Get the mute status of a sink."""
-    output = run_pactl_command(['get-sink-mute', sink_name])
-    is_muted = 'yes' in output.lower()
-    logging.debug(f"Mute status for sink {sink_name}: {is_muted}")
-    return is_muted
-
-def get_source_mute_cmd(source_name):
-    """Get the mute status of a source."""
-    output = run_pactl_command(['get-source-mute', source_name])
-    is_muted = 'yes' in output.lower()
-    logging.debug(f"Mute status for source {source_name}: {is_muted}")
-    return is_muted
-
-def set_sink_mute_cmd(sink_name, mute):
-    """Set the mute status of a sink."""
-    logging.info(f"Setting mute for sink {sink_name} to {'mute' if mute else 'unmute'}")
-    run_pactl_command(['set-sink-mute', sink_name, '1' if mute else '0'])
-
-def set_source_mute_cmd(source_name, mute):
-    """Set the mute status of a source."""
-    logging.info(f"Setting mute for source {source_name} to {'mute' if mute else 'unmute'}")
-    run_pactl_command(['set-source-mute', source_name, '1' if mute else '0'])
+        if line.startswith(b'Card #'):
+            # New card section
+            in_card_header = True
+        elif in_card_header:
+            key, sep, value = line.partition(b':')
+            if sep and key == b'Name':
+                in_card_header = False
+                names.append(value.strip().decode('utf-8', 'replace'))
+    return names
+
+def bluez_address(name):
+    """Return the 'aa_bb_cc_dd_ee_ff' address in a BlueZ sink/source name, or None."""
+    for prefix in BLUEZ_DEVICE_PREFIXES:
+        if name.startswith(prefix):
+            address = name[len(prefix):len(prefix) + BLUEZ_ADDR_LEN]
+            return address if len(address) == BLUEZ_ADDR_LEN else None
+    return None
 
 def get_card_for_device(address):
     """Get the card name for a given Bluetooth device address."""
-    output = run_pactl_command(['list', 'cards'])
     card_name = None
-    current_card = None
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith('Card #'):
-            # New card section
-            current_card = line.split('#')[1].rstrip(':')
-        elif line.startswith('Name:') and current_card:
-            name = line.split(':', 1)[1].strip()
-            expected_prefix = f'bluez_card.{address.replace(":", "_").lower()}'
-            if name.startswith(expected_prefix):
-                card_name = name
-                logging.debug(f"Found card {card_name} for address {address}")
-                break
+    expected_prefix = f'bluez_card.{address.replace(":", "_").lower()}'
+    for name in cached_pactl(['list', 'cards'], parse_card_names, text=False):
+        if name.startswith(expected_prefix):
+            card_name = name
+            logging.debug(f"Found card {card_name} for address {address}")
+            break
     if not card_name:
         logging.warning(f"No card found for device address: {address}")
     return card_name
@@ -197,7 +523,224 @@ def get_card_for_device(address):
 def set_card_profile(card_name, profile):
     """Set the profile for a card."""
     logging.info(f"Setting profile for card {card_name} to {profile}")
-    run_pactl_command(['set-card-profile', card_name, profile])
+    spawn_pactl(['set-card-profile', card_name, profile])
+    _pactl_cache.invalidate(('list', 'cards'), ('list', 'sinks'), ('list', 'sources'))
+
+# ------------------------ pactl Event Listener ------------------------
+
+class PactlSubscriber(QtCore.QObject):
+    """
+    Reads `pactl subscribe` and drops cached listings as soon as the server
+    reports a change. `devices_changed` fires when a sink, source or card
+    appears or disappears, or the server's defaults change; `unavailable`
+    fires if pactl subscribe cannot run (or exits).
+
+    The process is driven by a QProcess on the GUI event loop, so there is
+    no reader thread: output is handled when it arrives and costs nothing
+    while idle. A burst of events (a profile switch produces several)
+    is coalesced into one devices_changed 200 ms after the first.
+    """
+    devices_changed = QtCore.pyqtSignal()
+    # (event, facility) for every event, after devices_changed has been handled
+    event_received = QtCore.pyqtSignal(str, str)
+    unavailable = QtCore.pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stopping = False
+        self.process = QtCore.QProcess(self)
+        self.process.setProcessChannelMode(QtCore.QProcess.SeparateChannels)
+        self.process.setStandardErrorFile(QtCore.QProcess.nullDevice())
+        # Event lines are matched in English
+        environment = QtCore.QProcessEnvironment.systemEnvironment()
+        environment.insert('LC_ALL', 'C')
+        environment.insert('LANG', 'C')
+        self.process.setProcessEnvironment(environment)
+        self.process.readyReadStandardOutput.connect(self.read_events)
+        self.process.errorOccurred.connect(self.process_error)
+        self.process.finished.connect(self.process_finished)
+
+        # Events seen since the last flush, in arrival order
+        self._pending_events = []
+        self._device_change_pending = False
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self.flush_events)
+
+    def start(self):
+        self.process.start('pactl', ['subscribe'])
+
+    def read_events(self):
+        while self.process.canReadLine():
+            line = bytes(self.process.readLine()).decode(errors='replace')
+            match = PACTL_EVENT_RE.search(line)
+            if not match:
+                continue
+            event, facility = match.groups()
+            _pactl_cache.invalidate(*PACTL_EVENT_KEYS[facility])
+            # Volume/mute changes arrive as 'change' on sink/source; only
+            # added/removed devices or new defaults need a full refresh
+            if event != 'change' or facility == 'server':
+                logging.info(f"pactl event: {event} on {facility}")
+                self._device_change_pending = True
+            self._pending_events.append((event, facility))
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def flush_events(self):
+        events, self._pending_events = self._pending_events, []
+        if self._device_change_pending:
+            self._device_change_pending = False
+            self.devices_changed.emit()
+        for event, facility in events:
+            self.event_received.emit(event, facility)
+
+    def process_error(self, error):
+        if error == QtCore.QProcess.FailedToStart:
+            logging.error("Could not start pactl subscribe.")
+            self.unavailable.emit()
+
+    def process_finished(self, exit_code, exit_status):
+        if not self.stopping:
+            logging.warning("pactl subscribe exited.")
+            self.unavailable.emit()
+
+    def stop(self):
+        self.stopping = True
+        if self.process.state() != QtCore.QProcess.NotRunning:
+            self.process.terminate()
+            self.process.waitForFinished(1000)
+
+# ------------------------ BlueZ Object Cache ------------------------
+
+class BluezObjectCache:
+    """
+    One GetManagedObjects() snapshot of BlueZ, kept up to date from
+    InterfacesAdded/InterfacesRemoved/PropertiesChanged so the GUI and the
+    workers don't re-fetch the whole object tree. Signal handlers run on the
+    Qt main thread; pool-thread readers get copies taken under the lock.
+    """
+
+    def __init__(self):
+        self._objects = {}
+        # (path, interface name) -> dbus.Interface; each new proxy costs an
+        # Introspect round-trip, so they're made once per object
+        self._interfaces = {}
+        # Address -> device path and the first adapter's path, maintained
+        # alongside _objects so workers don't scan the tree per lookup
+        self._device_path_by_address = {}
+        self._adapter_path = None
+        self._lock = threading.Lock()
+
+    def start(self, bus):
+        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
+                                 'org.freedesktop.DBus.ObjectManager')
+        manager.connect_to_signal('InterfacesAdded', self._on_interfaces_added)
+        manager.connect_to_signal('InterfacesRemoved', self._on_interfaces_removed)
+        bus.add_signal_receiver(
+            self._on_properties_changed,
+            dbus_interface='org.freedesktop.DBus.Properties',
+            signal_name='PropertiesChanged',
+            bus_name='org.bluez',
+            path_keyword='path'
+        )
+        try:
+            objects = manager.GetManagedObjects()
+        except dbus.DBusException as e:
+            logging.error(f"Failed to get BlueZ managed objects: {e}")
+            return
+        with self._lock:
+            for path, interfaces in objects.items():
+                self._objects[str(path)] = {str(iface): dict(props) for iface, props in interfaces.items()}
+                self._index(str(path))
+
+    def devices(self):
+        """Return [(path, Device1 properties)] for every known device."""
+        with self._lock:
+            return [(path, dict(interfaces['org.bluez.Device1']))
+                    for path, interfaces in self._objects.items()
+                    if 'org.bluez.Device1' in interfaces]
+
+    def interface(self, bus, path, name):
+        """Return a cached dbus.Interface for the BlueZ object at path."""
+        key = (str(path), name)
+        with self._lock:
+            interface = self._interfaces.get(key)
+        if interface is None:
+            interface = dbus.Interface(bus.get_object('org.bluez', path), name)
+            with self._lock:
+                self._interfaces[key] = interface
+        return interface
+
+    def device(self, address):
+        """Return (path, Device1 properties) for address, or (None, None)."""
+        with self._lock:
+            path = self._device_path_by_address.get(address)
+            if path is None:
+                return None, None
+            return path, dict(self._objects[path]['org.bluez.Device1'])
+
+    def device_path(self, address):
+        """Return the object path of the device with this address, or None."""
+        with self._lock:
+            return self._device_path_by_address.get(address)
+
+    def adapter_path(self):
+        """Return the path of the first Bluetooth adapter, or None."""
+        with self._lock:
+            return self._adapter_path
+
+    def _index(self, path):
+        # Caller holds the lock
+        interfaces = self._objects.get(path, {})
+        device = interfaces.get('org.bluez.Device1')
+        if device is not None and 'Address' in device:
+            self._device_path_by_address[str(device['Address'])] = path
+        if self._adapter_path is None and 'org.bluez.Adapter1' in interfaces:
+            self._adapter_path = path
+
+    def _reindex(self, path):
+        # Caller holds the lock; drop path's old entries and index it afresh
+        for address in [a for a, p in self._device_path_by_address.items() if p == path]:
+            del self._device_path_by_address[address]
+        if self._adapter_path == path:
+            self._adapter_path = next((p for p, i in self._objects.items()
+                                       if 'org.bluez.Adapter1' in i), None)
+        self._index(path)
+
+    def _on_interfaces_added(self, path, interfaces):
+        with self._lock:
+            entry = self._objects.setdefault(str(path), {})
+            for iface, props in interfaces.items():
+                entry[str(iface)] = dict(props)
+            self._index(str(path))
+
+    def _on_interfaces_removed(self, path, interfaces):
+        with self._lock:
+            entry = self._objects.get(str(path))
+            if entry is None:
+                return
+            for iface in interfaces:
+                entry.pop(str(iface), None)
+            self._reindex(str(path))
+            if not entry:
+                del self._objects[str(path)]
+                for key in [key for key in self._interfaces if key[0] == str(path)]:
+                    del self._interfaces[key]
+
+    def _on_properties_changed(self, interface, changed, invalidated, path):
+        with self._lock:
+            props = self._objects.get(str(path), {}).get(str(interface))
+            if props is None:
+                return
+            props.update(changed)
+            for name in invalidated:
+                props.pop(name, None)
+            if 'Address' in changed:
+                self._reindex(str(path))
+
+_bluez_cache = BluezObjectCache()
 
 # ------------------------ GUI Components ------------------------
 
@@ -209,9 +752,37 @@ class VolumeBar(QtWidgets.QWidget):
         self._volume = 50
         self.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
 
-    def setVolume(self, volume):
-        self._volume = max(0, min(volume, 100))
+        # Dragging produces a move event per pixel; emit volumeChanged at most
+        # every 50 ms with the latest value so pactl isn't run for each one.
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self._flush)
+
+        # Painting state, created once instead of per bar per repaint
+        self._active_brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))  # White for active
+        self._active_pen = QtGui.QPen(QtGui.QColor(255, 255, 255), 1)
+        self._inactive_brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))  # Dark Gray for inactive
+        self._inactive_pen = QtGui.QPen(QtGui.QColor(50, 50, 50), 1)
+        # All bars drawn inactive, rebuilt on resize; see paintEvent()
+        self._inactive_pixmap = None
+
+    def setVolume(self, volume, emit=False):
+        """
+        Show `volume`. Only user-driven changes (emit=True) schedule a
+        volumeChanged; programmatic updates from a device listing must not
+        write the volume back (which would also unmute a muted sink).
+        """
+        volume = max(0, min(volume, 100))
+        if volume == self._volume:
+            # Refreshes re-apply the current volume; skip the repaint and emit
+            return
+        self._volume = volume
         self.update()
+        if emit and not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _flush(self):
         self.volumeChanged.emit(self._volume)
 
     def getVolume(self):
@@ -228,53 +799,95 @@ class VolumeBar(QtWidgets.QWidget):
     def adjustVolume(self, position):
         rect = self.rect()
         new_volume = int((position.x() / rect.width()) * 100)
-        self.setVolume(new_volume)
+        self.setVolume(new_volume, emit=True)
+
+    BAR_COUNT, BAR_SPACING = 15, 4
+
+    def bar_geometry(self):
+        """Return (bar width, distance from one bar's left edge to the next)."""
+        bar_width = (self.width() - (self.BAR_SPACING * (self.BAR_COUNT - 1))) / self.BAR_COUNT
+        return bar_width, bar_width + self.BAR_SPACING
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._rebuild_inactive_pixmap()
+
+    def _rebuild_inactive_pixmap(self):
+        self._inactive_pixmap = QtGui.QPixmap(self.size())
+        self._inactive_pixmap.fill(QtCore.Qt.transparent)
+        bar_width, bar_stride = self.bar_geometry()
+        painter = QtGui.QPainter(self._inactive_pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setBrush(self._inactive_brush)
+        painter.setPen(self._inactive_pen)
+        for i in range(self.BAR_COUNT):
+            painter.drawRoundedRect(int(i * bar_stride), 0, int(bar_width), self.height(), 3, 3)
+        painter.end()
 
     def paintEvent(self, event):
+        if self._inactive_pixmap is None or self._inactive_pixmap.size() != self.size():
+            self._rebuild_inactive_pixmap()
         painter = QtGui.QPainter(self)
-        rect = self.rect()
-        bar_count, bar_spacing = 15, 4
-        bar_width = (rect.width() - (bar_spacing * (bar_count - 1))) / bar_count
-        active_bars = int((self._volume / 100) * bar_count)
-
-        for i in range(bar_count):
-            x = i * (bar_width + bar_spacing)
-            if i < active_bars:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 255)))  # White for active
-                painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255), 1))
-                painter.setRenderHint(QtGui.QPainter.Antialiasing)
-            else:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor(50, 50, 50)))   # Dark Gray for inactive
-                painter.setPen(QtGui.QPen(QtGui.QColor(50, 50, 50), 1))
-
-            painter.drawRoundedRect(int(x), 0, int(bar_width), rect.height(), 3, 3)
+        bar_width, bar_stride = self.bar_geometry()
+        active_bars = int((self._volume / 100) * self.BAR_COUNT)
+        height = self.height()
+
+        # Inactive bars come from the pixmap; copy only the part right of the
+        # active bars so the two never overlap, then draw the active bars
+        if active_bars < self.BAR_COUNT:
+            x = int(active_bars * bar_stride)
+            painter.drawPixmap(x, 0, self._inactive_pixmap, x, 0, self.width() - x, height)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setBrush(self._active_brush)
+        painter.setPen(self._active_pen)
+        for i in range(active_bars):
+            painter.drawRoundedRect(int(i * bar_stride), 0, int(bar_width), height, 3, 3)
 
 class VolumeController(QtWidgets.QWidget):
     devices_updated = QtCore.pyqtSignal()
     bluetooth_devices_updated = QtCore.pyqtSignal()
+    # (address, is_sink, error message or ''), emitted from D-Bus reply handlers
+    bluetooth_connect_finished = QtCore.pyqtSignal(str, bool, str)
 
     def __init__(self):
         super().__init__()
 
         # Initialize audio devices
-        self.sinks = list_sinks()
-        self.sources = list_sources()
-        self.default_sink = get_default_sink()
-        self.default_source = get_default_source()
+        self.apply_snapshot(audio_snapshot())
 
         logging.debug("Connected to PipeWire via pactl.")
 
-        self.is_muted = get_sink_mute_cmd(self.default_sink)
-        self.is_input_muted = get_source_mute_cmd(self.default_source)
+        _, self.is_muted = self.device_state(self.sinks, self.default_sink)
+        _, self.is_input_muted = self.device_state(self.sources, self.default_source)
 
         # Connect the signals to respective slots
         self.devices_updated.connect(self.refresh_audio_devices)
         self.bluetooth_devices_updated.connect(self.refresh_bluetooth_devices)
+        self.bluetooth_connect_finished.connect(self.bluetooth_connect_done)
 
+        # Full refreshes go through _schedule_refresh(), so requests that
+        # overlap run once, at the latest deadline asked for
+        self._refresh_pending = QtCore.QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.timeout.connect(self.refresh_all_devices)
+
+        # Filled in by _bootstrap() once the window is up
+        self._bus = None
+        self._seen_addresses = set()
+        self.pactl_subscriber = None
+
+        self.init_ui()
+
+        # Event listeners and BlueZ work run after the first paint
+        QtCore.QTimer.singleShot(0, self._bootstrap)
+
+    def _bootstrap(self):
         # Start PulseAudio (PipeWire) event listener
         self.start_pulse_event_listener()
 
-        self.init_ui()
+        # Fetch BlueZ objects once and keep them current from D-Bus signals
+        self._bus = dbus.SystemBus()
+        _bluez_cache.start(self._bus)
 
         # Populate Bluetooth devices on initialization
         self.populate_bluetooth_devices()
@@ -393,12 +1006,13 @@ class VolumeController(QtWidgets.QWidget):
         self.device_selector.currentIndexChanged.connect(self.change_sink)
 
         # Output Volume Bar and Label
-        self.label = QtWidgets.QLabel(f'Output Volume: {get_sink_volume_cmd(self.default_sink)}%')
+        volume, _ = self.device_state(self.sinks, self.default_sink)
+        self.label = QtWidgets.QLabel(f'Output Volume: {volume}%')
         self.label.setObjectName("volumeLabel")
         self.label.setAlignment(QtCore.Qt.AlignCenter)
         self.volume_bar = VolumeBar(self)
         self.volume_bar.setFixedHeight(60)
-        self.volume_bar.setVolume(get_sink_volume_cmd(self.default_sink))
+        self.volume_bar.setVolume(volume)
         self.volume_bar.volumeChanged.connect(self.set_volume)
 
         # Input Device Selector
@@ -407,12 +1021,13 @@ class VolumeController(QtWidgets.QWidget):
         self.input_selector.currentIndexChanged.connect(self.change_source)
 
         # Input Volume Bar and Label
-        self.input_label = QtWidgets.QLabel(f'Input Volume: {get_source_volume_cmd(self.default_source)}%')
+        input_volume, _ = self.device_state(self.sources, self.default_source)
+        self.input_label = QtWidgets.QLabel(f'Input Volume: {input_volume}%')
         self.input_label.setObjectName("volumeLabel")
         self.input_label.setAlignment(QtCore.Qt.AlignCenter)
         self.input_volume_bar = VolumeBar(self)
         self.input_volume_bar.setFixedHeight(60)
-        self.input_volume_bar.setVolume(get_source_volume_cmd(self.default_source))
+        self.input_volume_bar.setVolume(input_volume)
         self.input_volume_bar.volumeChanged.connect(self.set_input_volume)
 
         # Assemble Left Layout
@@ -452,7 +1067,7 @@ class VolumeController(QtWidgets.QWidget):
         self.scan_button.clicked.connect(self.start_scan)
         self.pair_button.clicked.connect(self.pair_device)
         self.unpair_button.clicked.connect(self.unpair_device)
-        self.refresh_button.clicked.connect(self.refresh_all_devices)
+        self.refresh_button.clicked.connect(lambda: self._refresh_pending.start(self.REFRESH_DELAY))
 
         # Connect double-click event
         self.device_list.itemDoubleClicked.connect(self.set_bluetooth_device_as_default)
@@ -482,67 +1097,104 @@ class VolumeController(QtWidgets.QWidget):
         qr.moveCenter(cp)
         self.move(qr.topLeft())
 
+    @staticmethod
+    def set_label_text(label, text):
+        """setText() only when the text changed, so refreshes don't relayout the labels."""
+        if label.text() != text:
+            label.setText(text)
+
+    @staticmethod
+    def device_state(devices, device_name):
+        """Return (volume, muted) of a device from a list_sinks()/list_sources() result."""
+        for device in devices:
+            if device['name'] == device_name:
+                return device.get('volume', 0), device.get('mute', False)
+        return 0, False
+
+    # Assigning self.sinks/self.sources rebuilds the name -> description map
+    # and the Bluetooth address -> device name maps
+    @property
+    def sinks(self):
+        return self._sinks
+
+    @sinks.setter
+    def sinks(self, sinks):
+        self._sinks = sinks
+        self._bluez_sink_by_addr = self.bluez_devices_by_address(sinks)
+        self._update_name_to_desc()
+
+    @property
+    def sources(self):
+        return self._sources
+
+    @sources.setter
+    def sources(self, sources):
+        self._sources = sources
+        self._bluez_source_by_addr = self.bluez_devices_by_address(sources)
+        self._update_name_to_desc()
+
+    @staticmethod
+    def bluez_devices_by_address(devices):
+        """Map 'aa_bb_cc_dd_ee_ff' to the first bluez_sink/source name carrying it."""
+        by_address = {}
+        for device in devices:
+            address = bluez_address(device['name'])
+            if address:
+                by_address.setdefault(address, device['name'])
+        return by_address
+
+    def _update_name_to_desc(self):
+        # Sinks win over sources with the same name, as the old linear search did
+        self._name_to_desc = {d['name']: d['description']
+                              for d in getattr(self, '_sources', []) + getattr(self, '_sinks', [])}
+
     def get_device_display_name(self, device_name):
         """Return the description of the device given its name."""
-        for sink in self.sinks:
-            if sink['name'] == device_name:
-                return sink['description']
-        for source in self.sources:
-            if source['name'] == device_name:
-                return source['description']
-        return device_name  # Fallback to device_name if description not found
+        return self._name_to_desc.get(device_name, device_name)  # Fallback to device_name if description not found
+
+    # Controller attributes and label text for each device kind
+    _UI_KIND = {
+        'sink': {'devices': 'sinks', 'default': 'default_sink', 'muted': 'is_muted',
+                 'selector': 'device_selector', 'bar': 'volume_bar', 'label': 'label',
+                 'device_label': 'output_device_label', 'title': 'Output'},
+        'source': {'devices': 'sources', 'default': 'default_source', 'muted': 'is_input_muted',
+                   'selector': 'input_selector', 'bar': 'input_volume_bar', 'label': 'input_label',
+                   'device_label': 'input_device_label', 'title': 'Input'},
+    }
 
     def populate_output_devices(self):
-        self.device_selector.blockSignals(True)
-        self.device_selector.clear()
-        self.sinks = list_sinks()
-        logging.info("Available Output Devices:")
-        # Add pactl sinks
-        for sink in self.sinks:
-            logging.info(f"- {sink['name']}: {sink['description']}")
-            self.device_selector.addItem(sink['description'], {'type': 'sink', 'data': sink})
-        # Set current index to default sink
-        default_sink_name = self.default_sink
-        for index in range(self.device_selector.count()):
-            item_data = self.device_selector.itemData(index)
-            if item_data['type'] == 'sink' and item_data['data']['name'] == default_sink_name:
-                self.device_selector.setCurrentIndex(index)
-                break
-        self.device_selector.blockSignals(False)
+        self._populate_devices('sink')
 
     def populate_input_devices(self):
-        self.input_selector.blockSignals(True)
-        self.input_selector.clear()
-        self.sources = list_sources()
-        logging.info("Available Input Devices:")
-        # Add pactl sources
-        for source in self.sources:
-            logging.info(f"- {source['name']}: {source['description']}")
-            self.input_selector.addItem(source['description'], {'type': 'source', 'data': source})
-        # Set current index to default source
-        default_source_name = self.default_source
-        for index in range(self.input_selector.count()):
-            item_data = self.input_selector.itemData(index)
-            if item_data['type'] == 'source' and item_data['data']['name'] == default_source_name:
-                self.input_selector.setCurrentIndex(index)
+        self._populate_devices('source')
+
+    def _populate_devices(self, kind):
+        ui = self._UI_KIND[kind]
+        selector = getattr(self, ui['selector'])
+        selector.blockSignals(True)
+        selector.clear()
+        devices = getattr(self, ui['devices'])
+        logging.info(f"Available {ui['title']} Devices:")
+        # Add pactl devices
+        for device in devices:
+            logging.info(f"- {device['name']}: {device['description']}")
+            selector.addItem(device['description'], {'type': kind, 'data': device})
+        # Set current index to the default device
+        default_name = getattr(self, ui['default'])
+        for index in range(selector.count()):
+            item_data = selector.itemData(index)
+            if item_data['type'] == kind and item_data['data']['name'] == default_name:
+                selector.setCurrentIndex(index)
                 break
-        self.input_selector.blockSignals(False)
+        selector.blockSignals(False)
 
     def get_paired_bluetooth_devices(self):
         """Retrieve a dictionary of paired Bluetooth devices."""
-        bus = dbus.SystemBus()
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        devices = {}
-        for path, interfaces in objects.items():
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                address = device_properties.get('Address', '')
-                name = device_properties.get('Name', address)
-                paired = device_properties.get('Paired', False)
-                if paired:
-                    devices[address] = name
+        devices = {
+            props.get('Address', ''): props.get('Name', props.get('Address', ''))
+            for _, props in _bluez_cache.devices()
+            if props.get('Paired', False)
+        }
         logging.debug(f"Paired Bluetooth Devices: {devices}")
         return devices
 
@@ -550,6 +1202,8 @@ class VolumeController(QtWidgets.QWidget):
         """Populate the Bluetooth devices list with paired devices."""
         self.device_list.clear()
         paired_devices = self.get_paired_bluetooth_devices()
+        # Addresses currently in device_list, so scan results aren't added twice
+        self._seen_addresses = set(paired_devices)
         for address, name in paired_devices.items():
             item_text = f"{name} [{address}]"
             item = QtWidgets.QListWidgetItem(item_text)
@@ -558,121 +1212,98 @@ class VolumeController(QtWidgets.QWidget):
             logging.info(f"Added paired device to list: {name} [{address}]")
 
     def set_volume(self, value):
-        self.label.setText(f'Output Volume: {value}%')
-        set_sink_volume_cmd(self.default_sink, value)
-        if self.is_muted and value > 0:
-            set_sink_mute_cmd(self.default_sink, False)
-            self.is_muted = False
+        self._set_device_volume('sink', value)
 
     def set_input_volume(self, value):
-        self.input_label.setText(f'Input Volume: {value}%')
-        set_source_volume_cmd(self.default_source, value)
-        if self.is_input_muted and value > 0:
-            set_source_mute_cmd(self.default_source, False)
-            self.is_input_muted = False
+        self._set_device_volume('source', value)
+
+    def _set_device_volume(self, kind, value):
+        ui = self._UI_KIND[kind]
+        getattr(self, ui['label']).setText(f"{ui['title']} Volume: {value}%")
+        name = getattr(self, ui['default'])
+        set_device_volume_cmd(kind, name, value)
+        if getattr(self, ui['muted']) and value > 0:
+            set_device_mute_cmd(kind, name, False)
+            setattr(self, ui['muted'], False)
 
     def change_sink(self, index):
-        item_data = self.device_selector.itemData(index)
-        if item_data:
-            if item_data['type'] == 'sink':
-                selected_sink = item_data['data']
-                if selected_sink:
-                    self.default_sink = selected_sink['name']
-                    set_default_sink_cmd(self.default_sink)
-                    volume = get_sink_volume_cmd(self.default_sink)
-                    self.volume_bar.setVolume(volume)
-                    self.label.setText(f'Output Volume: {volume}%')
-                    self.is_muted = get_sink_mute_cmd(self.default_sink)
-                    
-                    # Update the output device label
-                    self.output_device_label.setText(f"Output Device: {self.get_device_display_name(self.default_sink)}")
-                    
-                    logging.info(f"Default sink changed to {selected_sink['description']}")
+        self._change_device('sink', index)
 
     def change_source(self, index):
-        item_data = self.input_selector.itemData(index)
-        if item_data:
-            if item_data['type'] == 'source':
-                selected_source = item_data['data']
-                if selected_source:
-                    self.default_source = selected_source['name']
-                    set_default_source_cmd(self.default_source)
-                    volume = get_source_volume_cmd(self.default_source)
-                    self.input_volume_bar.setVolume(volume)
-                    self.input_label.setText(f'Input Volume: {volume}%')
-                    self.is_input_muted = get_source_mute_cmd(self.default_source)
-                    
-                    # Update the input device label
-                    self.input_device_label.setText(f"Input Device: {self.get_device_display_name(self.default_source)}")
-                    
-                    logging.info(f"Default source changed to {selected_source['description']}")
+        self._change_device('source', index)
+
+    def _change_device(self, kind, index):
+        ui = self._UI_KIND[kind]
+        item_data = getattr(self, ui['selector']).itemData(index)
+        if item_data and item_data['type'] == kind:
+            selected = item_data['data']
+            if selected:
+                name = selected['name']
+                setattr(self, ui['default'], name)
+                set_default_device_cmd(kind, name)
+                devices = list_devices(kind)
+                setattr(self, ui['devices'], devices)
+                volume, muted = self.device_state(devices, name)
+                setattr(self, ui['muted'], muted)
+                getattr(self, ui['bar']).setVolume(volume)
+                getattr(self, ui['label']).setText(f"{ui['title']} Volume: {volume}%")
+
+                # Update the device label
+                getattr(self, ui['device_label']).setText(f"{ui['title']} Device: {self.get_device_display_name(name)}")
+
+                logging.info(f"Default {kind} changed to {selected['description']}")
 
     def connect_and_set_bluetooth_device(self, address, is_sink=True):
         logging.info(f"Connecting to Bluetooth device {address} and setting as default {'sink' if is_sink else 'source'}")
-        # Attempt to connect the device if not connected
-        bus = dbus.SystemBus()
-        device_path = None
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        for path, interfaces in objects.items():
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                if device_properties.get('Address') == address:
-                    device_path = path
-                    break
+        # Find the device and its connection state in the cached BlueZ objects;
+        # 'Connected' is kept current by PropertiesChanged, so no Get() round-trip
+        device_path, device_properties = _bluez_cache.device(address)
         if device_path:
-            device = dbus.Interface(bus.get_object('org.bluez', device_path),
-                                    'org.bluez.Device1')
-            try:
-                props = dbus.Interface(bus.get_object('org.bluez', device_path), 'org.freedesktop.DBus.Properties')
-                connected = props.Get('org.bluez.Device1', 'Connected')
-            except dbus.DBusException as e:
-                QtWidgets.QMessageBox.warning(self, "Bluetooth Error", f"Failed to get connection status: {e}")
-                logging.error(f"Failed to get connection status for {address}: {e}")
-                return
-
+            connected = bool(device_properties.get('Connected', False))
             if not connected:
-                try:
-                    device.Connect()
-                    logging.info(f"Connected to {address}")
-                    # Wait a bit for the connection to be established
-                    QtCore.QTimer.singleShot(5000, lambda addr=address: self.set_device_as_default_sink_and_source(addr, is_sink=is_sink))
-                except dbus.DBusException as e:
-                    QtWidgets.QMessageBox.warning(self, "Bluetooth Connection Failed", f"Failed to connect to {address}: {e}")
-                    logging.error(f"Failed to connect to {address}: {e}")
+                device = _bluez_cache.interface(self._bus, device_path, 'org.bluez.Device1')
+                # Asynchronous call: the GUI keeps running while BlueZ connects
+                device.Connect(
+                    reply_handler=lambda: self.bluetooth_connect_finished.emit(address, is_sink, ''),
+                    error_handler=lambda e: self.bluetooth_connect_finished.emit(address, is_sink, str(e)))
             else:
                 self.set_device_as_default_sink_and_source(address, is_sink=is_sink)
         else:
             QtWidgets.QMessageBox.warning(self, "Bluetooth Device Not Found", f"Device {address} not found on D-Bus")
             logging.warning(f"Device {address} not found on D-Bus")
 
+    def bluetooth_connect_done(self, address, is_sink, error):
+        if error:
+            QtWidgets.QMessageBox.warning(self, "Bluetooth Connection Failed", f"Failed to connect to {address}: {error}")
+            logging.error(f"Failed to connect to {address}: {error}")
+            return
+        logging.info(f"Connected to {address}")
+        # Wait a bit for the connection to be established
+        QtCore.QTimer.singleShot(5000, lambda addr=address: self.set_device_as_default_sink_and_source(addr, is_sink=is_sink))
+
     def start_scan(self):
         self.device_list.clear()
+        self._seen_addresses = set()
         self.scan_button.setEnabled(False)
-        self.scan_thread = QtCore.QThread()
         self.scan_worker = ScanWorker()
-        self.scan_worker.moveToThread(self.scan_thread)
-        self.scan_worker.devicesFound.connect(self.update_device_list)
-        self.scan_worker.scanFinished.connect(self.scan_finished)
-        self.scan_thread.started.connect(self.scan_worker.start_scan)
-        self.scan_thread.start()
+        self.scan_worker.signals.devicesFound.connect(self.update_device_list)
+        self.scan_worker.signals.scanFinished.connect(self.scan_finished)
+        QtCore.QThreadPool.globalInstance().start(self.scan_worker)
 
     def update_device_list(self, device):
         for address, name in device.items():
-            # Check if the device is already in the list to avoid duplicates
-            existing_items = [self.device_list.item(i).data(QtCore.Qt.UserRole) for i in range(self.device_list.count())]
-            if address not in existing_items:
-                item_text = f"{name} [{address}]"
-                item = QtWidgets.QListWidgetItem(item_text)
-                item.setData(QtCore.Qt.UserRole, address)
-                self.device_list.addItem(item)
-                logging.info(f"Added device to list: {name} [{address}]")
+            # Skip devices already in the list to avoid duplicates
+            if address in self._seen_addresses:
+                continue
+            self._seen_addresses.add(address)
+            item_text = f"{name} [{address}]"
+            item = QtWidgets.QListWidgetItem(item_text)
+            item.setData(QtCore.Qt.UserRole, address)
+            self.device_list.addItem(item)
+            logging.info(f"Added device to list: {name} [{address}]")
 
     def scan_finished(self):
         self.scan_button.setEnabled(True)
-        self.scan_thread.quit()
-        self.scan_thread.wait()
         logging.info("Bluetooth scan finished.")
 
     def pair_device(self):
@@ -681,12 +1312,9 @@ class VolumeController(QtWidgets.QWidget):
             address = selected_item.data(QtCore.Qt.UserRole)
             self.pair_button.setEnabled(False)
             self.unpair_button.setEnabled(False)
-            self.pair_thread = QtCore.QThread()
             self.pair_worker = PairWorker(address)
-            self.pair_worker.moveToThread(self.pair_thread)
-            self.pair_worker.pairingResult.connect(self.pairing_finished)
-            self.pair_thread.started.connect(self.pair_worker.pair)
-            self.pair_thread.start()
+            self.pair_worker.signals.pairingResult.connect(self.pairing_finished)
+            QtCore.QThreadPool.globalInstance().start(self.pair_worker)
 
     def pairing_finished(self, success, message):
         self.pair_button.setEnabled(True)
@@ -697,8 +1325,32 @@ class VolumeController(QtWidgets.QWidget):
             QtCore.QTimer.singleShot(5000, self.set_bluetooth_profile)
         else:
             QtWidgets.QMessageBox.warning(self, "Pairing Failed", message)
-        self.pair_thread.quit()
-        self.pair_thread.wait()
+
+    def wait_for_pactl_event(self, events, timeout_ms, callback):
+        """
+        Call callback(True) once the pactl subscriber reports one of the
+        (event, facility) pairs in events, or callback(False) after
+        timeout_ms. Without a running subscriber only the timeout applies.
+        """
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        subscriber = self.pactl_subscriber
+
+        def finish(arrived):
+            timer.stop()
+            timer.deleteLater()
+            if subscriber is not None:
+                subscriber.event_received.disconnect(on_event)
+            callback(arrived)
+
+        def on_event(event, facility):
+            if (event, facility) in events:
+                finish(True)
+
+        if subscriber is not None:
+            subscriber.event_received.connect(on_event)
+        timer.timeout.connect(lambda: finish(False))
+        timer.start(timeout_ms)
 
     def set_bluetooth_profile(self):
         try:
@@ -711,52 +1363,58 @@ class VolumeController(QtWidgets.QWidget):
                 logging.warning("No recent Bluetooth address found.")
                 return
 
-            pa_address_clean = pa_address.replace(":", "_").lower()
-            card_name = get_card_for_device(pa_address)
-            if not card_name:
-                logging.error(f"No card found for device {pa_address}")
+            self._apply_bluetooth_device(pa_address)
+        except Exception as e:
+            logging.error(f"Failed to set Bluetooth profile: {e}")
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to set Bluetooth profile: {e}")
+
+    def _apply_bluetooth_device(self, address, notify=True):
+        """
+        Switch the device's card to A2DP, then make its sink and source the
+        defaults. With notify, the result is reported in a dialog.
+        """
+        card_name = get_card_for_device(address)
+        if not card_name:
+            logging.error(f"No card found for device {address}")
+            if notify:
                 QtWidgets.QMessageBox.warning(self, "Bluetooth Device Error",
                                               "Failed to find the audio card for the Bluetooth device.")
-                return
+            return
 
-            # Set profile to A2DP Sink
-            A2DP_PROFILE = 'a2dp_sink'
-            set_card_profile(card_name, A2DP_PROFILE)
-            logging.info(f"Set card {card_name} to profile {A2DP_PROFILE}")
+        # Set profile to A2DP Sink
+        A2DP_PROFILE = 'a2dp_sink'
+        set_card_profile(card_name, A2DP_PROFILE)
+        logging.info(f"Set card {card_name} to profile {A2DP_PROFILE}")
 
-            # Allow some time for PipeWire to apply the profile
-            time.sleep(2)
+        # PipeWire announces the profile's sink/source with 'new' events,
+        # which also refresh self.sinks/self.sources via devices_changed
+        self.wait_for_pactl_event({('new', 'sink'), ('new', 'source')}, 2000,
+                                  lambda arrived: self._use_bluetooth_device(address, arrived, notify))
 
-            # Refresh sinks and sources after setting profile
-            self.sinks = list_sinks()
-            self.sources = list_sources()
+    def _use_bluetooth_device(self, address, refreshed, notify):
+        """Second half of _apply_bluetooth_device(), once the profile has applied."""
+        try:
+            pa_address = address.replace(":", "_").lower()
+            if not refreshed:
+                # No event within the timeout: look at the current listings
+                self.sinks = list_sinks()
+                self.sources = list_sources()
 
             # Find the sink and source again
-            sink_name = None
-            source_name = None
-
-            for sink in self.sinks:
-                expected_sink_prefix = f'bluez_sink.{pa_address_clean}'
-                if sink['name'].startswith(expected_sink_prefix):
-                    sink_name = sink['name']
-                    logging.info(f"Matched sink: {sink_name}")
-                    break
-
-            for source in self.sources:
-                expected_source_prefix = f'bluez_source.{pa_address_clean}'
-                if source['name'].startswith(expected_source_prefix):
-                    source_name = source['name']
-                    logging.info(f"Matched source: {source_name}")
-                    break
+            sink_name = self._bluez_sink_by_addr.get(pa_address)
+            source_name = self._bluez_source_by_addr.get(pa_address)
+            if sink_name:
+                logging.info(f"Matched sink: {sink_name}")
+            if source_name:
+                logging.info(f"Matched source: {source_name}")
 
             if sink_name:
                 try:
                     set_default_sink_cmd(sink_name)
                     self.default_sink = sink_name
-                    volume = get_sink_volume_cmd(sink_name)
+                    volume, self.is_muted = self.device_state(self.sinks, sink_name)
                     self.volume_bar.setVolume(volume)
-                    self.label.setText(f'Output Volume: {volume}%')
-                    self.is_muted = get_sink_mute_cmd(sink_name)
+                    self.set_label_text(self.label, f'Output Volume: {volume}%')
                     logging.info(f"Set default sink to {sink_name}")
                 except Exception as e:
                     logging.error(f"Failed to set default sink: {e}")
@@ -766,59 +1424,44 @@ class VolumeController(QtWidgets.QWidget):
                 try:
                     set_default_source_cmd(source_name)
                     self.default_source = source_name
-                    volume = get_source_volume_cmd(source_name)
+                    volume, self.is_input_muted = self.device_state(self.sources, source_name)
                     self.input_volume_bar.setVolume(volume)
-                    self.input_label.setText(f'Input Volume: {volume}%')
-                    self.is_input_muted = get_source_mute_cmd(source_name)
+                    self.set_label_text(self.input_label, f'Input Volume: {volume}%')
                     logging.info(f"Set default source to {source_name}")
                 except Exception as e:
                     logging.error(f"Failed to set default source: {e}")
                     QtWidgets.QMessageBox.warning(self, "PulseAudio Error", f"Failed to set default source: {e}")
 
             # Refresh the device lists
-            self.refresh_audio_devices()
+            self._schedule_refresh()
 
             # Show a dialog box to inform the user
-            if sink_name and source_name:
-                QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                                  "The Bluetooth device has been set as the default input and output device.")
-            elif sink_name:
-                QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                                  "The Bluetooth device has been set as the default output device.")
-            elif source_name:
-                QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                                  "The Bluetooth device has been set as the default input device.")
+            if notify:
+                if sink_name and source_name:
+                    QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
+                                                      "The Bluetooth device has been set as the default input and output device.")
+                elif sink_name:
+                    QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
+                                                      "The Bluetooth device has been set as the default output device.")
+                elif source_name:
+                    QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
+                                                      "The Bluetooth device has been set as the default input device.")
 
             # Additional Wait to ensure PipeWire applies the changes
-            QtCore.QTimer.singleShot(3000, self.refresh_all_devices)
+            self._schedule_refresh(3000)
         except Exception as e:
             logging.error(f"Failed to set Bluetooth profile: {e}")
             QtWidgets.QMessageBox.warning(self, "Error", f"Failed to set Bluetooth profile: {e}")
 
     def get_recent_bluetooth_address(self):
         """Retrieve the most recently connected Bluetooth device's address."""
-        # Iterate through sinks and sources to find the latest bluez_sink/source
-        latest_sink = None
-        latest_source = None
-
-        for sink in self.sinks:
-            if sink['name'].startswith('bluez_sink.'):
-                latest_sink = sink['name']
-
-        for source in self.sources:
-            if source['name'].startswith('bluez_source.'):
-                latest_source = source['name']
-
-        # Extract address from sink/source name
+        # The latest bluez_sink wins, then the latest bluez_source
         address = None
-        if latest_sink:
-            match = re.match(r'bluez_sink\.([0-9a-f_]{17})', latest_sink)
-            if match:
-                address = match.group(1).replace('_', ':')
-        elif latest_source:
-            match = re.match(r'bluez_source\.([0-9a-f_]{17})', latest_source)
-            if match:
-                address = match.group(1).replace('_', ':')
+        for device in (*reversed(self.sinks), *reversed(self.sources)):
+            pa_address = bluez_address(device['name'])
+            if pa_address:
+                address = pa_address.replace('_', ':')
+                break
 
         logging.debug(f"Recent Bluetooth Address: {address}")
         return address
@@ -829,12 +1472,9 @@ class VolumeController(QtWidgets.QWidget):
             address = selected_item.data(QtCore.Qt.UserRole)
             self.pair_button.setEnabled(False)
             self.unpair_button.setEnabled(False)
-            self.unpair_thread = QtCore.QThread()
             self.unpair_worker = UnpairWorker(address)
-            self.unpair_worker.moveToThread(self.unpair_thread)
-            self.unpair_worker.unpairingResult.connect(self.unpairing_finished)
-            self.unpair_thread.started.connect(self.unpair_worker.unpair)
-            self.unpair_thread.start()
+            self.unpair_worker.signals.unpairingResult.connect(self.unpairing_finished)
+            QtCore.QThreadPool.globalInstance().start(self.unpair_worker)
 
     def unpairing_finished(self, success, message):
         self.pair_button.setEnabled(True)
@@ -845,35 +1485,37 @@ class VolumeController(QtWidgets.QWidget):
             self.bluetooth_devices_updated.emit()
         else:
             QtWidgets.QMessageBox.warning(self, "Unpairing Failed", message)
-        self.unpair_thread.quit()
-        self.unpair_thread.wait()
+
+    def apply_snapshot(self, snapshot):
+        self.sinks = snapshot.sinks
+        self.sources = snapshot.sources
+        self.default_sink = snapshot.default_sink
+        self.default_source = snapshot.default_source
 
     def refresh_audio_devices(self):
         logging.info("Refreshing audio devices...")
         try:
-            self.sinks = list_sinks()
-            self.sources = list_sources()
+            # Defaults first, so the selectors select the current devices
+            self.apply_snapshot(audio_snapshot())
             self.populate_output_devices()
             self.populate_input_devices()
-
-            # Update default sink and source after refreshing
-            self.default_sink = get_default_sink()
-            self.default_source = get_default_source()
             logging.info(f"Default sink: {self.default_sink}")
             logging.info(f"Default source: {self.default_source}")
 
             # Update the device name labels
-            self.output_device_label.setText(f"Output Device: {self.get_device_display_name(self.default_sink)}")
-            self.input_device_label.setText(f"Input Device: {self.get_device_display_name(self.default_source)}")
+            self.set_label_text(self.output_device_label,
+                                f"Output Device: {self.get_device_display_name(self.default_sink)}")
+            self.set_label_text(self.input_device_label,
+                                f"Input Device: {self.get_device_display_name(self.default_source)}")
 
-            # Update the volume bars and labels
-            volume = get_sink_volume_cmd(self.default_sink)
+            # Update the volume bars and labels; unchanged values are skipped
+            volume, self.is_muted = self.device_state(self.sinks, self.default_sink)
             self.volume_bar.setVolume(volume)
-            self.label.setText(f'Output Volume: {volume}%')
+            self.set_label_text(self.label, f'Output Volume: {volume}%')
 
-            input_volume = get_source_volume_cmd(self.default_source)
+            input_volume, self.is_input_muted = self.device_state(self.sources, self.default_source)
             self.input_volume_bar.setVolume(input_volume)
-            self.input_label.setText(f'Input Volume: {input_volume}%')
+            self.set_label_text(self.input_label, f'Input Volume: {input_volume}%')
         except Exception as e:
             logging.error(f"Failed to refresh audio devices: {e}")
             QtWidgets.QMessageBox.warning(self, "Error",
@@ -883,6 +1525,16 @@ class VolumeController(QtWidgets.QWidget):
         logging.info("Refreshing Bluetooth devices...")
         self.populate_bluetooth_devices()
 
+    # Default delay of a scheduled full refresh (ms)
+    REFRESH_DELAY = 400
+
+    def _schedule_refresh(self, delay_ms=REFRESH_DELAY):
+        """Run refresh_all_devices() in delay_ms, unless one is already due later."""
+        timer = self._refresh_pending
+        if timer.isActive() and timer.remainingTime() >= delay_ms:
+            return
+        timer.start(delay_ms)
+
     def refresh_all_devices(self):
         self.refresh_audio_devices()
         self.refresh_bluetooth_devices()
@@ -897,53 +1549,66 @@ class VolumeController(QtWidgets.QWidget):
 
     def start_pulse_event_listener(self):
         logging.info("Starting PulseAudio (PipeWire) event listener...")
-        # Start a separate thread to poll for changes
+        self.pactl_subscriber = PactlSubscriber(self)
+        self.pactl_subscriber.devices_changed.connect(self.emit_devices_updated)
+        self.pactl_subscriber.devices_changed.connect(self.emit_bluetooth_devices_updated)
+        self.pactl_subscriber.unavailable.connect(self.start_audio_polling)
+        self.pactl_subscriber.start()
+
+    def start_audio_polling(self):
+        """Fallback for when pactl subscribe is not available."""
+        logging.info("Falling back to polling for audio device changes.")
         self.polling_thread = threading.Thread(target=self.poll_audio_events, daemon=True)
         self.polling_thread.start()
 
+    def closeEvent(self, event):
+        if self.pactl_subscriber is not None:
+            self.pactl_subscriber.stop()
+        super().closeEvent(event)
+
     def poll_audio_events(self):
         """Poll for audio device changes periodically."""
-        previous_sinks = list_sinks()
-        previous_sources = list_sources()
+        # Compare a hash of the names/descriptions only; volume and mute
+        # changes are not device changes
+        def signature():
+            return hash((tuple((d.get('name'), d.get('description')) for d in list_sinks()),
+                         tuple((d.get('name'), d.get('description')) for d in list_sources())))
+        previous_signature = signature()
         poll_interval = 2  # Adjust as needed (seconds)
         while True:
             time.sleep(poll_interval)
-            current_sinks = list_sinks()
-            current_sources = list_sources()
-            if current_sinks != previous_sinks or current_sources != previous_sources:
+            current_signature = signature()
+            if current_signature != previous_signature:
                 logging.info("Audio devices changed detected.")
-                previous_sinks = current_sinks
-                previous_sources = current_sources
+                previous_signature = current_signature
                 QtCore.QMetaObject.invokeMethod(self, 'emit_devices_updated', QtCore.Qt.QueuedConnection)
                 QtCore.QMetaObject.invokeMethod(self, 'emit_bluetooth_devices_updated', QtCore.Qt.QueuedConnection)
 
     def connect_paired_bluetooth_devices(self):
         """Automatically connect to all already paired Bluetooth devices."""
         logging.info("Connecting to all already paired Bluetooth devices...")
-        bus = dbus.SystemBus()
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        for path, interfaces in objects.items():
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                address = device_properties.get('Address', '')
-                name = device_properties.get('Name', address)
-                paired = device_properties.get('Paired', False)
-                connected = device_properties.get('Connected', False)
-                if paired and not connected:
-                    logging.info(f"Attempting to connect to paired device: {name} [{address}]")
-                    try:
-                        device = dbus.Interface(bus.get_object('org.bluez', path),
-                                                'org.bluez.Device1')
-                        device.Connect()
-                        logging.info(f"Connected to {name} [{address}]")
-                        # Wait longer to allow PipeWire to recognize the connection
-                        QtCore.QTimer.singleShot(5000, lambda addr=address: self.set_device_as_default_sink_and_source(addr, is_sink=True))
-                    except dbus.DBusException as e:
-                        logging.error(f"Failed to connect to {name} [{address}]: {e}")
-        # After attempting connections, refresh device lists after delay
-        QtCore.QTimer.singleShot(6000, self.refresh_all_devices)
+        bus = self._bus
+        # Send every Connect() at once; each device is set up as its own reply
+        # arrives, so bring-up takes as long as the slowest connection
+        for path, device_properties in _bluez_cache.devices():
+            address = device_properties.get('Address', '')
+            name = device_properties.get('Name', address)
+            paired = device_properties.get('Paired', False)
+            connected = device_properties.get('Connected', False)
+            if paired and not connected:
+                logging.info(f"Attempting to connect to paired device: {name} [{address}]")
+                device = _bluez_cache.interface(bus, path, 'org.bluez.Device1')
+                device.Connect(
+                    reply_handler=lambda a=address, n=name: self.paired_device_connected(a, n),
+                    error_handler=lambda e, a=address, n=name: logging.error(f"Failed to connect to {n} [{a}]: {e}"),
+                    timeout=CONNECT_TIMEOUT)
+
+    def paired_device_connected(self, address, name):
+        logging.info(f"Connected to {name} [{address}]")
+        # PipeWire adds the device's card shortly after BlueZ connects it;
+        # set the device up once the card shows up (or after 5 seconds)
+        self.wait_for_pactl_event({('new', 'card')}, 5000,
+                                  lambda arrived: self._apply_bluetooth_device(address, notify=False))
 
     def start_dbus_signal_listener(self):
         """Start listening to D-Bus signals for device property changes."""
@@ -962,7 +1627,7 @@ class VolumeController(QtWidgets.QWidget):
         if 'Connected' in changed:
             logging.info(f"Device {path} property 'Connected' changed to {changed['Connected']}")
             # Delay refresh to ensure devices are properly recognized
-            QtCore.QTimer.singleShot(3000, self.refresh_all_devices)
+            self._schedule_refresh(3000)
 
     def set_bluetooth_device_as_default(self, item):
         """Set the double-clicked Bluetooth device as default sink and source."""
@@ -972,119 +1637,45 @@ class VolumeController(QtWidgets.QWidget):
 
     def set_device_as_default_sink_and_source(self, address, is_sink=True):
         """Set the Bluetooth device as the default sink and/or source."""
-        pa_address = address.replace(":", "_").lower()
-        card_name = get_card_for_device(address)
-        if not card_name:
-            logging.error(f"No card found for device {address}")
-            QtWidgets.QMessageBox.warning(self, "Bluetooth Device Error",
-                                          "Failed to find the audio card for the Bluetooth device.")
-            return
-
-        # Set profile to A2DP Sink
-        A2DP_PROFILE = 'a2dp_sink'
-        set_card_profile(card_name, A2DP_PROFILE)
-        logging.info(f"Set card {card_name} to profile {A2DP_PROFILE}")
-
-        # Allow some time for PipeWire to apply the profile
-        time.sleep(2)
-
-        # Refresh sinks and sources after setting profile
-        self.sinks = list_sinks()
-        self.sources = list_sources()
-
-        # Find the sink and source again
-        sink_name = None
-        source_name = None
-
-        for sink in self.sinks:
-            expected_sink_prefix = f'bluez_sink.{pa_address}'
-            if sink['name'].startswith(expected_sink_prefix):
-                sink_name = sink['name']
-                logging.info(f"Matched sink: {sink_name}")
-                break
-
-        for source in self.sources:
-            expected_source_prefix = f'bluez_source.{pa_address}'
-            if source['name'].startswith(expected_source_prefix):
-                source_name = source['name']
-                logging.info(f"Matched source: {source_name}")
-                break
-
-        if sink_name:
-            try:
-                set_default_sink_cmd(sink_name)
-                self.default_sink = sink_name
-                volume = get_sink_volume_cmd(sink_name)
-                self.volume_bar.setVolume(volume)
-                self.label.setText(f'Output Volume: {volume}%')
-                self.is_muted = get_sink_mute_cmd(sink_name)
-                logging.info(f"Set default sink to {sink_name}")
-            except Exception as e:
-                logging.error(f"Failed to set default sink: {e}")
-                QtWidgets.QMessageBox.warning(self, "PulseAudio Error", f"Failed to set default sink: {e}")
-
-        if source_name:
-            try:
-                set_default_source_cmd(source_name)
-                self.default_source = source_name
-                volume = get_source_volume_cmd(source_name)
-                self.input_volume_bar.setVolume(volume)
-                self.input_label.setText(f'Input Volume: {volume}%')
-                self.is_input_muted = get_source_mute_cmd(source_name)
-                logging.info(f"Set default source to {source_name}")
-            except Exception as e:
-                logging.error(f"Failed to set default source: {e}")
-                QtWidgets.QMessageBox.warning(self, "PulseAudio Error", f"Failed to set default source: {e}")
-
-        # Refresh the device lists
-        self.refresh_audio_devices()
-
-        # Show a dialog box to inform the user
-        if sink_name and source_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "The Bluetooth device has been set as the default input and output device.")
-        elif sink_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "The Bluetooth device has been set as the default output device.")
-        elif source_name:
-            QtWidgets.QMessageBox.information(self, "Bluetooth Device Set",
-                                              "The Bluetooth device has been set as the default input device.")
-
-        # Additional Wait to ensure PipeWire applies the changes
-        QtCore.QTimer.singleShot(3000, self.refresh_all_devices)
+        self._apply_bluetooth_device(address)
 
 # ------------------------ Worker Classes ------------------------
 
-class ScanWorker(QtCore.QObject):
+# Longest a scan runs, and how long it may go without finding a new device
+# once it has found one
+SCAN_TIMEOUT = 10
+SCAN_QUIET_PERIOD = 2
+# Longest to wait for BlueZ to finish pairing or connecting (seconds)
+PAIR_TIMEOUT = 30
+CONNECT_TIMEOUT = 30
+
+class ScanSignals(QtCore.QObject):
     devicesFound = QtCore.pyqtSignal(dict)
     scanFinished = QtCore.pyqtSignal()
 
+class ScanWorker(QtCore.QRunnable):
+    """Runs on QThreadPool.globalInstance(); reports through self.signals."""
+
     def __init__(self):
         super().__init__()
+        # The controller keeps a reference to the worker (and its signals)
+        self.setAutoDelete(False)
+        self.signals = ScanSignals()
         self.devices = {}
 
-    @QtCore.pyqtSlot()
-    def start_scan(self):
+    def run(self):
         # Get system bus
         bus = dbus.SystemBus()
 
         # Get the bluez adapter
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        adapter_path = None
-        for path, interfaces in objects.items():
-            if 'org.bluez.Adapter1' in interfaces:
-                adapter_path = path
-                break
+        adapter_path = _bluez_cache.adapter_path()
 
         if adapter_path is None:
             logging.error("Bluetooth adapter not found")
-            self.scanFinished.emit()
+            self.signals.scanFinished.emit()
             return
 
-        adapter = dbus.Interface(bus.get_object('org.bluez', adapter_path),
-                                 'org.bluez.Adapter1')
+        adapter = _bluez_cache.interface(bus, adapter_path, 'org.bluez.Adapter1')
 
         # Start discovery
         try:
@@ -1092,11 +1683,33 @@ class ScanWorker(QtCore.QObject):
             logging.info("Started Bluetooth discovery...")
         except dbus.DBusException as e:
             logging.error(f"Failed to start discovery: {e}")
-            self.scanFinished.emit()
+            self.signals.scanFinished.emit()
             return
 
-        # Wait for devices to be discovered
-        time.sleep(10)  # Increased scan duration for better discovery
+        # Wait for devices to be discovered. InterfacesAdded arrives on the
+        # main thread; stop early once new devices stop showing up.
+        found = threading.Event()
+
+        def on_interfaces_added(path, interfaces):
+            if 'org.bluez.Device1' in interfaces:
+                found.set()
+
+        receiver = bus.add_signal_receiver(on_interfaces_added,
+                                           dbus_interface='org.freedesktop.DBus.ObjectManager',
+                                           signal_name='InterfacesAdded')
+        deadline = time.monotonic() + SCAN_TIMEOUT
+        found_any = False
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if not found.wait(min(remaining, SCAN_QUIET_PERIOD) if found_any else remaining):
+                    break  # Quiet period over, or the scan timed out
+                found.clear()
+                found_any = True
+        finally:
+            receiver.remove()
 
         # Stop discovery
         try:
@@ -1106,118 +1719,104 @@ class ScanWorker(QtCore.QObject):
             logging.error(f"Failed to stop discovery: {e}")
 
         # Get the list of devices
-        objects = manager.GetManagedObjects()
-        for path, interfaces in objects.items():
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                address = device_properties.get('Address', '')
-                name = device_properties.get('Name', address)
-                if address not in self.devices:
-                    self.devices[address] = name
-                    logging.info(f"Found device: {name} [{address}]")
-                    self.devicesFound.emit({address: name})
+        for path, device_properties in _bluez_cache.devices():
+            address = device_properties.get('Address', '')
+            name = device_properties.get('Name', address)
+            if address not in self.devices:
+                self.devices[address] = name
+                logging.info(f"Found device: {name} [{address}]")
+                self.signals.devicesFound.emit({address: name})
 
-        self.scanFinished.emit()
+        self.signals.scanFinished.emit()
 
-class PairWorker(QtCore.QObject):
+class PairSignals(QtCore.QObject):
     pairingResult = QtCore.pyqtSignal(bool, str)
 
+class PairWorker(QtCore.QRunnable):
+    """Runs on QThreadPool.globalInstance(); reports through self.signals."""
+
     def __init__(self, device_address):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = PairSignals()
         self.device_address = device_address
 
-    @QtCore.pyqtSlot()
-    def pair(self):
+    def run(self):
         bus = dbus.SystemBus()
         # Get device path
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        device_path = None
-        for path, interfaces in objects.items():
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                if device_properties.get('Address') == self.device_address:
-                    device_path = path
-                    break
+        device_path = _bluez_cache.device_path(self.device_address)
 
         if device_path is None:
-            self.pairingResult.emit(False, "Device not found")
+            self.signals.pairingResult.emit(False, "Device not found")
             return
 
-        device = dbus.Interface(bus.get_object('org.bluez', device_path),
-                                'org.bluez.Device1')
+        device = _bluez_cache.interface(bus, device_path, 'org.bluez.Device1')
 
         # Set trusted
-        props = dbus.Interface(bus.get_object('org.bluez', device_path),
-                               'org.freedesktop.DBus.Properties')
+        props = _bluez_cache.interface(bus, device_path, 'org.freedesktop.DBus.Properties')
         try:
             props.Set('org.bluez.Device1', 'Trusted', True)
             logging.info("Set device as trusted.")
         except dbus.DBusException as e:
             logging.error(f"Failed to set device as trusted: {e}")
 
-        # Pair and connect
-        try:
-            device.Pair()
-            logging.info("Pairing initiated...")
-            # Wait for pairing to complete
-            time.sleep(5)
-            device.Connect()
+        # Pair and connect asynchronously: the replies arrive on the main
+        # thread and report through the pairingResult signal, so the
+        # pool thread is free again as soon as Pair() has been sent
+        def on_connected(message):
             logging.info("Connected to device.")
-            self.pairingResult.emit(True, "Pairing and connection successful")
-        except dbus.DBusException as e:
+            self.signals.pairingResult.emit(True, message)
+
+        def on_paired():
+            logging.info("Paired with device.")
+            device.Connect(reply_handler=lambda: on_connected("Pairing and connection successful"),
+                           error_handler=lambda e: self.signals.pairingResult.emit(False, str(e)))
+
+        def on_pair_error(e):
             error_name = e.get_dbus_name()
             logging.error(f"Pairing error: {error_name}")
             if error_name == 'org.bluez.Error.AlreadyExists':
-                try:
-                    device.Connect()
-                    logging.info("Device is already paired and connected.")
-                    self.pairingResult.emit(True, "Device is already paired and connected")
-                except dbus.DBusException as conn_e:
-                    self.pairingResult.emit(False, f"Already paired, but failed to connect: {conn_e}")
+                device.Connect(
+                    reply_handler=lambda: on_connected("Device is already paired and connected"),
+                    error_handler=lambda conn_e: self.signals.pairingResult.emit(
+                        False, f"Already paired, but failed to connect: {conn_e}"))
             else:
-                self.pairingResult.emit(False, str(e))
+                self.signals.pairingResult.emit(False, str(e))
+
+        device.Pair(reply_handler=on_paired, error_handler=on_pair_error, timeout=PAIR_TIMEOUT)
+        logging.info("Pairing initiated...")
 
-class UnpairWorker(QtCore.QObject):
+class UnpairSignals(QtCore.QObject):
     unpairingResult = QtCore.pyqtSignal(bool, str)
 
+class UnpairWorker(QtCore.QRunnable):
+    """Runs on QThreadPool.globalInstance(); reports through self.signals."""
+
     def __init__(self, device_address):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = UnpairSignals()
         self.device_address = device_address
 
-    @QtCore.pyqtSlot()
-    def unpair(self):
+    def run(self):
         bus = dbus.SystemBus()
         # Get device path
-        manager = dbus.Interface(bus.get_object('org.bluez', '/'),
-                                 'org.freedesktop.DBus.ObjectManager')
-        objects = manager.GetManagedObjects()
-        adapter_path = None
-        device_path = None
-        for path, interfaces in objects.items():
-            if 'org.bluez.Adapter1' in interfaces:
-                adapter_path = path
-            if 'org.bluez.Device1' in interfaces:
-                device_properties = interfaces['org.bluez.Device1']
-                if device_properties.get('Address') == self.device_address:
-                    device_path = path
-                    break
+        adapter_path = _bluez_cache.adapter_path()
+        device_path = _bluez_cache.device_path(self.device_address)
 
         if device_path is None or adapter_path is None:
-            self.unpairingResult.emit(False, "Device not found")
+            self.signals.unpairingResult.emit(False, "Device not found")
             return
 
-        adapter = dbus.Interface(bus.get_object('org.bluez', adapter_path),
-                                 'org.bluez.Adapter1')
+        adapter = _bluez_cache.interface(bus, adapter_path, 'org.bluez.Adapter1')
 
         try:
             adapter.RemoveDevice(device_path)
             logging.info("Unpaired device successfully.")
-            self.unpairingResult.emit(True, "Unpairing successful")
+            self.signals.unpairingResult.emit(True, "Unpairing successful")
         except dbus.DBusException as e:
             logging.error(f"Failed to unpair device: {e}")
-            self.unpairingResult.emit(False, str(e))
+            self.signals.unpairingResult.emit(False, str(e))
 
 # ------------------------ D-Bus Agent ------------------------
 
@@ -1260,17 +1859,40 @@ class Agent(dbus.service.Object):
 
 # ------------------------ Main Function ------------------------
 
+GLIB_PUMP_INTERVAL = 10  # ms, only used when Qt isn't built on GLib
+
+def attach_glib_context(app):
+    """
+    Make the Qt event loop dispatch the GLib default main context.
+
+    Qt's usual Linux event dispatcher is GLib-based and already iterates the
+    default context, so D-Bus callbacks then run on the Qt thread with no
+    extra work. Otherwise (e.g. QT_NO_GLIB=1) drain the context from a timer.
+    """
+    dispatcher = QtCore.QAbstractEventDispatcher.instance()
+    if dispatcher is not None and 'Glib' in dispatcher.metaObject().className():
+        logging.info("Qt event loop is GLib-based; D-Bus runs on the Qt thread.")
+        return
+    context = GLib.MainContext.default()
+
+    def pump():
+        while context.pending():
+            context.iteration(False)
+
+    app._glib_pump = QtCore.QTimer(app)
+    app._glib_pump.timeout.connect(pump)
+    app._glib_pump.start(GLIB_PUMP_INTERVAL)
+    logging.info("Pumping the GLib main context from a Qt timer.")
+
 def main():
     # Initialize the D-Bus main loop
     DBusGMainLoop(set_as_default=True)
     app = QtWidgets.QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
 
-    # Start the GLib main loop in a separate thread
-    gobject_loop = GLib.MainLoop()
-    gobject_thread = threading.Thread(target=gobject_loop.run, daemon=True)
-    gobject_thread.start()
-    logging.info("GLib main loop started.")
+    # D-Bus signals and async replies are dispatched from the GLib default
+    # context, so let the Qt main loop service it instead of a second loop
+    attach_glib_context(app)
 
     # Create and register the agent
     bus = dbus.SystemBus()
@@ -1309,10 +1931,6 @@ def main():
         logging.info("Agent unregistered.")
     except dbus.DBusException as e:
         logging.error(f"Failed to unregister agent: {e}")
-
-    # Quit the GLib main loop
-    gobject_loop.quit()
-    logging.info("GLib main loop stopped.")
     sys.exit(ret)
 
 if __name__ == '__main__':
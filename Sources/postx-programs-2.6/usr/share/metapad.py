@@ -1,19 +1,43 @@
-from PyQt5.QtCore import (Qt, QRegExp, QRect, QUrl, QSize, pyqtSignal)
+from PyQt5.QtCore import (Qt, QEvent, QRect, QUrl, QSize, QTimer, pyqtSignal)
 from PyQt5.QtGui import (QFont, QIcon, QPainter, QTextCharFormat, QSyntaxHighlighter, 
-                         QTextCursor, QColor, QTextDocument)
+                         QTextCursor, QColor, QTextDocument, QStaticText)
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QPlainTextEdit,
                              QToolBar, QAction, QLabel, QFileDialog, QMessageBox, 
                              QFontDialog, QInputDialog, QDialog, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLineEdit, QCheckBox)
 from PyQt5.QtPrintSupport import QPrintPreviewDialog
-import sys, os
+import sys, os, re
+from contextlib import contextmanager, nullcontext
+
+# Characters read per insertText() call when opening a file
+LOAD_CHUNK_SIZE = 1 << 20
+# Laid-out line numbers kept for the line number area
+LINE_NUMBER_CACHE_SIZE = 1000
+
+def utf16_length(text):
+    """Length of text in UTF-16 code units, as Qt counts positions."""
+    return len(text.encode('utf-16-le')) // 2
 
 # ---- Syntax Highlighter (Optional) ----
 class PythonHighlighter(QSyntaxHighlighter):
-    """A basic Python syntax highlighter."""
-    def __init__(self, parent=None):
+    """
+    A basic Python syntax highlighter. Given the editor, only blocks in its
+    viewport are formatted; the rest are marked pending and formatted when
+    they scroll into view.
+    """
+    # Block states: formatted, or skipped while off screen
+    HIGHLIGHTED = 0
+    PENDING = 1
+
+    def __init__(self, parent=None, editor=None):
         super().__init__(parent)
+        self.editor = editor
+        # Visible block range, reused across an edit burst and reset on
+        # every updateRequest (scroll, resize, repaint)
+        self._visible = None
         self.init_highlighting_rules()
+        if editor is not None:
+            editor.updateRequest.connect(self.highlightPendingBlocks)
 
     def init_highlighting_rules(self):
         # Generic format
@@ -38,29 +62,83 @@ class PythonHighlighter(QSyntaxHighlighter):
             'True', 'try', 'while', 'with', 'yield'
         ]
 
-        self.highlighting_rules = []
-        # Keyword patterns
-        for word in keywords:
-            pattern = r'\b' + word + r'\b'
-            self.highlighting_rules.append((pattern, keyword_format))
+        # (group name, pattern, format) for each token class
+        self.highlighting_rules = [
+            # One alternation for all keywords
+            ('kw', r'\b(?:' + '|'.join(keywords) + r')\b', keyword_format),
+            # Comment (start with # until end of line)
+            ('com', r'#[^\n]*', comment_format),
+            # Single- or double-quoted string; a backslash escapes the next
+            # character. Written as an unrolled loop, so there is only ever
+            # one way to match and unterminated quotes can't backtrack badly
+            ('str', r'\'[^\'\\]*(?:\\.[^\'\\]*)*\'|"[^"\\]*(?:\\.[^"\\]*)*"', string_format),
+        ]
 
-        # Comment pattern (start with # until end of line)
-        self.highlighting_rules.append((r'#[^\n]*', comment_format))
+        # One expression with a named group per class, so a block is scanned
+        # once and the leftmost token wins: a '#' inside a string stays a
+        # string, a quote inside a comment stays a comment
+        self.master = re.compile('|'.join(f'(?P<{name}>{pattern})'
+                                          for name, pattern, _ in self.highlighting_rules))
+        self.group_fmt = {name: fmt for name, _, fmt in self.highlighting_rules}
+
+        # Every token starts with '#', a quote or a keyword's first letter;
+        # blocks with none of them (blank lines, data) skip the tokenizer
+        first_chars = set('#"\'') | {word[0] for word in keywords}
+        self._prefilter = re.compile('[' + re.escape(''.join(sorted(first_chars))) + ']')
+
+    @contextmanager
+    def detached(self):
+        """Leave the document unhighlighted for a bulk edit, then rehighlight once."""
+        document = self.document()
+        self.setDocument(None)
+        try:
+            yield document
+        finally:
+            self.setDocument(document)
+
+    def highlightPendingBlocks(self, rect, dy):
+        # Format the blocks that became visible since they were last seen
+        self._visible = None
+        document = self.document()
+        if document is None:
+            # Detached for a bulk edit; reattaching rehighlights anyway
+            return
+        first, last = self.visibleRange()
+        block = document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            if block.userState() == self.PENDING:
+                self.rehighlightBlock(block)
+            block = block.next()
 
-        # String patterns
-        # Single-quoted string
-        self.highlighting_rules.append((r'\'[^\']*\'', string_format))
-        # Double-quoted string
-        self.highlighting_rules.append((r'\"[^\"]*\"', string_format))
+    def visibleRange(self):
+        if self._visible is None:
+            self._visible = self.editor.visibleBlockRange()
+        return self._visible
 
     def highlightBlock(self, text):
-        for pattern, fmt in self.highlighting_rules:
-            expression = QRegExp(pattern)
-            index = expression.indexIn(text)
-            while index >= 0:
-                length = expression.matchedLength()
-                self.setFormat(index, length, fmt)
-                index = expression.indexIn(text, index + length)
+        if self.editor is not None:
+            first, last = self.visibleRange()
+            if not first <= self.currentBlock().blockNumber() <= last:
+                # Off screen: leave it until it scrolls into view
+                self.setCurrentBlockState(self.PENDING)
+                return
+        self.setCurrentBlockState(self.HIGHLIGHTED)
+        if not self._prefilter.search(text):
+            return
+        # Locals for the per-token loop
+        setFormat = self.setFormat
+        group_fmt = self.group_fmt
+        # setFormat() takes UTF-16 positions; str offsets only match them
+        # while the block has no characters outside the BMP
+        if text.isascii() or max(text) <= '\uffff':
+            for match in self.master.finditer(text):
+                start = match.start()
+                setFormat(start, match.end() - start, group_fmt[match.lastgroup])
+        else:
+            for match in self.master.finditer(text):
+                start = utf16_length(text[:match.start()])
+                length = utf16_length(match.group())
+                setFormat(start, length, group_fmt[match.lastgroup])
 
 
 # ---- Line Number Area ----
@@ -83,24 +161,102 @@ class Metapad(QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.lineNumberArea = QLineNumberArea(self)
+        # Width last given to setViewportMargins()
+        self._last_ln_width = 0
+        self.cacheFontMetrics()
         self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
         self.updateRequest.connect(self.updateLineNumberArea)
         self.updateLineNumberAreaWidth(0)
 
-        # Connect cursor position changes to a method that emits line/col
+        # Connect cursor position changes to a method that emits line/col,
+        # at most once per frame (~16 ms); held arrow keys move it a lot
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self.emitCursorPosition)
         self.cursorPositionChanged.connect(self.onCursorPositionChanged)
 
+        # Plain-text copies of the document for find/replace, dropped on
+        # every edit so repeated searches reuse them
+        self._plain = None
+        self._plain_lower = None
+        self._plain_bmp = None
+        self._plain_revision = -1
+        self.document().contentsChange.connect(self.onContentsChange)
+
+    def onContentsChange(self, position, removed, added):
+        # The highlighter's format-only updates also arrive here, as
+        # removed == added without a new document revision; keep the cache
+        if removed == added and self.document().revision() == self._plain_revision:
+            return
+        self.invalidatePlainText()
+
+    def invalidatePlainText(self):
+        self._plain = None
+        self._plain_lower = None
+        self._plain_bmp = None
+
+    def plainText(self):
+        """toPlainText(), cached until the document changes."""
+        if self._plain is None:
+            self._plain = self.toPlainText()
+            self._plain_revision = self.document().revision()
+        return self._plain
+
+    def searchableText(self, match_case):
+        """
+        Returns the text to search with str.find (lower-cased unless
+        match_case), or None when its str offsets wouldn't be QTextCursor
+        positions: characters outside the BMP take two positions in the
+        document, and some characters change length when lower-cased.
+        """
+        plain = self.plainText()
+        if self._plain_bmp is None:
+            self._plain_bmp = plain.isascii() or utf16_length(plain) == len(plain)
+        if not self._plain_bmp:
+            return None
+        if match_case:
+            return plain
+        if self._plain_lower is None:
+            lower = plain.lower()
+            # False marks a copy whose offsets can't be used
+            self._plain_lower = lower if len(lower) == len(plain) else False
+        return self._plain_lower if self._plain_lower is not False else None
+
+    def cacheFontMetrics(self):
+        # Digit width and line height for the line number area; refreshed
+        # on font changes instead of being measured on every paint
+        metrics = self.fontMetrics()
+        self._digit_w = metrics.horizontalAdvance('9')
+        self._line_h = metrics.height()
+        # Line number -> (QStaticText, width, offset), laid out once per font
+        self._static_numbers = {}
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self.cacheFontMetrics()
+            self.updateLineNumberAreaWidth(0)
+
+    def visibleBlockRange(self):
+        """Block numbers from the first visible block to the last one that can fit."""
+        first = self.firstVisibleBlock().blockNumber()
+        # Every block is at least one line tall, so this never falls short
+        return first, first + self.viewport().height() // max(1, self._line_h) + 1
+
     def lineNumberAreaWidth(self):
-        digits = 1
-        max_value = max(1, self.blockCount())
-        while max_value >= 10:
-            max_value //= 10
-            digits += 1
-        space = 3 + self.fontMetrics().width('9') * digits
+        digits = len(str(max(1, self.blockCount())))
+        space = 3 + self._digit_w * digits
         return space
 
     def updateLineNumberAreaWidth(self, _):
-        self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
+        # blockCountChanged fires for every block a paste or file load adds,
+        # but the margin only moves when the digit count does
+        width = self.lineNumberAreaWidth()
+        if width == self._last_ln_width:
+            return
+        self._last_ln_width = width
+        self.setViewportMargins(width, 0, 0, 0)
 
     def updateLineNumberArea(self, rect, dy):
         if dy:
@@ -126,19 +282,39 @@ class Metapad(QPlainTextEdit):
         blockNumber = block.blockNumber()
         top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
         bottom = top + self.blockBoundingRect(block).height()
-        height = self.fontMetrics().height()
-
-        while block.isValid() and (top <= event.rect().bottom()):
-            number = str(blockNumber + 1)
-            painter.setPen(Qt.black)
-            painter.drawText(0, top, self.lineNumberArea.width(), height, 
-                             Qt.AlignCenter, number)
+        width = self.lineNumberArea.width()
+        bottom_limit = event.rect().bottom()
+        numbers = self._static_numbers
+        painter.setPen(Qt.black)
+
+        while block.isValid() and (top <= bottom_limit):
+            # Centered like drawText(..., Qt.AlignCenter, number), but the
+            # number's text, layout and offsets are reused from earlier paints
+            number = blockNumber + 1
+            static, number_width, dy = numbers.get(number) or self.staticLineNumber(number)
+            painter.drawStaticText(int((width - number_width) / 2), int(top + dy), static)
             block = block.next()
             top = int(bottom)
             bottom = top + self.blockBoundingRect(block).height()
             blockNumber += 1
 
+    def staticLineNumber(self, number):
+        """Lay out a line number: (QStaticText, its width, vertical offset in the line)."""
+        if len(self._static_numbers) >= LINE_NUMBER_CACHE_SIZE:
+            self._static_numbers.clear()
+        static = QStaticText(str(number))
+        static.setTextFormat(Qt.PlainText)
+        static.prepare(font=self.lineNumberArea.font())
+        size = static.size()
+        entry = (static, size.width(), (self._line_h - size.height()) / 2)
+        self._static_numbers[number] = entry
+        return entry
+
     def onCursorPositionChanged(self):
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def emitCursorPosition(self):
         # Emit current line and column.
         # Calculate column as the difference between the cursor's absolute position and the block's position.
         cursor = self.textCursor()
@@ -149,9 +325,10 @@ class Metapad(QPlainTextEdit):
 
 # ---- Find & Replace Dialog ----
 class FindReplaceDialog(QDialog):
-    def __init__(self, parent=None, editor=None):
+    def __init__(self, parent=None, editor=None, highlighter=None):
         super().__init__(parent)
         self.editor = editor
+        self.highlighter = highlighter
         self.setWindowTitle("Find & Replace")
         self.setModal(False)
         self.setupUI()
@@ -206,13 +383,36 @@ class FindReplaceDialog(QDialog):
 
     def find_next(self):
         text = self.find_input.text()
-        if text:
-            if not self.editor.find(text, self.find_flags()):
-                # If not found, move cursor to start and try again
-                cursor = self.editor.textCursor()
-                cursor.movePosition(QTextCursor.Start)
-                self.editor.setTextCursor(cursor)
-                self.editor.find(text, self.find_flags())
+        if not text:
+            return
+        haystack = self.editor.searchableText(self.match_case_checkbox.isChecked())
+        if haystack is None:
+            self.document_find_next(text)
+            return
+        needle = text if self.match_case_checkbox.isChecked() else text.lower()
+        cursor = self.editor.textCursor()
+        index = haystack.find(needle, cursor.selectionEnd())
+        if index < 0:
+            # If not found, wrap around to the start
+            index = haystack.find(needle)
+        if index >= 0:
+            cursor.setPosition(index)
+            cursor.setPosition(index + len(needle), QTextCursor.KeepAnchor)
+            self.editor.setTextCursor(cursor)
+            self.editor.ensureCursorVisible()
+
+    def document_find_next(self, text):
+        """find_next() through QTextDocument.find, for text str.find can't map."""
+        # QTextDocument.find returns a cursor without touching the editor's,
+        # so the editor cursor is only set once, on a hit
+        document = self.editor.document()
+        found = document.find(text, self.editor.textCursor(), self.find_flags())
+        if found.isNull():
+            # If not found, wrap around to the start
+            found = document.find(text, 0, self.find_flags())
+        if not found.isNull():
+            self.editor.setTextCursor(found)
+            self.editor.ensureCursorVisible()
 
     def replace_one(self):
         text_find = self.find_input.text()
@@ -237,22 +437,42 @@ class FindReplaceDialog(QDialog):
         if not text_find:
             return
 
-        # Move cursor to the start
-        cursor = self.editor.textCursor()
-        cursor.movePosition(QTextCursor.Start)
-        self.editor.setTextCursor(cursor)
-
-        count = 0
-        while self.editor.find(text_find, self.find_flags()):
-            cursor = self.editor.textCursor()
-            cursor.insertText(text_replace)
-            count += 1
+        # Replace in the plain text in one go, then swap the document
+        # contents once instead of a find/insert round-trip per match
+        flags = 0 if self.match_case_checkbox.isChecked() else re.IGNORECASE
+        pattern = re.compile(re.escape(text_find), flags)
+        plain = self.editor.plainText()
+        new_text, count = pattern.subn(lambda match: text_replace, plain)
+
+        if count:
+            # Where the cursor and view were, so the rewrite doesn't jump
+            # to the end of the document
+            position = self.editor.textCursor().position()
+            if self.editor.searchableText(True) is not None:
+                # Offsets are cursor positions: shift by the matches before it
+                before = len(pattern.findall(plain, 0, position))
+                position += before * (len(text_replace) - len(text_find))
+            scroll = self.editor.verticalScrollBar().value()
+
+            # Select-all + insertText keeps this a single undo step
+            with self.highlighter.detached() if self.highlighter else nullcontext():
+                cursor = self.editor.textCursor()
+                cursor.beginEditBlock()
+                cursor.select(QTextCursor.Document)
+                cursor.insertText(new_text)
+                cursor.setPosition(min(position, self.editor.document().characterCount() - 1))
+                cursor.endEditBlock()
+                self.editor.setTextCursor(cursor)
+            self.editor.verticalScrollBar().setValue(scroll)
 
         QMessageBox.information(self, "Replace All", f"Replaced {count} occurrence(s).")
 
 
 # ---- MainWindow ----
 class MainWindow(QMainWindow):
+    ICON_NAMES = ("document-open", "edit-undo", "edit-redo", "document-save",
+                  "document-print", "preferences-desktop-font", "application-exit")
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Metapad")
@@ -265,51 +485,54 @@ class MainWindow(QMainWindow):
         self.resize(800, 600)
 
         # (Optional) Syntax highlighting for Python
-        self.highlighter = PythonHighlighter(self.metapad.document())
+        self.highlighter = PythonHighlighter(self.metapad.document(), self.metapad)
 
         # Create main toolbar
         self.toolbar = QToolBar("Main Toolbar")
         self.addToolBar(self.toolbar)
 
+        # Theme icons, looked up together once
+        self._icons = {name: QIcon.fromTheme(name) for name in self.ICON_NAMES}
+
         # -------- Add actions to the toolbar --------
         # Open
-        open_icon = QIcon.fromTheme("document-open")
+        open_icon = self._icons["document-open"]
         open_action = QAction(open_icon, 'Open', self)
         open_action.triggered.connect(self.openFile)
         self.toolbar.addAction(open_action)
 
         # Undo
-        undo_icon = QIcon.fromTheme("edit-undo")
+        undo_icon = self._icons["edit-undo"]
         undo_action = QAction(undo_icon, 'Undo', self)
         undo_action.triggered.connect(self.undo)
         self.toolbar.addAction(undo_action)
 
         # Redo
-        redo_icon = QIcon.fromTheme("edit-redo")
+        redo_icon = self._icons["edit-redo"]
         redo_action = QAction(redo_icon, 'Redo', self)
         redo_action.triggered.connect(self.redo)
         self.toolbar.addAction(redo_action)
 
         # Save
-        save_icon = QIcon.fromTheme("document-save")
+        save_icon = self._icons["document-save"]
         save_action = QAction(save_icon, 'Save', self)
         save_action.triggered.connect(self.saveFile)
         self.toolbar.addAction(save_action)
 
         # Print
-        print_icon = QIcon.fromTheme("document-print")
+        print_icon = self._icons["document-print"]
         print_action = QAction(print_icon, 'Print', self)
         print_action.triggered.connect(self.printing)
         self.toolbar.addAction(print_action)
 
         # Font
-        font_icon = QIcon.fromTheme("preferences-desktop-font")
+        font_icon = self._icons["preferences-desktop-font"]
         font_action = QAction(font_icon, 'Font', self)
         font_action.triggered.connect(self.changeFont)
         self.toolbar.addAction(font_action)
 
         # Exit
-        close_icon = QIcon.fromTheme("application-exit")
+        close_icon = self._icons["application-exit"]
         close_action = QAction(close_icon, 'Exit', self)
         close_action.triggered.connect(self.close)
         self.toolbar.addAction(close_action)
@@ -443,7 +666,7 @@ class MainWindow(QMainWindow):
 
     def openFindReplaceDialog(self):
         if not self.find_replace_dialog:
-            self.find_replace_dialog = FindReplaceDialog(self, self.metapad)
+            self.find_replace_dialog = FindReplaceDialog(self, self.metapad, self.highlighter)
         self.find_replace_dialog.show()
         self.find_replace_dialog.raise_()
         self.find_replace_dialog.activateWindow()
@@ -496,14 +719,34 @@ class MainWindow(QMainWindow):
                                                    "If unsure press Cancel now.",
                                                    QMessageBox.Cancel | QMessageBox.Ok)
                 if buttonReply == QMessageBox.Ok:
-                    with open(fileName, 'r', encoding='utf-8', errors='ignore') as f:
-                        alltxt = f.read()
-                        self.metapad.setPlainText(alltxt)
+                    self.loadFile(fileName)
                     filename = os.path.basename(fileName)
                     self.address.setText('Now viewing: ' + filename)
         except Exception as e:
             print("Cannot handle, Will not continue. Error:", e)
 
+    def loadFile(self, fileName):
+        """
+        Read the file in chunks straight into the document, so only one chunk
+        exists as a Python str at a time, with the highlighter detached until
+        the whole text is in.
+        """
+        with open(fileName, 'r', encoding='utf-8', errors='ignore') as f, \
+                self.highlighter.detached() as document:
+            # Like setPlainText(): the load itself is not an undo step
+            document.setUndoRedoEnabled(False)
+            cursor = QTextCursor(document)
+            cursor.beginEditBlock()
+            try:
+                cursor.select(QTextCursor.Document)
+                cursor.removeSelectedText()
+                for chunk in iter(lambda: f.read(LOAD_CHUNK_SIZE), ''):
+                    cursor.insertText(chunk)
+            finally:
+                cursor.endEditBlock()
+                document.setUndoRedoEnabled(True)
+        self.metapad.moveCursor(QTextCursor.Start)
+
     def saveFile(self):
         try:
             options = QFileDialog.Options()
@@ -518,7 +761,15 @@ class MainWindow(QMainWindow):
                                                       options=options)
             if fileName:
                 with open(fileName, 'w', encoding='utf-8') as f:
-                    f.write(self.metapad.toPlainText())
+                    # Write block by block instead of building toPlainText();
+                    # like toPlainText(), Shift+Enter line separators (U+2028)
+                    # inside a block are saved as newlines
+                    block = self.metapad.document().begin()
+                    while block.isValid():
+                        f.write(block.text().replace('\u2028', '\n'))
+                        block = block.next()
+                        if block.isValid():
+                            f.write('\n')
                 filename = os.path.basename(fileName)
                 self.address.setText('Now viewing: ' + filename)
         except Exception as e:
@@ -20,22 +20,31 @@ to create, enable, and start a user service so that the OSD launches automatical
 
 Requirements:
   - python3-evdev, python3-pyqt5, pulseaudio-utils (or PipeWire's pactl equivalent)
+  - Optional: python3-pulsectl, to talk to PulseAudio without running pactl
   - Set KEYBOARD_DEVICE to the correct event (use `sudo evtest` to check which /dev/input/eventX carries your media keys)
   - Your user must be in the 'input' group (e.g., sudo gpasswd -a $USER input, then log out/in)
 """
 
 import sys
 import os
+import re
+import logging
 import threading
 import subprocess
+import struct
 import time
-from evdev import InputDevice, ecodes, categorize
+from evdev import ecodes
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
+try:
+    import pulsectl  # Optional: talk to libpulse in-process instead of running pactl
+except ImportError:
+    pulsectl = None
+
+from PyQt5.QtCore import Qt, QTimer, QSocketNotifier, QPoint
 from PyQt5.QtGui import QPalette, QColor
 from PyQt5.QtWidgets import (
     QApplication, QStyleFactory, QWidget, QVBoxLayout,
-    QLabel, QProgressBar, QDesktopWidget
+    QLabel, QProgressBar
 )
 
 # -------------------------- #
@@ -48,14 +57,12 @@ KEYBOARD_DEVICE = "/dev/input/event2"
 # Volume step (in percent) for each volume increment/decrement
 VOLUME_STEP = 5
 
-# A global stylesheet for a cyberpunk look
-CYBERPUNK_GLOBAL_STYLESHEET = """
-* {
-    background-color: #121212;
-    color: #00ffff;
-    selection-background-color: #00ffff;
-    selection-color: #121212;
-}
+# Set to logging.DEBUG to log every key press and volume change
+LOG_LEVEL = logging.INFO
+
+# Cyberpunk look for the progress bar. Colors of everything else come from
+# the palette in main(), so Qt's stylesheet engine only runs for this widget.
+PROGRESS_BAR_STYLESHEET = """
 QProgressBar {
     border: 2px solid #00ffff;
     border-radius: 4px;
@@ -69,71 +76,414 @@ QProgressBar::chunk {
 }
 """
 
+log = logging.getLogger("osd")
+
 # ------------------------ #
 #   VOLUME CONTROL HELPERS #
 # ------------------------ #
 
-def get_system_volume() -> int:
+# Returned by pulse_call() when pulsectl can't be used; callers then use pactl
+PULSE_UNAVAILABLE = object()
+
+_pulse = None
+_pulse_lock = threading.Lock()
+
+def pulse_call(func, *args):
+    """
+    Run func(pulse, *args) on the shared pulsectl connection, serialized
+    by a lock (pulsectl is not thread-safe). Only failing to connect turns
+    pulsectl off for the session; a lost connection is re-opened on the
+    next call, and any other failure falls back to pactl for that call.
+    """
+    global _pulse, pulsectl
+    if pulsectl is None:
+        return PULSE_UNAVAILABLE
+    with _pulse_lock:
+        if _pulse is None:
+            try:
+                _pulse = pulsectl.Pulse("volume-osd")
+            except pulsectl.PulseError as e:
+                log.error("Could not connect with pulsectl, using pactl from now on: %s", e)
+                pulsectl = None
+                return PULSE_UNAVAILABLE
+        try:
+            return func(_pulse, *args)
+        except pulsectl.PulseIndexError as e:
+            # No (such) default sink yet, e.g. at login before one appears
+            log.warning("pulsectl: no default sink: %s", e)
+            return PULSE_UNAVAILABLE
+        except pulsectl.PulseDisconnected as e:
+            log.error("pulsectl connection lost, reconnecting on next call: %s", e)
+            _pulse.close()
+            _pulse = None
+            return PULSE_UNAVAILABLE
+        except pulsectl.PulseError as e:
+            log.error("pulsectl call failed, using pactl for it: %s", e)
+            return PULSE_UNAVAILABLE
+
+# Resolved default sink name and when it was resolved. Dropped by the
+# PulseState watcher on server change events, and re-resolved after
+# DEFAULT_SINK_TTL seconds in case that watcher isn't running.
+DEFAULT_SINK_TTL = 5.0
+_default_sink = (None, 0.0)
+
+def _cached_default_sink():
+    name, resolved_at = _default_sink
+    if name is not None and time.monotonic() - resolved_at < DEFAULT_SINK_TTL:
+        return name
+    return None
+
+def _store_default_sink(name):
+    global _default_sink
+    _default_sink = (name, time.monotonic())
+    return name
+
+def invalidate_default_sink():
+    global _default_sink
+    _default_sink = (None, 0.0)
+
+def pactl_default_sink() -> str:
+    """
+    Name of the default sink for pactl argv, resolved with
+    `pactl get-default-sink` at most once per TTL. Falls back to
+    @DEFAULT_SINK@ if that doesn't work (older pactl).
+    """
+    name = _cached_default_sink()
+    if name is not None:
+        return name
+    try:
+        name = subprocess.check_output(
+            ["pactl", "get-default-sink"],
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        name = ""
+    return _store_default_sink(name or "@DEFAULT_SINK@")
+
+def _pulse_default_sink(pulse):
+    name = _cached_default_sink()
+    if name is not None:
+        try:
+            return pulse.get_sink_by_name(name)
+        except pulsectl.PulseIndexError:
+            # Sink went away before the server change event arrived
+            pass
+    name = _store_default_sink(pulse.server_info().default_sink_name)
+    return pulse.get_sink_by_name(name)
+
+def _pulse_volume(pulse):
+    return max(0, min(100, round(_pulse_default_sink(pulse).volume.value_flat * 100)))
+
+def _pulse_muted(pulse):
+    return bool(_pulse_default_sink(pulse).mute)
+
+def _pulse_sink_state(pulse):
+    sink = _pulse_default_sink(pulse)
+    return (max(0, min(100, round(sink.volume.value_flat * 100))),
+            bool(sink.mute))
+
+def _pulse_set_volume(pulse, volume):
+    pulse.volume_set_all_chans(_pulse_default_sink(pulse), volume / 100)
+
+def _pulse_toggle_mute(pulse):
+    sink = _pulse_default_sink(pulse)
+    pulse.mute(sink, not sink.mute)
+    return not sink.mute
+
+# Long-lived `pacmd` child that takes volume/mute writes on stdin, so key
+# presses don't fork pactl. None until first use, False when unusable.
+_pacmd = None
+
+def _start_pacmd():
+    # pacmd only talks to a real PulseAudio daemon, not pipewire-pulse
+    try:
+        # C locale: the "Server Name" label is translated otherwise
+        info = subprocess.check_output(
+            ["pactl", "info"],
+            env=dict(os.environ, LC_ALL="C")
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    if b"Server Name: pulseaudio" not in info:
+        return False
+    try:
+        return subprocess.Popen(
+            ["pacmd"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError:
+        return False
+
+def pacmd_command(command: str) -> bool:
+    """
+    Send one command line to the pacmd coprocess. Returns False if there
+    is none, and the caller should run pactl instead.
+    """
+    global _pacmd
+    if _pacmd is None:
+        _pacmd = _start_pacmd()
+    if _pacmd is False:
+        return False
+    if _pacmd.poll() is None:
+        try:
+            _pacmd.stdin.write(command.encode() + b"\n")
+            _pacmd.stdin.flush()
+            return True
+        except OSError:
+            pass
+    log.error("pacmd exited, running pactl per command from now on")
+    _pacmd = False
+    return False
+
+def query_system_volume() -> int:
     """
     Query the default PulseAudio sink for its volume (0..100).
     """
+    volume = pulse_call(_pulse_volume)
+    if volume is not PULSE_UNAVAILABLE:
+        return volume
     try:
         output = subprocess.check_output(
-            ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
-            text=True
+            ["pactl", "get-sink-volume", pactl_default_sink()]
         )
-        for part in output.split():
-            if part.endswith("%"):
-                try:
-                    vol = int(part.strip("%"))
-                    return max(0, min(100, vol))
-                except ValueError:
-                    pass
-        return 0
     except subprocess.CalledProcessError:
         return 0
+    # "Volume: front-left: 32768 /  50% / -18.06 dB, ..." -> first channel
+    end = output.find(b"%")
+    if end < 0:
+        return 0
+    start = output.rfind(b" ", 0, end) + 1
+    try:
+        return max(0, min(100, int(output[start:end])))
+    except ValueError:
+        return 0
+
+def query_system_muted() -> bool:
+    """
+    Ask PulseAudio whether the default sink is muted.
+    """
+    muted = pulse_call(_pulse_muted)
+    if muted is not PULSE_UNAVAILABLE:
+        return muted
+    try:
+        output = subprocess.check_output(
+            ["pactl", "get-sink-mute", pactl_default_sink()]
+        )
+        return b"yes" in output
+    except subprocess.CalledProcessError:
+        return False
+
+# Lines of a `pactl list sinks` stanza (run with LC_ALL=C)
+SINK_VOLUME_RE = re.compile(rb"^\s*Volume: [^\n]*?(\d+)%", re.MULTILINE)
+SINK_MUTE_RE = re.compile(rb"^\s*Mute: (yes|no)$", re.MULTILINE)
+
+def _pactl_list_sink_state(sink: str):
+    """
+    (volume, muted) of the named sink from one `pactl list sinks`, or None.
+    """
+    try:
+        output = subprocess.check_output(
+            ["pactl", "list", "sinks"],
+            env=dict(os.environ, LC_ALL="C")
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    start = output.find(b"\tName: " + sink.encode() + b"\n")
+    if start < 0:
+        return None
+    end = output.find(b"\nSink #", start)
+    stanza = output[start:end] if end >= 0 else output[start:]
+    volume = SINK_VOLUME_RE.search(stanza)
+    muted = SINK_MUTE_RE.search(stanza)
+    if volume is None or muted is None:
+        return None
+    return max(0, min(100, int(volume.group(1)))), muted.group(1) == b"yes"
+
+def query_sink_state() -> tuple:
+    """
+    Query (volume, muted) of the default sink in one round trip where
+    possible: one pulsectl lookup, or one `pactl list sinks`.
+    """
+    state = pulse_call(_pulse_sink_state)
+    if state is not PULSE_UNAVAILABLE:
+        return state
+    sink = pactl_default_sink()
+    if sink != "@DEFAULT_SINK@":
+        # `pactl list` can't resolve @DEFAULT_SINK@ itself
+        state = _pactl_list_sink_state(sink)
+        if state is not None:
+            return state
+    return query_system_volume(), query_system_muted()
+
+class PulseState:
+    """
+    Cached (volume, muted) of the default sink. A daemon thread listens
+    for sink/server change events (on its own pulsectl connection, or one
+    long-lived `pactl subscribe` child) and only then re-queries, so the key
+    handlers never wait for a query. If the event source goes away (e.g. a
+    PulseAudio/PipeWire restart) it is reconnected with backoff and the
+    cache re-queried.
+    """
+    # Seconds between reconnect attempts, doubling up to the maximum
+    RETRY_MIN = 1.0
+    RETRY_MAX = 30.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = query_sink_state()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    @property
+    def volume(self) -> int:
+        return self._state[0]
+
+    @property
+    def muted(self) -> bool:
+        return self._state[1]
+
+    def update(self, volume=None, muted=None):
+        """
+        Store new values optimistically, right after writing them to pactl.
+        """
+        with self._lock:
+            old_volume, old_muted = self._state
+            self._state = (old_volume if volume is None else volume,
+                           old_muted if muted is None else muted)
+
+    def refresh(self):
+        volume, muted = query_sink_state()
+        with self._lock:
+            self._state = (volume, muted)
+
+    def _watch(self):
+        delay = self.RETRY_MIN
+        while True:
+            started = time.monotonic()
+            try:
+                # pulse_call() may drop the module global after a failure,
+                # and then pactl subscribe takes over
+                if pulsectl is not None:
+                    self._watch_pulse(pulsectl)
+                else:
+                    self._watch_pactl()
+            except Exception as e:
+                log.error("Audio event watcher failed: %s", e)
+            if time.monotonic() - started > self.RETRY_MAX:
+                # It ran fine for a while; start backing off afresh
+                delay = self.RETRY_MIN
+            log.warning("Audio event watcher stopped, reconnecting in %.0f s", delay)
+            time.sleep(delay)
+            delay = min(delay * 2, self.RETRY_MAX)
+
+    def _watch_pulse(self, pulse_module):
+        def on_event(event):
+            if event.t == "change":
+                if event.facility == "server":
+                    # The default sink may have changed
+                    invalidate_default_sink()
+                # Leave event_listen() so the loop below can refresh
+                raise pulse_module.PulseLoopStop
+
+        # event_listen() owns its connection, so it gets one of its own
+        with pulse_module.Pulse("volume-osd-events") as events:
+            events.event_mask_set("sink", "server")
+            events.event_callback_set(on_event)
+            # Changes made while not listening were missed
+            invalidate_default_sink()
+            self.refresh()
+            while True:
+                events.event_listen()
+                self.refresh()
+
+    def _watch_pactl(self):
+        try:
+            proc = subprocess.Popen(
+                ["pactl", "subscribe"],
+                stdout=subprocess.PIPE,
+                text=True
+            )
+        except OSError as e:
+            log.error("Could not start pactl subscribe: %s", e)
+            return
+        try:
+            # Changes made while not subscribed were missed
+            invalidate_default_sink()
+            self.refresh()
+            # Lines look like: Event 'change' on sink #47
+            for line in proc.stdout:
+                if line.startswith("Event 'change' on server"):
+                    # The default sink may have changed
+                    invalidate_default_sink()
+                    self.refresh()
+                elif line.startswith("Event 'change' on sink"):
+                    self.refresh()
+        finally:
+            proc.kill()
+            proc.wait()
+
+_pulse_state = None
+
+def pulse_state() -> PulseState:
+    """
+    The process-wide PulseState, started on first use.
+    """
+    global _pulse_state
+    if _pulse_state is None:
+        _pulse_state = PulseState()
+    return _pulse_state
+
+def get_system_volume() -> int:
+    """
+    The default sink's volume (0..100), from the cache.
+    """
+    return pulse_state().volume
 
-def set_system_volume(volume: int):
+def set_system_volume(volume: int) -> int:
     """
-    Set the default PulseAudio sink to the given volume percentage (0..100).
+    Set the default PulseAudio sink to the given volume percentage, clamped
+    to 0..100. Returns the volume that was set.
     """
-    volume = max(0, min(100, volume))
-    subprocess.run(
-        ["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{volume}%"],
-        check=False
-    )
+    volume = 0 if volume < 0 else 100 if volume > 100 else volume
+    if pulse_call(_pulse_set_volume, volume) is PULSE_UNAVAILABLE:
+        # pacmd takes raw volume, 65536 (PA_VOLUME_NORM) being 100%
+        if not pacmd_command(f"set-sink-volume {pactl_default_sink()} {volume * 65536 // 100}"):
+            subprocess.run(
+                ["pactl", "set-sink-volume", pactl_default_sink(), f"{volume}%"],
+                check=False
+            )
+    pulse_state().update(volume=volume)
+    return volume
 
 def change_system_volume(delta: int) -> int:
     """
     Add 'delta' (positive or negative) to the current volume.
     Returns the new volume (0..100).
     """
-    current = get_system_volume()
-    new_vol = max(0, min(100, current + delta))
-    set_system_volume(new_vol)
-    return new_vol
+    return set_system_volume(get_system_volume() + delta)
 
 def toggle_system_mute():
     """
     Toggle mute on the default PulseAudio sink.
     """
-    subprocess.run(
-        ["pactl", "set-sink-mute", "@DEFAULT_SINK@", "toggle"],
-        check=False
-    )
+    state = pulse_state()
+    muted = pulse_call(_pulse_toggle_mute)
+    if muted is PULSE_UNAVAILABLE:
+        muted = not state.muted
+        if not pacmd_command(f"set-sink-mute {pactl_default_sink()} {int(muted)}"):
+            subprocess.run(
+                ["pactl", "set-sink-mute", pactl_default_sink(), "toggle"],
+                check=False
+            )
+    state.update(muted=muted)
 
 def is_system_muted() -> bool:
     """
-    Check if the default sink is muted.
+    Check if the default sink is muted, from the cache.
     """
-    try:
-        output = subprocess.check_output(
-            ["pactl", "get-sink-mute", "@DEFAULT_SINK@"],
-            text=True
-        )
-        return "yes" in output.lower()
-    except subprocess.CalledProcessError:
-        return False
+    return pulse_state().muted
 
 # -------------------------- #
 #      VOLUME OSD CLASSES    #
@@ -149,11 +499,21 @@ class VolumeOSD(QWidget):
 
         self.init_ui()
 
-        # Timer to auto-hide the OSD after 2 seconds of inactivity
+        # Auto-hide the OSD 2 seconds after the last change. Key presses only
+        # push the deadline out; the running timer re-arms itself for the
+        # remainder instead of being restarted on every event.
+        self.hide_deadline = 0.0
         self.hide_timer = QTimer(self)
         self.hide_timer.setSingleShot(True)
-        self.hide_timer.setInterval(2000)
-        self.hide_timer.timeout.connect(self.hide)
+        self.hide_timer.timeout.connect(self.hide_if_expired)
+
+        # Volume changes are written out 30 ms after the last key of a burst
+        # (e.g. auto-repeat), as one set_system_volume() call
+        self.pending_delta = 0
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(30)
+        self.flush_timer.timeout.connect(self.flush_volume)
 
         # Show the current volume on startup
         self.update_osd_from_system()
@@ -174,16 +534,46 @@ class VolumeOSD(QWidget):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setTextVisible(False)
+        self.progress_bar.setStyleSheet(PROGRESS_BAR_STYLESHEET)
 
         layout.addWidget(self.label)
         layout.addWidget(self.progress_bar)
         self.setLayout(layout)
 
-    def center_on_screen(self):
-        screen_geometry = QDesktopWidget().availableGeometry()
+        # Screen center only changes with the screen, not per key press
+        self.primary_screen = None
+        self.center_pos = QPoint(0, 0)
+        self.watch_primary_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(self.watch_primary_screen)
+
+    def watch_primary_screen(self, screen):
+        """
+        Follow available-geometry changes of the (new) primary screen.
+        """
+        if self.primary_screen is not None:
+            try:
+                self.primary_screen.availableGeometryChanged.disconnect(self.update_center_pos)
+            except (TypeError, RuntimeError):
+                pass  # old screen already gone
+        self.primary_screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self.update_center_pos)
+            self.update_center_pos()
+
+    def update_center_pos(self, *_):
+        screen_geometry = self.primary_screen.availableGeometry()
         x = (screen_geometry.width() - self.width()) // 2
         y = (screen_geometry.height() - self.height()) // 2
-        self.move(x, y)
+        self.center_pos = QPoint(x, y)
+        if self.isVisible():
+            self.move(self.center_pos)
+
+    def hide_if_expired(self):
+        remaining = self.hide_deadline - time.monotonic()
+        if remaining > 0:
+            self.hide_timer.start(int(remaining * 1000) + 1)
+        else:
+            self.hide()
 
     def update_osd_from_system(self):
         """
@@ -197,28 +587,31 @@ class VolumeOSD(QWidget):
             self.label.setText(f"Volume: {vol}%")
             self.progress_bar.setValue(vol)
 
-        # Show the OSD, center it, and start auto-hide
-        self.show()
-        self.raise_()
-        self.activateWindow()
-        self.center_on_screen()
-        self.hide_timer.start()
-
-    def increase_volume(self):
-        new_vol = change_system_volume(self.step)
-        self.label.setText(f"Volume: {new_vol}%")
-        self.progress_bar.setValue(new_vol)
-        print("Increase volume triggered")  # debug
         self.show_osd_again()
 
-    def decrease_volume(self):
-        new_vol = change_system_volume(-self.step)
+    def change_volume(self, steps: int):
+        """
+        Move the volume by `steps` increments of self.step. The OSD updates
+        right away; the system volume when flush_timer fires.
+        """
+        self.pending_delta += steps * self.step
+        new_vol = get_system_volume() + self.pending_delta
+        new_vol = 0 if new_vol < 0 else 100 if new_vol > 100 else new_vol
+        self.flush_timer.start()
         self.label.setText(f"Volume: {new_vol}%")
         self.progress_bar.setValue(new_vol)
-        print("Decrease volume triggered")  # debug
+        log.debug("Change volume triggered (%+d steps)", steps)
         self.show_osd_again()
 
+    def flush_volume(self):
+        self.flush_timer.stop()
+        if self.pending_delta:
+            change_system_volume(self.pending_delta)
+            self.pending_delta = 0
+
     def toggle_mute(self):
+        # Apply a pending volume change first so the label below is current
+        self.flush_volume()
         toggle_system_mute()
         if is_system_muted():
             self.label.setText("Muted")
@@ -227,43 +620,37 @@ class VolumeOSD(QWidget):
             vol = get_system_volume()
             self.label.setText(f"Volume: {vol}%")
             self.progress_bar.setValue(vol)
-        print("Toggle mute triggered")  # debug
+        log.debug("Toggle mute triggered")
         self.show_osd_again()
 
     def show_osd_again(self):
-        self.show()
-        self.raise_()
-        self.activateWindow()
-        self.center_on_screen()
-        self.hide_timer.start()
-
-class VolumeSignals(QObject):
-    """
-    Qt signals to communicate volume changes from the background thread to the OSD widget.
-    """
-    increase = pyqtSignal()
-    decrease = pyqtSignal()
-    mute = pyqtSignal()
+        """
+        Make sure the OSD is up and push the auto-hide deadline out.
+        Window-manager calls are only made when it was hidden.
+        """
+        self.hide_deadline = time.monotonic() + 2.0
+        if self.isHidden():
+            self.move(self.center_pos)
+            self.show()
+            self.raise_()
+            self.activateWindow()
+        if not self.hide_timer.isActive():
+            self.hide_timer.start(2000)
 
 # -------------------------- #
-#     EVDEV READING THREAD   #
+#        EVDEV READER        #
 # -------------------------- #
 
-def read_keyboard_events(signals: VolumeSignals, dev_path: str):
+class KeyboardReader:
     """
-    Reads raw keyboard events from evdev and emits signals for:
+    Reads raw input_events from the evdev node inside the Qt event loop
+    (a QSocketNotifier on the non-blocking fd, no thread) and calls the
+    OSD for:
       - Alt+Up, Alt+Down, Alt+M
       - KEY_VOLUMEUP, KEY_VOLUMEDOWN, KEY_MUTE
+    All presses queued on the fd are coalesced into at most one volume
+    change and one mute toggle per wakeup.
     """
-    try:
-        dev = InputDevice(dev_path)
-        print(f"[INFO] Listening on {dev_path} for keyboard events.")
-    except Exception as e:
-        print(f"[ERROR] Could not open {dev_path}: {e}")
-        return
-
-    MIN_INTERVAL = 0.1  # filter out repeated keydown events too quickly
-    last_event_times = {}
 
     # Evdev code constants
     KEY_UP = ecodes.KEY_UP
@@ -276,50 +663,121 @@ def read_keyboard_events(signals: VolumeSignals, dev_path: str):
 
     KEY_LEFTALT = ecodes.KEY_LEFTALT
     KEY_RIGHTALT = ecodes.KEY_RIGHTALT
-    alt_pressed = False
 
-    for event in dev.read_loop():
-        if event.type != ecodes.EV_KEY:
-            continue
+    # EV_KEY event values (auto-repeat is 2 and ignored)
+    EV_KEY = ecodes.EV_KEY
+    KEY_RELEASED = 0
+    KEY_PRESSED = 1
+
+    # Keys handle_event() reacts to; everything else is dropped up front
+    HANDLED_KEYS = frozenset((
+        KEY_UP, KEY_DOWN, KEY_M,
+        KEY_VOLUMEUP, KEY_VOLUMEDOWN, KEY_MUTE,
+        KEY_LEFTALT, KEY_RIGHTALT,
+    ))
+
+    # struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+    INPUT_EVENT = struct.Struct("llHHi")
+    READ_EVENTS = 64  # events fetched per read syscall
+
+    def __init__(self, osd: "VolumeOSD", dev_path: str):
+        self.osd = osd
+        self.fd = None
+        self.notifier = None
+        self.buffer = bytearray(self.INPUT_EVENT.size * self.READ_EVENTS)
+        self.alt_pressed = False
+        # Accumulated while draining the fd, applied by read_events()
+        self.volume_steps = 0
+        self.mute_toggle = False
+        try:
+            # Non-blocking, so read_events() can drain the fd and stop
+            self.fd = os.open(dev_path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+            log.info("Listening on %s for keyboard events.", dev_path)
+        except OSError as e:
+            log.error("Could not open %s: %s", dev_path, e)
+            return
+        self.notifier = QSocketNotifier(self.fd, QSocketNotifier.Read, osd)
+        self.notifier.activated.connect(self.read_events)
+
+    def read_events(self):
+        """
+        Handle every event that is pending on the device, then apply the
+        batched volume/mute change once.
+        """
+        self.volume_steps = 0
+        self.mute_toggle = False
+        unpack_from = self.INPUT_EVENT.unpack_from
+        event_size = self.INPUT_EVENT.size
+        try:
+            while True:
+                # The kernel only ever returns whole events
+                n = os.readv(self.fd, [self.buffer])
+                for offset in range(0, n, event_size):
+                    _, _, event_type, code, value = unpack_from(self.buffer, offset)
+                    self.handle_event(event_type, code, value)
+                if n < len(self.buffer):
+                    break
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            # Device went away (e.g. unplugged)
+            log.error("Reading keyboard events failed: %s", e)
+            self.close()
+
+        if self.volume_steps:
+            self.osd.change_volume(self.volume_steps)
+        if self.mute_toggle:
+            self.osd.toggle_mute()
+
+    def close(self):
+        """
+        Stop watching and release the device fd.
+        """
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
 
-        key_event = categorize(event)
-        current_time = time.monotonic()
-        last_time = last_event_times.get(key_event.scancode, 0)
-        if (current_time - last_time) < MIN_INTERVAL:
-            # Skip if too soon after last event for this key
-            continue
-        last_event_times[key_event.scancode] = current_time
+    def handle_event(self, event_type: int, code: int, value: int):
+        if event_type != self.EV_KEY:
+            return
 
         # Debug: show which key codes are detected
-        keycodes = key_event.keycode
-        if isinstance(keycodes, str):
-            keycodes = [keycodes]
-        print(f"Detected keys: {', '.join(keycodes)} (scancode: {key_event.scancode}) state: {key_event.keystate}")
+        if log.isEnabledFor(logging.DEBUG):
+            keycodes = ecodes.KEY.get(code, str(code))
+            if isinstance(keycodes, str):
+                keycodes = [keycodes]
+            log.debug("Detected keys: %s (scancode: %s) state: %s",
+                      ", ".join(keycodes), code, value)
+
+        if code not in self.HANDLED_KEYS:
+            return
 
-        if key_event.keystate == key_event.key_down:
-            if key_event.scancode in (KEY_LEFTALT, KEY_RIGHTALT):
-                alt_pressed = True
+        if value == self.KEY_PRESSED:
+            if code == self.KEY_LEFTALT or code == self.KEY_RIGHTALT:
+                self.alt_pressed = True
 
             # Alt-based shortcuts
-            if alt_pressed:
-                if key_event.scancode == KEY_UP:
-                    signals.increase.emit()
-                elif key_event.scancode == KEY_DOWN:
-                    signals.decrease.emit()
-                elif key_event.scancode == KEY_M:
-                    signals.mute.emit()
+            elif self.alt_pressed and code == self.KEY_UP:
+                self.volume_steps += 1
+            elif self.alt_pressed and code == self.KEY_DOWN:
+                self.volume_steps -= 1
+            elif self.alt_pressed and code == self.KEY_M:
+                self.mute_toggle = not self.mute_toggle
 
             # Dedicated media keys
-            if key_event.scancode == KEY_VOLUMEUP:
-                signals.increase.emit()
-            elif key_event.scancode == KEY_VOLUMEDOWN:
-                signals.decrease.emit()
-            elif key_event.scancode == KEY_MUTE:
-                signals.mute.emit()
+            elif code == self.KEY_VOLUMEUP:
+                self.volume_steps += 1
+            elif code == self.KEY_VOLUMEDOWN:
+                self.volume_steps -= 1
+            elif code == self.KEY_MUTE:
+                self.mute_toggle = not self.mute_toggle
 
-        elif key_event.keystate == key_event.key_up:
-            if key_event.scancode in (KEY_LEFTALT, KEY_RIGHTALT):
-                alt_pressed = False
+        elif value == self.KEY_RELEASED:
+            if code == self.KEY_LEFTALT or code == self.KEY_RIGHTALT:
+                self.alt_pressed = False
 
 # -------------------------- #
 #   SYSTEMD SERVICE INSTALL  #
@@ -329,6 +787,7 @@ def install_systemd_service():
     """
     Writes a systemd user service to ~/.config/systemd/user/volume-osd.service,
     enabling auto-start at login and auto-restart on failure.
+    Running it again is a no-op while the unit is unchanged and active.
     """
     service_dir = os.path.expanduser("~/.config/systemd/user")
     if not os.path.exists(service_dir):
@@ -354,16 +813,30 @@ Environment=XDG_RUNTIME_DIR=/run/user/{uid}
 WantedBy=default.target
 """
 
-    with open(service_path, "w") as f:
-        f.write(service_file_content)
-
-    print(f"Systemd service file written to {service_path}")
+    new_content = service_file_content.encode()
+    try:
+        with open(service_path, "rb") as f:
+            unchanged = f.read() == new_content
+    except FileNotFoundError:
+        unchanged = False
+
+    if unchanged:
+        active = subprocess.run(
+            ["systemctl", "--user", "is-active", "--quiet", "volume-osd.service"]
+        ).returncode == 0
+        if active:
+            log.info("Systemd service at %s is up to date and running.", service_path)
+            return
+    else:
+        with open(service_path, "wb") as f:
+            f.write(new_content)
+        log.info("Systemd service file written to %s", service_path)
+        # Only a changed unit file needs the user daemon to reload
+        subprocess.run(["systemctl", "--user", "daemon-reload"])
 
-    # Reload systemd user daemon, enable and start the service
-    subprocess.run(["systemctl", "--user", "daemon-reload"])
-    subprocess.run(["systemctl", "--user", "enable", "volume-osd.service"])
-    subprocess.run(["systemctl", "--user", "start", "volume-osd.service"])
-    print("Systemd service installed and started.")
+    # Enable and start the service in one go
+    subprocess.run(["systemctl", "--user", "enable", "--now", "volume-osd.service"])
+    log.info("Systemd service installed and started.")
 
 # -------------------------- #
 #           MAIN APP         #
@@ -385,24 +858,13 @@ def main():
     cyber_palette.setColor(QPalette.Highlight, QColor("#00ffff"))
     cyber_palette.setColor(QPalette.HighlightedText, QColor("#121212"))
     app.setPalette(cyber_palette)
-    app.setStyleSheet(CYBERPUNK_GLOBAL_STYLESHEET)
 
     # Create the OSD widget
     osd = VolumeOSD(step=VOLUME_STEP)
 
-    # Create signals
-    signals = VolumeSignals()
-    signals.increase.connect(osd.increase_volume)
-    signals.decrease.connect(osd.decrease_volume)
-    signals.mute.connect(osd.toggle_mute)
-
-    # Start the evdev event reader thread
-    t = threading.Thread(
-        target=read_keyboard_events,
-        args=(signals, KEYBOARD_DEVICE),
-        daemon=True
-    )
-    t.start()
+    # Watch the keyboard from the Qt event loop
+    reader = KeyboardReader(osd, KEYBOARD_DEVICE)
+    app.aboutToQuit.connect(reader.close)
 
     # Run the Qt event loop
     sys.exit(app.exec_())
@@ -412,6 +874,8 @@ def main():
 # -------------------------- #
 
 if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL, format="[%(levelname)s] %(message)s")
+
     # If called with --install-service, install the user service and exit
     if "--install-service" in sys.argv:
         install_systemd_service()